@@ -0,0 +1,50 @@
+"""Benchmarks of sending many small API calls one by one and in a batch.
+
+Run with pytest-benchmark installed:
+
+    pytest benchmarks/api_batch_benchmark_test.py
+
+SYFT_BENCHMARK_API_CALLS sets the number of calls (1k by default), divide the
+timings by it for the latency per call.
+"""
+
+# stdlib
+from collections.abc import Iterator
+import os
+from secrets import token_hex
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.client.client import SyftClient
+from syft.server.worker import Worker
+
+pytest.importorskip("pytest_benchmark")
+
+CALLS = int(os.getenv("SYFT_BENCHMARK_API_CALLS", 1_000))
+
+
+@pytest.fixture(scope="module")
+def worker() -> Iterator[Worker]:
+    worker = sy.Worker.named(name=token_hex(16), db_url="sqlite://")
+    yield worker
+    worker.cleanup()
+
+
+def send_calls(client: SyftClient) -> None:
+    for _ in range(CALLS):
+        client.api.services.user.get_current_user()
+
+
+def send_batch(client: SyftClient) -> None:
+    with client.api.batch():
+        send_calls(client)
+
+
+@pytest.mark.parametrize("send", [send_calls, send_batch])
+def test_api_calls(benchmark, worker: Worker, send) -> None:
+    client = worker.root_client
+    benchmark.extra_info["calls"] = CALLS
+    benchmark.pedantic(send, args=(client,), rounds=3)
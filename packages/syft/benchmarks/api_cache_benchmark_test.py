@@ -0,0 +1,54 @@
+"""Benchmarks of answering `/api`, building and serializing the API of the user
+for every request and looking it up in the server's API cache.
+
+Run with pytest-benchmark installed:
+
+    pytest benchmarks/api_cache_benchmark_test.py
+"""
+
+# stdlib
+from collections.abc import Iterator
+from secrets import token_hex
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPI
+from syft.serde.serialize import _serialize
+from syft.server.worker import Worker
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def worker() -> Iterator[Worker]:
+    worker = sy.Worker.named(name=token_hex(16), db_url="sqlite://")
+    yield worker
+    worker.cleanup()
+
+
+def test_build_api(benchmark, worker: Worker) -> None:
+    client = worker.root_client
+
+    def build() -> bytes:
+        api = SyftAPI.for_user(
+            server=worker,
+            user_verify_key=client.credentials.verify_key,
+            communication_protocol=client.api.communication_protocol,
+        )
+        return _serialize(api, to_bytes=True)
+
+    benchmark(build)
+
+
+def test_cached_api(benchmark, worker: Worker) -> None:
+    client = worker.root_client
+
+    def lookup() -> bytes:
+        return worker.api_cache.get(
+            worker, client.credentials.verify_key, client.api.communication_protocol
+        ).payload
+
+    benchmark(lookup)
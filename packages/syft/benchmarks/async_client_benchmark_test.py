@@ -0,0 +1,69 @@
+"""Benchmarks of fanning out API calls over many in-memory servers, from a pool of
+threads with the blocking clients and from one event loop with the async ones.
+
+Run with pytest-benchmark installed:
+
+    pytest benchmarks/async_client_benchmark_test.py
+
+SYFT_BENCHMARK_SERVERS sets the number of servers (50 by default) and
+SYFT_BENCHMARK_SERVER_CALLS the calls made to each of them (10 by default).
+"""
+
+# stdlib
+import asyncio
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+import os
+from secrets import token_hex
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.client.async_client import AsyncSyftClient
+from syft.client.client import SyftClient
+
+pytest.importorskip("pytest_benchmark")
+
+SERVERS = int(os.getenv("SYFT_BENCHMARK_SERVERS", 50))
+CALLS = int(os.getenv("SYFT_BENCHMARK_SERVER_CALLS", 10))
+
+
+@pytest.fixture(scope="module")
+def clients() -> Iterator[list[SyftClient]]:
+    # file backed, in-memory sqlite is not shared between threads
+    workers = [sy.Worker.named(name=token_hex(16), reset=True) for _ in range(SERVERS)]
+    yield [worker.root_client for worker in workers]
+    for worker in workers:
+        worker.cleanup()
+
+
+def call_server(client: SyftClient) -> None:
+    for _ in range(CALLS):
+        client.api.services.user.get_current_user()
+
+
+def threaded_calls(clients: list[SyftClient]) -> None:
+    with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+        list(executor.map(call_server, clients))
+
+
+async def call_server_async(client: AsyncSyftClient) -> None:
+    for _ in range(CALLS):
+        await client.services.user.get_current_user()
+
+
+def async_calls(clients: list[SyftClient]) -> None:
+    async def gather() -> None:
+        aclients = [client.as_async() for client in clients]
+        await asyncio.gather(*(call_server_async(client) for client in aclients))
+
+    asyncio.run(gather())
+
+
+@pytest.mark.parametrize("send", [threaded_calls, async_calls])
+def test_fan_out(benchmark, clients: list[SyftClient], send) -> None:
+    benchmark.extra_info["servers"] = SERVERS
+    benchmark.extra_info["calls"] = SERVERS * CALLS
+    benchmark.pedantic(send, args=(clients,), rounds=3)
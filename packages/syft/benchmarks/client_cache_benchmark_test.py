@@ -0,0 +1,96 @@
+"""Benchmarks of a new client fetching the API of a server over HTTP, downloading
+it and revalidating the one cached on disk. Deserializing the API costs the same
+either way and is left out.
+
+Run with pytest-benchmark installed:
+
+    pytest benchmarks/client_cache_benchmark_test.py
+"""
+
+# stdlib
+from collections.abc import Iterator
+from pathlib import Path
+from secrets import token_hex
+import socket
+import threading
+import time
+
+# third party
+from fastapi import FastAPI
+import pytest
+import uvicorn
+
+# syft absolute
+import syft as sy
+from syft.client import disk_cache
+from syft.client.client import HTTPConnection
+from syft.server.routes import make_routes
+from syft.server.worker import Worker
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def worker() -> Iterator[Worker]:
+    # routes run in threads, which don't share an in-memory sqlite
+    worker = sy.Worker.named(name=token_hex(16), reset=True)
+    yield worker
+    worker.cleanup()
+
+
+@pytest.fixture(scope="module")
+def url(worker: Worker) -> Iterator[str]:
+    app = FastAPI()
+    app.include_router(make_routes(worker), prefix="/api/v2")
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(uvicorn.Config(app, log_level="error"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]})
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{sock.getsockname()[1]}"
+    server.should_exit = True
+    thread.join()
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_fetch_api(
+    benchmark, monkeypatch, tmp_path: Path, worker: Worker, url: str, cache: bool
+) -> None:
+    monkeypatch.setattr(disk_cache, "CLIENT_CACHE", cache)
+    monkeypatch.setattr(disk_cache, "CLIENT_CACHE_DIR", tmp_path)
+    credentials = worker.root_client.credentials
+    protocol = worker.root_client.api.communication_protocol
+
+    downloaded = []
+    fetches = []
+
+    def fetch() -> bytes:
+        fetches.append(1)
+        connection = HTTPConnection(url=url)
+        connection.session.hooks["response"].append(
+            lambda response, *args, **kwargs: downloaded.append(len(response.content))
+        )
+        metadata = connection.get_server_metadata(credentials)
+        return connection._make_cached_get(
+            connection.routes.ROUTE_API.value,
+            cache_key=(
+                "api",
+                str(metadata.id),
+                str(protocol),
+                str(credentials.verify_key),
+            ),
+            params={
+                "verify_key": str(credentials.verify_key),
+                "communication_protocol": protocol,
+            },
+        )
+
+    # the server and, with the cache on, the client have seen the API before
+    fetch()
+    downloaded.clear()
+    fetches.clear()
+    benchmark(fetch)
+    # metadata and API bodies received per fetch
+    benchmark.extra_info["bytes_downloaded"] = sum(downloaded) // len(fetches)
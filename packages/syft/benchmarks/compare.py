@@ -0,0 +1,87 @@
+"""Compare a benchmark run against a stored baseline, offline.
+
+Both files are written by pytest-benchmark with `--benchmark-json`:
+
+    pytest benchmarks --benchmark-json=current.json
+    python benchmarks/compare.py baseline.json current.json
+
+A benchmark regresses when its median time, the bytes it allocated or the size of
+its output grow by more than the allowed ratio. The exit code is 1 if any
+benchmark regressed.
+"""
+
+# stdlib
+import argparse
+import json
+from pathlib import Path
+import sys
+
+
+def load_run(path: Path) -> dict[str, dict[str, float | None]]:
+    run = json.loads(path.read_text())
+    return {
+        bench["fullname"]: {
+            "time": bench["stats"]["median"],
+            "allocated_bytes": bench["extra_info"].get("allocated_bytes"),
+            "output_bytes": bench["extra_info"].get("output_bytes"),
+        }
+        for bench in run["benchmarks"]
+    }
+
+
+def compare(
+    baseline: dict[str, dict[str, float | None]],
+    current: dict[str, dict[str, float | None]],
+    thresholds: dict[str, float],
+) -> list[str]:
+    regressions = []
+    for name, metrics in sorted(current.items()):
+        if name not in baseline:
+            print(f"new       {name}")
+            continue
+        for metric, threshold in thresholds.items():
+            before, after = baseline[name][metric], metrics[metric]
+            if not before or after is None:
+                continue
+            change = after / before - 1
+            if change > threshold:
+                regressions.append(
+                    f"{name} {metric}: {before:.6g} -> {after:.6g} ({change:+.1%})"
+                )
+    for name in sorted(baseline.keys() - current.keys()):
+        print(f"missing   {name}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument(
+        "--time", type=float, default=0.2, help="allowed median time increase"
+    )
+    parser.add_argument(
+        "--allocated", type=float, default=0.1, help="allowed allocation increase"
+    )
+    parser.add_argument(
+        "--output", type=float, default=0.01, help="allowed output size increase"
+    )
+    args = parser.parse_args()
+
+    regressions = compare(
+        load_run(args.baseline),
+        load_run(args.current),
+        {
+            "time": args.time,
+            "allocated_bytes": args.allocated,
+            "output_bytes": args.output,
+        },
+    )
+    for regression in regressions:
+        print(f"regressed {regression}")
+    print(f"{len(regressions)} regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Shared fixtures for the serde benchmarks.
+
+Every benchmark records, next to the timings of pytest-benchmark, the peak
+bytes allocated by one call (`allocated_bytes`, traced with tracemalloc) and the
+size of the serialized payload (`output_bytes`). Save a run as the baseline and
+compare later runs against it with `benchmarks/compare.py`, see
+`tox -e syft.test.benchmark`.
+"""
+
+# stdlib
+from collections.abc import Callable
+import tracemalloc
+from typing import Any
+
+# third party
+import pytest
+
+# payloads of this size and above are timed for a few rounds instead of letting
+# pytest-benchmark calibrate the number of rounds
+SLOW_CALL_BYTES = 2**20
+
+
+def traced_call(fn: Callable, *args: Any) -> tuple[Any, int]:
+    """Call `fn` and return its result and the peak bytes it allocated."""
+    tracemalloc.start()
+    try:
+        result = fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+@pytest.fixture
+def serde_benchmark(benchmark) -> Callable:
+    """Benchmark a serde call and record its allocated and output bytes.
+
+    `output_bytes` defaults to the length of the result, pass it when the result
+    is not the serialized payload.
+    """
+
+    def run(
+        fn: Callable,
+        *args: Any,
+        output_bytes: int | None = None,
+        payload_bytes: int = 0,
+    ) -> Any:
+        result, allocated = traced_call(fn, *args)
+        if output_bytes is None and isinstance(result, bytes | bytearray | str):
+            output_bytes = len(result)
+        benchmark.extra_info["allocated_bytes"] = allocated
+        benchmark.extra_info["output_bytes"] = output_bytes
+        if payload_bytes >= SLOW_CALL_BYTES:
+            return benchmark.pedantic(fn, args=args, rounds=3)
+        return benchmark(fn, *args)
+
+    return run
@@ -0,0 +1,116 @@
+"""Benchmarks of bulk writes and reads of the JSON columns of a stash table.
+
+Run with pytest-benchmark installed:
+
+    pytest benchmarks/db_json_benchmark_test.py
+
+Every row holds the `fields` of a user, SYFT_BENCHMARK_DB_ROWS sets the number of
+rows (100k by default). The stdlib json codec is benchmarked as a reference.
+"""
+
+# stdlib
+from collections.abc import Iterator
+import json
+import os
+from pathlib import Path
+import uuid
+
+# third party
+import pytest
+import sqlalchemy as sa
+
+# syft absolute
+from syft.serde.json_serde import serialize_json
+from syft.server.credentials import SyftSigningKey
+from syft.service.user.user import User
+from syft.service.user.user_roles import ServiceRole
+from syft.store.db.db import json_dumps
+from syft.store.db.db import json_loads
+from syft.store.db.schema import create_table
+from syft.store.db.sqlite import SQLiteDBConfig
+from syft.store.db.sqlite import SQLiteDBManager
+from syft.types.uid import UID
+
+pytest.importorskip("pytest_benchmark")
+
+ROWS = int(os.getenv("SYFT_BENCHMARK_DB_ROWS", 100_000))
+
+CODECS = {
+    "json": (json.dumps, json.loads),
+    "default": (json_dumps, json_loads),
+}
+
+
+def make_rows() -> list[dict]:
+    signing_key = SyftSigningKey.generate()
+    user = User(
+        email="alice@openmined.org",
+        name="Alice",
+        signing_key=signing_key,
+        verify_key=signing_key.verify_key,
+        role=ServiceRole.DATA_SCIENTIST,
+        hashed_password="hashed_password",
+        salt="salt",
+    )
+    fields = serialize_json(user)
+    permissions = [f"{user.verify_key}_READ"]
+    return [
+        {
+            "id": UID(uuid.uuid4()),
+            "fields": fields,
+            "permissions": permissions,
+            "storage_permissions": [],
+        }
+        for _ in range(ROWS)
+    ]
+
+
+@pytest.fixture(scope="module")
+def rows() -> list[dict]:
+    return make_rows()
+
+
+@pytest.fixture(params=CODECS)
+def table(request, tmp_path: Path) -> Iterator[tuple[sa.Engine, sa.Table]]:
+    json_serializer, json_deserializer = CODECS[request.param]
+    db = SQLiteDBManager(
+        config=SQLiteDBConfig(path=tmp_path),
+        server_uid=UID(),
+        root_verify_key=SyftSigningKey.generate().verify_key,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
+    )
+    table = create_table(User, db.engine.dialect)
+    db.init_tables(reset=True)
+    yield db.engine, table
+    db.engine.dispose()
+
+
+def insert(engine: sa.Engine, table: sa.Table, rows: list[dict]) -> None:
+    with engine.begin() as connection:
+        connection.execute(table.insert(), rows)
+
+
+def select_all(engine: sa.Engine, table: sa.Table) -> list:
+    with engine.connect() as connection:
+        return connection.execute(table.select()).all()
+
+
+def test_bulk_insert(benchmark, table, rows: list[dict]) -> None:
+    engine, table = table
+
+    def clear() -> None:
+        with engine.begin() as connection:
+            connection.execute(table.delete())
+
+    benchmark.pedantic(insert, args=(engine, table, rows), setup=clear, rounds=3)
+
+
+def test_bulk_read(benchmark, table, rows: list[dict]) -> None:
+    engine, table = table
+    insert(engine, table, rows)
+
+    result = benchmark.pedantic(select_all, args=(engine, table), rounds=3)
+
+    assert len(result) == ROWS
+    assert result[0].fields == rows[0]["fields"]
@@ -0,0 +1,146 @@
+"""Benchmarks of API calls to a datasite through a gateway fronting 100 peers,
+forwarded by the gateway's client of the peer (`forward`) and relayed as the
+bytes the user sent (`relay`). For large results, the peak bytes allocated by
+the process (user, gateway and datasite) are recorded in `extra_info`.
+
+Both servers run in uvicorn rather than FastAPI's TestClient, which collects
+the whole response body before handing it to the client.
+
+Run with pytest-benchmark installed:
+
+    pytest benchmarks/gateway_relay_benchmark_test.py
+"""
+
+# stdlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from secrets import token_hex
+import socket
+import threading
+import time
+import tracemalloc
+
+# third party
+from fastapi import FastAPI
+import pytest
+import uvicorn
+
+# syft absolute
+import syft as sy
+from syft.abstract_server import ServerType
+from syft.client.api import SyftAPIData
+from syft.client.client import HTTPConnection
+from syft.client.datasite_client import DatasiteClient
+from syft.server.credentials import SyftSigningKey
+from syft.server.gateway import Gateway
+from syft.server.routes import make_routes
+from syft.server.server import Server
+from syft.server.worker import Worker
+from syft.service.network.routes import HTTPServerRoute
+from syft.service.network.server_peer import ServerPeer
+from syft.types.uid import UID
+
+pytest.importorskip("pytest_benchmark")
+
+PEERS = 100
+RESULT_SIZE = 64 * 1024 * 1024
+
+
+@contextmanager
+def serve_over_http(server: Server) -> Iterator[int]:
+    app = FastAPI()
+    app.include_router(make_routes(server), prefix="/api/v2")
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    http_server = uvicorn.Server(uvicorn.Config(app, log_level="error"))
+    thread = threading.Thread(target=http_server.run, kwargs={"sockets": [sock]})
+    thread.start()
+    while not http_server.started:
+        time.sleep(0.01)
+    yield sock.getsockname()[1]
+    http_server.should_exit = True
+    thread.join()
+
+
+@pytest.fixture(scope="module")
+def datasite() -> Iterator[Worker]:
+    datasite = sy.Worker.named(name=token_hex(16), reset=True)
+    yield datasite
+    datasite.cleanup()
+
+
+@pytest.fixture(scope="module")
+def gateway(datasite: Worker) -> Iterator[Gateway]:
+    gateway = sy.Gateway.named(name=token_hex(16), reset=True)
+    with serve_over_http(datasite) as port:
+        routes = [HTTPServerRoute(host_or_ip="127.0.0.1", port=port)]
+        for i in range(PEERS):
+            # the other peers are never reached
+            peer_uid, verify_key = (
+                (datasite.id, datasite.verify_key)
+                if i == 0
+                else (UID(), SyftSigningKey.generate().verify_key)
+            )
+            peer = ServerPeer(
+                id=peer_uid,
+                name=f"datasite-{i}",
+                verify_key=verify_key,
+                server_type=ServerType.DATASITE,
+                admin_email="info@openmined.org",
+                server_routes=routes,
+            )
+            gateway.services.network.stash.set(gateway.verify_key, peer).unwrap()
+        yield gateway
+    gateway.cleanup()
+
+
+@pytest.fixture(scope="module")
+def client(datasite: Worker, gateway: Gateway) -> Iterator[DatasiteClient]:
+    with serve_over_http(gateway) as port:
+        connection = HTTPConnection(
+            url=f"http://127.0.0.1:{port}", proxy_target_uid=datasite.id
+        )
+        yield DatasiteClient(connection=connection, credentials=datasite.signing_key)
+
+
+@pytest.mark.parametrize("relay", [False, True])
+def test_small_call(
+    benchmark, monkeypatch, gateway: Gateway, client: DatasiteClient, relay: bool
+) -> None:
+    if not relay:
+        monkeypatch.setattr(gateway, "relay_api_call", lambda *args: None)
+
+    benchmark(client.api.services.user.get_current_user)
+
+
+@pytest.mark.parametrize("relay", [False, True])
+def test_large_result(
+    benchmark,
+    monkeypatch,
+    datasite: Worker,
+    gateway: Gateway,
+    client: DatasiteClient,
+    relay: bool,
+) -> None:
+    if not relay:
+        monkeypatch.setattr(gateway, "relay_api_call", lambda *args: None)
+    # the datasite answers every call with the large result
+    monkeypatch.setattr(
+        datasite,
+        "handle_api_call",
+        lambda api_call, **kwargs: SyftAPIData(data=b"\x01" * RESULT_SIZE).sign(
+            datasite.signing_key
+        ),
+    )
+
+    def get_result() -> None:
+        result = client.api.services.user.get_all()
+        assert len(result) == RESULT_SIZE
+
+    tracemalloc.start()
+    try:
+        benchmark.pedantic(get_result, rounds=3)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["allocated_per_result_size"] = round(peak / RESULT_SIZE, 2)
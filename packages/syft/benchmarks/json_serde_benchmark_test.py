@@ -0,0 +1,234 @@
+"""Micro-benchmarks for the JSON serde used by the DB `fields` column.
+
+Run with pytest-benchmark installed:
+
+    pytest benchmarks/json_serde_benchmark_test.py
+
+The stash benchmarks round-trip every row of every stash type of a worker that
+ran a small data science workflow, stash types without rows are skipped.
+"""
+
+# stdlib
+from collections.abc import Iterator
+import json
+from secrets import token_hex
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.json_serde import deserialize_json
+from syft.serde.json_serde import serialize_json
+from syft.server.credentials import SyftSigningKey
+from syft.server.worker import Worker
+from syft.service.action.action_object import Action
+from syft.service.data_subject.data_subject import DataSubject
+from syft.service.dataset.dataset import Asset
+from syft.service.dataset.dataset import Contributor
+from syft.service.dataset.dataset import Dataset
+from syft.service.job.job_stash import Job
+from syft.service.log.log import SyftLog
+from syft.service.queue.queue_stash import QueueItem
+from syft.service.user.user import User
+from syft.service.user.user_roles import ServiceRole
+from syft.service.worker.image_registry import SyftImageRegistry
+from syft.service.worker.worker_pool import WorkerPool
+from syft.service.worker.worker_pool_service import SyftWorkerPoolService
+from syft.store.db.stash import ObjectStash
+from syft.store.linked_obj import LinkedObject
+from syft.types.uid import LineageID
+from syft.types.uid import UID
+
+pytest.importorskip("pytest_benchmark")
+
+
+def make_job() -> Job:
+    action = Action(
+        path="action.execute",
+        op="__add__",
+        remote_self=None,
+        args=[LineageID(), LineageID()],
+        kwargs={"other": LineageID()},
+        user_code_id=UID(),
+    )
+    return Job(
+        id=UID(),
+        server_uid=UID(),
+        result={"values": list(range(100))},
+        action=action,
+        user_code_id=action.user_code_id,
+    )
+
+
+def make_user() -> User:
+    signing_key = SyftSigningKey.generate()
+    return User(
+        id=UID(),
+        email="alice@openmined.org",
+        name="Alice",
+        hashed_password="hashed",
+        salt="salt",
+        signing_key=signing_key,
+        verify_key=signing_key.verify_key,
+        role=ServiceRole.DATA_SCIENTIST,
+        institution="OpenMined",
+    )
+
+
+def make_dataset() -> Dataset:
+    uploader = Contributor(name="Alice", email="alice@openmined.org", role="Owner")
+    server_uid = UID()
+    assets = [
+        Asset(
+            id=UID(),
+            action_id=UID(),
+            server_uid=server_uid,
+            name=f"asset_{i}",
+            uploader=uploader,
+            contributors={uploader},
+            shape=(10, 10),
+        )
+        for i in range(5)
+    ]
+    return Dataset(
+        id=UID(),
+        name="dataset",
+        uploader=uploader,
+        contributors={uploader},
+        asset_list=assets,
+        citation="citation",
+        url="https://openmined.org",
+    )
+
+
+def make_queue_item() -> QueueItem:
+    worker_pool = WorkerPool(name="pool", image_id=UID(), max_count=0, worker_list=[])
+    return QueueItem(
+        id=UID(),
+        server_uid=UID(),
+        method="execute",
+        service="action",
+        args=[UID()],
+        kwargs={"uid": UID()},
+        worker_pool=LinkedObject.from_obj(
+            worker_pool, server_uid=UID(), service_type=SyftWorkerPoolService
+        ),
+    )
+
+
+OBJECTS = {
+    "job": make_job,
+    "user": make_user,
+    "dataset": make_dataset,
+    "queue_item": make_queue_item,
+}
+
+
+@pytest.mark.parametrize("name", OBJECTS)
+def test_serialize_json(benchmark, name: str) -> None:
+    obj = OBJECTS[name]()
+    benchmark(serialize_json, obj)
+
+
+@pytest.mark.parametrize("name", OBJECTS)
+def test_deserialize_json(benchmark, name: str) -> None:
+    fields = serialize_json(OBJECTS[name]())
+    result = benchmark(deserialize_json, fields)
+    assert serialize_json(result) == fields
+
+
+@pytest.mark.parametrize("name", OBJECTS)
+def test_roundtrip_json(benchmark, name: str) -> None:
+    obj = OBJECTS[name]()
+    benchmark(lambda: deserialize_json(serialize_json(obj)))
+
+
+def stash_classes(cls: type[ObjectStash] = ObjectStash) -> Iterator[type[ObjectStash]]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from stash_classes(subclass)
+
+
+STASH_TYPES = sorted(
+    stash.get_object_type().__canonical_name__ for stash in stash_classes()
+)
+
+
+@pytest.fixture(scope="module")
+def stash_objects() -> Iterator[dict[str, list]]:
+    worker = Worker.named(name=token_hex(8), db_url="sqlite://")
+    root_client = worker.root_client
+    dataset = sy.Dataset(
+        name="data",
+        asset_list=[
+            sy.Asset(name="small", data=np.arange(10), mock=np.zeros(10)),
+            # large enough to go to blob storage
+            sy.Asset(name="large", data=np.random.random(2**18), mock=np.zeros(2**18)),
+        ],
+    )
+    root_client.upload_dataset(dataset)
+    root_client.register(
+        name="ds", email="ds@openmined.org", password="pw", password_verify="pw"
+    )
+    ds_client = root_client.login(email="ds@openmined.org", password="pw")
+    asset = ds_client.datasets[0].assets[0]
+
+    @sy.syft_function_single_use(data=asset)
+    def total(data):
+        return data.sum()
+
+    ds_client.code.request_code_execution(total)
+    root_client.requests[0].approve()
+    ds_client.code.total(data=asset).get()
+
+    @sy.api_endpoint(path="bench.query")
+    def query(context, sql: str) -> str:
+        return sql
+
+    root_client.custom_api.add(endpoint=query)
+
+    stashes = {
+        stash.object_type.__canonical_name__: stash
+        for stash in [*worker.services.stashes.values(), worker.action_store]
+    }
+    for obj in [
+        make_job(),
+        make_queue_item(),
+        SyftLog(server_uid=worker.id, job_id=UID()),
+        DataSubject(server_uid=worker.id, name="subject"),
+        SyftImageRegistry.from_url("docker.io"),
+    ]:
+        stash = stashes[obj.__canonical_name__]
+        stash.set(worker.verify_key, obj).unwrap()
+
+    yield {name: stash._data for name, stash in stashes.items()}
+
+    worker.cleanup()
+
+
+@pytest.mark.parametrize("name", STASH_TYPES)
+def test_stash_serialize_json(serde_benchmark, stash_objects, name: str) -> None:
+    objs = stash_objects[name]
+    if not objs:
+        pytest.skip(f"no {name} rows")
+
+    def serialize_rows() -> str:
+        return json.dumps([serialize_json(obj) for obj in objs])
+
+    serde_benchmark(serialize_rows)
+
+
+@pytest.mark.parametrize("name", STASH_TYPES)
+def test_stash_deserialize_json(serde_benchmark, stash_objects, name: str) -> None:
+    objs = stash_objects[name]
+    if not objs:
+        pytest.skip(f"no {name} rows")
+    rows = [serialize_json(obj) for obj in objs]
+
+    def deserialize_rows() -> list:
+        return [deserialize_json(row, trusted=ObjectStash.trusted_load) for row in rows]
+
+    result = serde_benchmark(deserialize_rows, output_bytes=len(json.dumps(rows)))
+    assert len(result) == len(objs)
@@ -0,0 +1,28 @@
+"""Benchmarks of migrating objects between versions of their canonical name."""
+
+# third party
+import pytest
+
+# syft absolute
+from syft.service.settings.settings import ServerSettingsUpdate
+from syft.service.settings.settings import ServerSettingsUpdateV1
+from syft.types.syft_object import SyftMigrationRegistry
+from syft.types.uid import UID
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_get_migration(benchmark) -> None:
+    SyftMigrationRegistry.warm_migration_cache()
+    benchmark(
+        SyftMigrationRegistry.get_migration_for_version,
+        ServerSettingsUpdateV1,
+        ServerSettingsUpdate.__version__,
+    )
+
+
+@pytest.mark.parametrize("version", [1, ServerSettingsUpdate.__version__])
+def test_migrate_to_latest(benchmark, version: int) -> None:
+    update = ServerSettingsUpdateV1(id=UID(), name="name", organization="org")
+    update = update.migrate_to(version)
+    benchmark(update.migrate_to, ServerSettingsUpdate.__version__)
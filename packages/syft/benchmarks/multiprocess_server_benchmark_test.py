@@ -0,0 +1,75 @@
+"""Benchmarks of the throughput of a server launched with one and several HTTP
+worker processes over the same SQLite db. Concurrent clients post API calls that
+are built and signed beforehand, and the calls per second are recorded in
+`extra_info`.
+
+Run with pytest-benchmark installed:
+
+    pytest benchmarks/multiprocess_server_benchmark_test.py
+"""
+
+# stdlib
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from secrets import token_hex
+
+# third party
+import pytest
+import requests
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPICall
+from syft.client.client import HTTPConnection
+from syft.orchestra import ServerHandle
+
+pytest.importorskip("pytest_benchmark")
+
+CALLS = 400
+CLIENTS = 16
+
+
+@pytest.fixture(scope="module", params=[1, 4])
+def server(request: pytest.FixtureRequest) -> Iterator[ServerHandle]:
+    server = sy.orchestra.launch(
+        name=token_hex(8), port="auto", http_workers=request.param, reset=True
+    )
+    yield server
+    server.land()
+
+
+def test_throughput(benchmark, server: ServerHandle) -> None:
+    client = server.login(email="info@openmined.org", password="changethis")
+    connection = client.connection
+    assert isinstance(connection, HTTPConnection)
+
+    def requests_for_round() -> tuple[tuple[list], dict]:
+        # new calls each round, signatures of calls seen before are cached
+        calls = []
+        for _ in range(CALLS):
+            call = SyftAPICall(
+                server_uid=client.id,
+                path="user.get_current_user",
+                args=[],
+                kwargs={},
+            ).sign(client.credentials)
+            calls.append(
+                connection.prepare_api_call(
+                    connection.routes.ROUTE_API_CALL.value, call
+                )
+            )
+        return (calls,), {}
+
+    def post(call: tuple) -> None:
+        url, data, headers = call
+        response = requests.post(url, data=data, headers=headers, timeout=60)
+        assert response.status_code == 200
+
+    def post_all(calls: list) -> None:
+        with ThreadPoolExecutor(CLIENTS) as pool:
+            list(pool.map(post, calls))
+
+    benchmark.pedantic(post_all, setup=requests_for_round, rounds=5)
+    benchmark.extra_info["calls_per_second"] = round(
+        CALLS / benchmark.stats.stats.median
+    )
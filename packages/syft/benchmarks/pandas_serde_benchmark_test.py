@@ -0,0 +1,114 @@
+"""Round-trip time and peak memory of the pandas serde, parquet vs Arrow IPC.
+
+Run with pytest-benchmark installed, the frame size can be changed with
+SYFT_BENCHMARK_ROWS (10 million rows by default):
+
+    pytest benchmarks/pandas_serde_benchmark_test.py
+
+Peak memory is the highest RSS above the starting RSS of the process, sampled
+while the round-trip runs, and is stored in the `peak_rss_mb` extra info.
+"""
+
+# stdlib
+from collections.abc import Callable
+import os
+import threading
+import time
+
+# third party
+import numpy as np
+import pandas as pd
+import psutil
+import pytest
+
+# syft absolute
+from syft.serde.serialize import _serialize as serialize
+from syft.serde.third_party import deserialize_dataframe
+from syft.serde.third_party import deserialize_dataframe_ipc
+from syft.serde.third_party import deserialize_series
+from syft.serde.third_party import deserialize_series_ipc
+from syft.serde.third_party import serialize_dataframe
+from syft.serde.third_party import serialize_dataframe_ipc
+from syft.serde.third_party import serialize_series_ipc
+
+pytest.importorskip("pytest_benchmark")
+
+ROWS = int(os.getenv("SYFT_BENCHMARK_ROWS", 10_000_000))
+
+
+@pytest.fixture(scope="module")
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "int": np.arange(ROWS),
+            "float": rng.random(ROWS),
+            "bool": rng.random(ROWS) > 0.5,
+            "category": pd.Categorical(rng.choice(["a", "b", "c"], ROWS)),
+            "time": pd.date_range("2024-01-01", periods=ROWS, freq="s"),
+        }
+    )
+
+
+def measure_peak_rss(fn: Callable[[], object]) -> float:
+    """Peak RSS increase in MB while running `fn`."""
+    process = psutil.Process()
+    start = process.memory_info().rss
+    peak = start
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak
+        while not done.is_set():
+            peak = max(peak, process.memory_info().rss)
+            time.sleep(0.005)
+
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    try:
+        fn()
+    finally:
+        done.set()
+        sampler.join()
+    return (peak - start) / 2**20
+
+
+DATAFRAME_PATHS = {
+    "parquet": (serialize_dataframe, deserialize_dataframe),
+    "arrow_ipc": (serialize_dataframe_ipc, deserialize_dataframe_ipc),
+}
+
+SERIES_PATHS = {
+    "to_dict": (
+        lambda x: serialize(pd.DataFrame(x).to_dict(), to_bytes=True),
+        deserialize_series,
+    ),
+    "arrow_ipc": (serialize_series_ipc, deserialize_series_ipc),
+}
+
+
+@pytest.mark.parametrize("path", DATAFRAME_PATHS)
+def test_dataframe_roundtrip(benchmark, frame: pd.DataFrame, path: str) -> None:
+    ser, de = DATAFRAME_PATHS[path]
+
+    def roundtrip() -> pd.DataFrame:
+        return de(ser(frame))
+
+    benchmark.extra_info["peak_rss_mb"] = measure_peak_rss(roundtrip)
+    benchmark.extra_info["size_mb"] = len(ser(frame)) / 2**20
+    result = benchmark.pedantic(roundtrip, rounds=3)
+    assert len(result) == ROWS
+
+
+@pytest.mark.parametrize("path", SERIES_PATHS)
+def test_series_roundtrip(benchmark, frame: pd.DataFrame, path: str) -> None:
+    ser, de = SERIES_PATHS[path]
+    # to_dict goes through python objects, keep it to a size it can handle
+    series = frame["float"].iloc[: min(ROWS, 1_000_000)]
+
+    def roundtrip() -> pd.Series:
+        return de(ser(series))
+
+    benchmark.extra_info["peak_rss_mb"] = measure_peak_rss(roundtrip)
+    result = benchmark.pedantic(roundtrip, rounds=3)
+    assert len(result) == len(series)
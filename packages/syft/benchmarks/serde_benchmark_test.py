@@ -0,0 +1,150 @@
+"""Benchmarks of the capnp serde, from primitives to large array payloads.
+
+Run with pytest-benchmark installed:
+
+    pytest benchmarks/serde_benchmark_test.py
+
+Array payloads go from 1 KB up to SYFT_BENCHMARK_MAX_BYTES (100 MB by default,
+set it to 1073741824 to include the 1 GB payloads).
+"""
+
+# stdlib
+from collections.abc import Callable
+import os
+
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.service.dataset.dataset import Asset
+from syft.service.dataset.dataset import Contributor
+from syft.service.dataset.dataset import Dataset
+from syft.types.uid import UID
+
+pytest.importorskip("pytest_benchmark")
+
+MAX_PAYLOAD_BYTES = int(os.getenv("SYFT_BENCHMARK_MAX_BYTES", 100 * 2**20))
+
+ITEMS = 100_000
+
+
+def serialize(obj: object) -> bytes:
+    return sy.serialize(obj, to_bytes=True)
+
+
+def deserialize(blob: bytes) -> object:
+    return sy.deserialize(blob, from_bytes=True)
+
+
+def make_dataset() -> Dataset:
+    uploader = Contributor(name="Alice", email="alice@openmined.org", role="Owner")
+    server_uid = UID()
+    assets = [
+        Asset(
+            id=UID(),
+            action_id=UID(),
+            server_uid=server_uid,
+            name=f"asset_{i}",
+            uploader=uploader,
+            contributors={uploader},
+            shape=(10, 10),
+        )
+        for i in range(5)
+    ]
+    return Dataset(
+        id=UID(),
+        name="dataset",
+        uploader=uploader,
+        contributors={uploader},
+        asset_list=assets,
+        citation="citation",
+        url="https://openmined.org",
+    )
+
+
+OBJECTS: dict[str, Callable[[], object]] = {
+    "int": lambda: 2**40,
+    "float": lambda: 3.14,
+    "bool": lambda: True,
+    "none": lambda: None,
+    "str": lambda: "syft" * 256,
+    "bytes": lambda: os.urandom(1024),
+    "uid": UID,
+    "dataset": make_dataset,
+    "list_int": lambda: list(range(ITEMS)),
+    "list_str": lambda: [str(i) for i in range(ITEMS)],
+    "list_uid": lambda: [UID() for _ in range(ITEMS)],
+    "dict_str_int": lambda: {str(i): i for i in range(ITEMS)},
+}
+
+
+def make_numpy(size: int) -> np.ndarray:
+    return np.random.default_rng(0).random(size // 8)
+
+
+def make_pandas(size: int) -> pd.DataFrame:
+    rows = size // 16
+    return pd.DataFrame({"int": np.arange(rows), "float": make_numpy(size // 2)})
+
+
+def make_torch(size: int) -> object:
+    torch = pytest.importorskip("torch")
+    return torch.rand(size // 4)
+
+
+PAYLOADS: dict[str, Callable[[int], object]] = {
+    "numpy": make_numpy,
+    "pandas": make_pandas,
+    "torch": make_torch,
+}
+
+PAYLOAD_SIZES = [
+    pytest.param(
+        size,
+        id=name,
+        marks=pytest.mark.skipif(
+            size > MAX_PAYLOAD_BYTES, reason="larger than SYFT_BENCHMARK_MAX_BYTES"
+        ),
+    )
+    for name, size in [
+        ("1KB", 2**10),
+        ("1MB", 2**20),
+        ("100MB", 100 * 2**20),
+        ("1GB", 2**30),
+    ]
+]
+
+
+@pytest.mark.parametrize("name", OBJECTS)
+def test_serialize(serde_benchmark, name: str) -> None:
+    obj = OBJECTS[name]()
+    serde_benchmark(serialize, obj)
+
+
+@pytest.mark.parametrize("name", OBJECTS)
+def test_deserialize(serde_benchmark, name: str) -> None:
+    obj = OBJECTS[name]()
+    blob = serialize(obj)
+    result = serde_benchmark(deserialize, blob, output_bytes=len(blob))
+    assert result == obj
+
+
+@pytest.mark.parametrize("size", PAYLOAD_SIZES)
+@pytest.mark.parametrize("kind", PAYLOADS)
+def test_serialize_payload(serde_benchmark, kind: str, size: int) -> None:
+    payload = PAYLOADS[kind](size)
+    serde_benchmark(serialize, payload, payload_bytes=size)
+
+
+@pytest.mark.parametrize("size", PAYLOAD_SIZES)
+@pytest.mark.parametrize("kind", PAYLOADS)
+def test_deserialize_payload(serde_benchmark, kind: str, size: int) -> None:
+    payload = PAYLOADS[kind](size)
+    blob = serialize(payload)
+    result = serde_benchmark(
+        deserialize, blob, output_bytes=len(blob), payload_bytes=size
+    )
+    assert len(result) == len(payload)
@@ -0,0 +1,49 @@
+"""Benchmarks of the server handling an API call authenticated by its signature
+and by a session token. The calls are built and signed beforehand, so only the
+server's work is timed.
+
+Run with pytest-benchmark installed:
+
+    pytest benchmarks/session_token_benchmark_test.py
+"""
+
+# stdlib
+from collections.abc import Iterator
+from typing import Any
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPICall
+from syft.server.worker import Worker
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def worker() -> Iterator[Worker]:
+    worker = sy.Worker.named(name="session-token-benchmark", db_url="sqlite://")
+    yield worker
+    worker.cleanup()
+
+
+@pytest.mark.parametrize("session", [False, True])
+def test_handle_api_call(benchmark, worker: Worker, session: bool) -> None:
+    client = worker.root_client
+    credentials = client.credentials
+    session_token = worker.session_tokens.create(
+        credentials.verify_key, worker.get_role_for_credentials(credentials.verify_key)
+    )
+
+    def setup() -> tuple[tuple[Any, ...], dict]:
+        # a new call each round, signatures of calls seen before are cached
+        call = SyftAPICall(
+            server_uid=worker.id, path="user.get_current_user", args=[], kwargs={}
+        )
+        if session:
+            return (call.with_session(credentials.verify_key, session_token),), {}
+        return (call.sign(credentials),), {}
+
+    benchmark.pedantic(worker.handle_api_call, setup=setup, rounds=500)
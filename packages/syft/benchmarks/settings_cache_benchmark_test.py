@@ -0,0 +1,61 @@
+"""Benchmarks of reading a server's metadata, which reads its settings, and of
+an API call, with the settings read from the database on every read
+(`uncached`), compared with the stored ones on every read (`checked`) and
+cached between checks (`cached`). The reads answered without querying the
+database and the reads answered by a check of the stored settings are recorded
+in `extra_info`.
+
+Run with pytest-benchmark installed:
+
+    pytest benchmarks/settings_cache_benchmark_test.py
+"""
+
+# stdlib
+from collections.abc import Callable
+from collections.abc import Iterator
+from secrets import token_hex
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.server.settings_cache import SETTINGS_CHECK_INTERVAL
+from syft.server.worker import Worker
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def worker() -> Iterator[Worker]:
+    worker = sy.Worker.named(name=token_hex(16), db_url="sqlite://")
+    yield worker
+    worker.cleanup()
+
+
+def run(benchmark, worker: Worker, mode: str, read: Callable[[], object]) -> None:
+    settings_cache = worker.settings_cache
+    settings_cache.check_interval = 0 if mode == "checked" else SETTINGS_CHECK_INTERVAL
+
+    def uncached_read() -> object:
+        settings_cache.clear()
+        return read()
+
+    hits, version_checks = settings_cache.hits, settings_cache.version_checks
+    benchmark(uncached_read if mode == "uncached" else read)
+    benchmark.extra_info["reads_avoided"] = settings_cache.hits - hits
+    benchmark.extra_info["version_checks"] = (
+        settings_cache.version_checks - version_checks
+    )
+    settings_cache.check_interval = SETTINGS_CHECK_INTERVAL
+
+
+@pytest.mark.parametrize("mode", ["uncached", "checked", "cached"])
+def test_metadata(benchmark, worker: Worker, mode: str) -> None:
+    run(benchmark, worker, mode, lambda: worker.metadata)
+
+
+@pytest.mark.parametrize("mode", ["uncached", "checked", "cached"])
+def test_api_call(benchmark, worker: Worker, mode: str) -> None:
+    client = worker.root_client
+    run(benchmark, worker, mode, client.api.services.user.get_current_user)
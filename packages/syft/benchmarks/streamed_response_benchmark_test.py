@@ -0,0 +1,119 @@
+"""Benchmarks of a client getting a large API result from a local server over
+HTTP, sent as one body and streamed. Besides the time, the peak memory of the
+process (server and client) above the result size is recorded in `extra_info`.
+
+The server runs in uvicorn rather than FastAPI's TestClient, which collects
+the whole response body before handing it to the client.
+
+Run with pytest-benchmark installed:
+
+    pytest benchmarks/streamed_response_benchmark_test.py
+"""
+
+# stdlib
+from collections.abc import Iterator
+import gc
+import math
+from secrets import token_hex
+import socket
+import threading
+import time
+from typing import Any
+
+# third party
+from fastapi import FastAPI
+import psutil
+import pytest
+import uvicorn
+
+# syft absolute
+import syft as sy
+from syft.client import client as client_module
+from syft.client.api import SyftAPIData
+from syft.client.client import HTTPConnection
+from syft.server import routes
+from syft.server.routes import make_routes
+from syft.server.worker import Worker
+
+pytest.importorskip("pytest_benchmark")
+
+RESULT_SIZE = 256 * 1024 * 1024
+
+
+@pytest.fixture(scope="module")
+def worker() -> Iterator[Worker]:
+    worker = sy.Worker.named(name=token_hex(16), reset=True)
+    yield worker
+    worker.cleanup()
+
+
+@pytest.fixture(scope="module")
+def url(worker: Worker) -> Iterator[str]:
+    app = FastAPI()
+    app.include_router(make_routes(worker), prefix="/api/v2")
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(uvicorn.Config(app, log_level="error"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]})
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{sock.getsockname()[1]}"
+    server.should_exit = True
+    thread.join()
+
+
+class PeakMemory:
+    """Samples the resident memory of this process while it is entered."""
+
+    def __init__(self) -> None:
+        self.process = psutil.Process()
+        self.peak = 0
+
+    def __enter__(self) -> "PeakMemory":
+        gc.collect()
+        self.baseline = self.process.memory_info().rss
+        self.running = True
+        self.thread = threading.Thread(target=self._sample)
+        self.thread.start()
+        return self
+
+    def _sample(self) -> None:
+        while self.running:
+            rss = self.process.memory_info().rss - self.baseline
+            self.peak = max(self.peak, rss)
+            time.sleep(0.001)
+
+    def __exit__(self, *args: Any) -> None:
+        self.running = False
+        self.thread.join()
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_large_result(
+    benchmark, monkeypatch, worker: Worker, url: str, stream: bool
+) -> None:
+    if not stream:
+        monkeypatch.setattr(routes, "STREAM_RESPONSE_SIZE", math.inf)
+        monkeypatch.setattr(client_module, "STREAM_RESPONSE_SIZE", math.inf)
+    # the server answers every call with the large result
+    monkeypatch.setattr(
+        worker,
+        "handle_api_call",
+        lambda api_call, **kwargs: SyftAPIData(data=b"\x01" * RESULT_SIZE).sign(
+            worker.signing_key
+        ),
+    )
+    client = worker.root_client
+    connection = HTTPConnection(url=url)
+    api = connection.get_api(client.credentials, client.api.communication_protocol)
+
+    def get_result() -> None:
+        result = api.services.user.get_all()
+        assert len(result) == RESULT_SIZE
+
+    with PeakMemory() as memory:
+        benchmark.pedantic(get_result, rounds=3)
+    benchmark.extra_info["peak_memory_per_result_size"] = round(
+        memory.peak / RESULT_SIZE, 2
+    )
@@ -0,0 +1,39 @@
+"""Micro-benchmarks for creating, hashing and converting UIDs.
+
+Run with pytest-benchmark installed:
+
+    pytest benchmarks/uid_benchmark_test.py
+"""
+
+# third party
+import pytest
+
+# syft absolute
+from syft.types.uid import UID
+
+pytest.importorskip("pytest_benchmark")
+
+COUNT = 1_000_000
+
+
+def test_create_and_hash_uids(benchmark) -> None:
+    def create_and_hash() -> set[UID]:
+        return {UID() for _ in range(COUNT)}
+
+    result = benchmark.pedantic(create_and_hash, rounds=3)
+    assert len(result) == COUNT
+
+
+def test_hash_uids(benchmark) -> None:
+    uids = [UID() for _ in range(COUNT)]
+    benchmark.pedantic(lambda: [hash(uid) for uid in uids], rounds=3)
+
+
+def test_uids_to_string(benchmark) -> None:
+    uids = [UID() for _ in range(COUNT)]
+    benchmark.pedantic(lambda: [str(uid) for uid in uids], rounds=3)
+
+
+def test_uids_from_string(benchmark) -> None:
+    strings = [UID().no_dash for _ in range(COUNT)]
+    benchmark.pedantic(lambda: [UID.from_string(s) for s in strings], rounds=3)
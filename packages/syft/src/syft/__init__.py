@@ -37,8 +37,10 @@ from .protocol.data_protocol import get_data_protocol
 from .protocol.data_protocol import stage_protocol_changes
 from .serde import NOTHING
 from .serde.deserialize import _deserialize as deserialize
+from .serde.deserialize import _deserialize_from as deserialize_from
 from .serde.serializable import serializable
 from .serde.serialize import _serialize as serialize
+from .serde.serialize import _serialize_to as serialize_to
 from .server.credentials import SyftSigningKey
 from .server.datasite import Datasite
 from .server.enclave import Enclave
@@ -11,7 +11,11 @@ from .types.uid import UID
 
 if TYPE_CHECKING:
     # relative
+    from .server.api_cache import APICache
+    from .server.peer_client_cache import PeerClientCache
     from .server.service_registry import ServiceRegistry
+    from .server.session_tokens import SessionTokens
+    from .server.settings_cache import SettingsCache
     from .service.service import AbstractService
 
 
@@ -43,6 +47,10 @@ class AbstractServer:
     server_side_type: ServerSideType | None
     in_memory_workers: bool
     services: "ServiceRegistry"
+    api_cache: "APICache"
+    peer_client_cache: "PeerClientCache"
+    session_tokens: "SessionTokens"
+    settings_cache: "SettingsCache"
     db_config: DBConfig
     db: DBManager[DBConfig]
 
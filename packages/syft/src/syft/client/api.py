@@ -4,9 +4,15 @@ from __future__ import annotations
 # stdlib
 from collections import OrderedDict
 from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import hashlib
 import inspect
 from inspect import Parameter
 from inspect import signature
+import os
+import time
 import types
 from typing import Any
 from typing import TYPE_CHECKING
@@ -25,11 +31,15 @@ from ..abstract_server import AbstractServer
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
 from ..protocol.data_protocol import migrate_args_and_kwargs
+from ..serde.compression import choose_compression
 from ..serde.deserialize import _deserialize
+from ..serde.deserialize import _deserialize_fields
+from ..serde.lazy import use_lazy_fields
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
 from ..serde.signature import Signature
 from ..serde.signature import signature_remove
+from ..serde.type_ids import accepts_type_ids
 from ..server.credentials import SyftSigningKey
 from ..server.credentials import SyftVerifyKey
 from ..service.context import AuthedServiceContext
@@ -82,6 +92,12 @@ IPYNB_BACKGROUND_METHODS = {
 
 IPYNB_BACKGROUND_PREFIXES = ["_ipy", "_repr", "__ipython", "__pydantic"]
 
+# number of verified signatures remembered per process, keyed by
+# (verify key, signature, message digest), so a retried call carrying the same
+# signature is not verified twice. 0 disables the cache.
+SIGNATURE_CACHE_SIZE = int(os.getenv("SYFT_SIGNATURE_CACHE_SIZE", 1024))
+_verified_signatures: dict[tuple[bytes, bytes, bytes], None] = {}
+
 
 @exclude_from_traceback
 def post_process_result(
@@ -224,17 +240,59 @@ class SignedSyftAPICall(SyftObject):
 
         return self.cached_deseralized_message
 
+    def message_fields(self, *names: str) -> dict[str, Any]:
+        """The fields `names` of the message, decoded without the other fields."""
+        return _deserialize_fields(self.serialized_message, names)
+
     @property
     def is_valid(self) -> bool:
+        if SIGNATURE_CACHE_SIZE:
+            key = (
+                self.credentials.key,
+                self.signature,
+                hashlib.sha256(self.serialized_message).digest(),
+            )
+            if key in _verified_signatures:
+                return True
         try:
             _ = self.credentials.verify_key.verify(
                 self.serialized_message, self.signature
             )
         except BadSignatureError:
             return False
+        if SIGNATURE_CACHE_SIZE:
+            if len(_verified_signatures) >= SIGNATURE_CACHE_SIZE:
+                _verified_signatures.clear()
+            _verified_signatures[key] = None
         return True
 
 
+@serializable(attrs=["session_token", "credentials", "serialized_message"])
+class SessionSyftAPICall(SyftObject):
+    """A SyftAPICall authenticated with a session token instead of a signature."""
+
+    __canonical_name__ = "SessionSyftAPICall"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    credentials: SyftVerifyKey
+    session_token: str
+    serialized_message: bytes
+    cached_deseralized_message: SyftAPICall | None = None
+
+    @property
+    def message(self) -> SyftAPICall:
+        # from deserialize we might not have this attr because __init__ is skipped
+        if not hasattr(self, "cached_deseralized_message"):
+            self.cached_deseralized_message = None
+
+        if self.cached_deseralized_message is None:
+            self.cached_deseralized_message = _deserialize(
+                blob=self.serialized_message, from_bytes=True
+            )
+
+        return self.cached_deseralized_message
+
+
 @serializable()
 class SyftAPICall(SyftObject):
     # version
@@ -257,10 +315,46 @@ class SyftAPICall(SyftObject):
             signature=signed_message.signature,
         )
 
+    def with_session(
+        self, credentials: SyftVerifyKey, session_token: str
+    ) -> SessionSyftAPICall:
+        return SessionSyftAPICall(
+            credentials=credentials,
+            session_token=session_token,
+            serialized_message=_serialize(self, to_bytes=True),
+        )
+
     def __repr__(self) -> str:
         return f"SyftAPICall(path={self.path}, args={self.args}, kwargs={self.kwargs}, blocking={self.blocking})"
 
 
+@serializable()
+class SyftAPIBatchCall(SyftObject):
+    # version
+    __canonical_name__ = "SyftAPIBatchCall"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    # fields
+    server_uid: UID
+    calls: list[SyftAPICall]
+    # run all calls in one database transaction, rolled back if one of them fails
+    transaction: bool = False
+
+    def sign(self, credentials: SyftSigningKey) -> SignedSyftAPICall:
+        signed_message = credentials.signing_key.sign(_serialize(self, to_bytes=True))
+
+        return SignedSyftAPICall(
+            credentials=credentials.verify_key,
+            serialized_message=signed_message.message,
+            signature=signed_message.signature,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"SyftAPIBatchCall(calls={len(self.calls)}, transaction={self.transaction})"
+        )
+
+
 @serializable()
 class SyftAPIData(SyftBaseObject):
     # version
@@ -321,6 +415,16 @@ class RemoteFunction(SyftObject):
     def function_call(
         self, path: str, *args: Any, cache_result: bool = True, **kwargs: Any
     ) -> Any:
+        api_call = self.build_api_call(path, args, kwargs)
+        if api_call is None:
+            return
+        result = self.make_call(api_call=api_call, cache_result=cache_result)
+        return self.process_result(path, result)
+
+    def build_api_call(
+        self, path: str, args: list | tuple, kwargs: dict[str, Any]
+    ) -> SyftAPICall | None:
+        """The call to send for these arguments, None if the user declined the warning."""
         if "blocking" in self.signature.parameters:
             raise Exception(
                 f"Signature {self.signature} can't have 'blocking' kwarg because it's reserved"
@@ -352,9 +456,10 @@ class RemoteFunction(SyftObject):
 
         allowed = self.warning.show() if self.warning else True
         if not allowed:
-            return
-        result = self.make_call(api_call=api_call, cache_result=cache_result)
+            return None
+        return api_call
 
+    def process_result(self, path: str, result: Any) -> Any:
         # TODO: annotate this on the service method decorator
         API_CALLS_THAT_REQUIRE_REFRESH = ["settings.enable_eager_execution"]
 
@@ -796,7 +901,9 @@ def debox_signed_syftapicall_response(
     if not signed_result.is_valid:
         raise SyftException(public_message="The result signature is invalid")
 
-    return signed_result.message.data
+    # the server validated the result before signing it
+    with use_lazy_fields():
+        return signed_result.message.data
 
 
 def downgrade_signature(signature: Signature, object_versions: dict) -> Signature:
@@ -877,6 +984,63 @@ def result_needs_api_update(api_call_result: Any) -> bool:
     return False
 
 
+class BatchedResult:
+    """The result of a call made in `SyftAPI.batch`, set when the batch is sent."""
+
+    def __init__(self, api_call: SyftAPICall, unwrap_on_success: bool) -> None:
+        self.api_call = api_call
+        self.unwrap_on_success = unwrap_on_success
+        self.done = False
+        self._result: Any = None
+
+    def set_result(self, result: Any) -> None:
+        self._result = result
+        self.done = True
+
+    @property
+    def result(self) -> Any:
+        """The value the call returns, raises the error of a failed call."""
+        if not self.done:
+            raise SyftException(
+                public_message=f"{self.api_call.path} has not been sent, "
+                "results are set when the batch exits"
+            )
+        return post_process_result(self._result, self.unwrap_on_success)
+
+    def __repr__(self) -> str:
+        state = repr(self._result) if self.done else "pending"
+        return f"BatchedResult(path={self.api_call.path}, result={state})"
+
+
+# the open batch of each SyftAPI by id, its calls are collected instead of sent
+_active_batches: ContextVar[dict[int, APIBatch]] = ContextVar(
+    "_active_batches", default={}
+)
+
+
+# the session token of each user on each server, see SyftAPI.start_session
+_session_tokens: dict[tuple[UID | None, SyftVerifyKey], str] = {}
+
+# session tokens are renewed this many seconds before they expire
+SESSION_RENEW_MARGIN = 60
+
+
+class APIBatch:
+    """The calls made in `SyftAPI.batch`, in order."""
+
+    def __init__(self, transaction: bool = False) -> None:
+        self.transaction = transaction
+        self.results: list[BatchedResult] = []
+
+    def add(self, api_call: SyftAPICall, unwrap_on_success: bool) -> BatchedResult:
+        batched = BatchedResult(api_call, unwrap_on_success)
+        self.results.append(batched)
+        return batched
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
 @serializable(
     attrs=[
         "endpoints",
@@ -932,13 +1096,8 @@ class SyftAPI(SyftObject):
         server: AbstractServer,
         communication_protocol: PROTOCOL_TYPE,
         user_verify_key: SyftVerifyKey | None = None,
+        user_endpoints: dict[str, APIEndpoint] | None = None,
     ) -> SyftAPI:
-        # relative
-        from ..service.api.api_service import APIService
-
-        # TODO: Maybe there is a possibility of merging ServiceConfig and APIEndpoint
-        from ..service.code.user_code_service import UserCodeService
-
         # find user role by verify_key
         # TODO: we should probably not allow empty verify keys but instead make user always register
         role = server.get_role_for_credentials(user_verify_key)
@@ -1013,6 +1172,32 @@ class SyftAPI(SyftObject):
             )
             lib_endpoints[path] = endpoint
 
+        if user_endpoints is None:
+            user_endpoints = SyftAPI.user_endpoints(server, user_verify_key)
+        endpoints.update(user_endpoints)
+
+        return SyftAPI(
+            server_name=server.name,
+            server_uid=server.id,
+            endpoints=endpoints,
+            lib_endpoints=lib_endpoints,
+            __user_role=role,
+            communication_protocol=communication_protocol,
+        )
+
+    @staticmethod
+    def user_endpoints(
+        server: AbstractServer, user_verify_key: SyftVerifyKey | None = None
+    ) -> dict[str, APIEndpoint]:
+        """The endpoints of the user's code and the admin defined custom endpoints."""
+        # relative
+        from ..service.api.api_service import APIService
+
+        # TODO: Maybe there is a possibility of merging ServiceConfig and APIEndpoint
+        from ..service.code.user_code_service import UserCodeService
+
+        endpoints: dict[str, APIEndpoint] = {}
+
         # 🟡 TODO 35: fix root context
         context = AuthedServiceContext(server=server, credentials=user_verify_key)
         method = server.get_method_with_context(
@@ -1055,27 +1240,110 @@ class SyftAPI(SyftObject):
             )
             endpoints[path] = endpoint
 
-        return SyftAPI(
-            server_name=server.name,
-            server_uid=server.id,
-            endpoints=endpoints,
-            lib_endpoints=lib_endpoints,
-            __user_role=role,
-            communication_protocol=communication_protocol,
-        )
+        return endpoints
 
     @property
     def user_role(self) -> ServiceRole:
         return self.__user_role
 
-    def make_call(self, api_call: SyftAPICall, cache_result: bool = True) -> Any:
-        signed_call = api_call.sign(credentials=self.signing_key)
+    def make_call(
+        self, api_call: SyftAPICall, cache_result: bool = True, compress: bool = True
+    ) -> Any:
+        active_batch = _active_batches.get().get(id(self))
+        if active_batch is not None:
+            endpoint = self.endpoints.get(api_call.path)
+            unwrap_on_success = endpoint is None or endpoint.unwrap_on_success
+            return active_batch.add(api_call, unwrap_on_success)
+
+        signed_call = self.authenticate(api_call)
         if self.connection is not None:
-            signed_result = self.connection.make_call(signed_call)
+            signed_result = self.connection.make_call(
+                signed_call, **self._call_options(compress)
+            )
         else:
             raise SyftException(public_message="API connection is None")
 
         result = debox_signed_syftapicall_response(signed_result=signed_result).unwrap()
+        return self._handle_result(result)
+
+    def authenticate(
+        self, api_call: SyftAPICall
+    ) -> SignedSyftAPICall | SessionSyftAPICall:
+        """Sign `api_call`, or add the session token of the user if it has one."""
+        if self.signing_key is None:
+            raise SyftException(public_message="API signing key is None")
+        session_key = (self.server_uid, self.signing_key.verify_key)
+        session_token = _session_tokens.get(session_key)
+        if (
+            session_token is None
+            # queued and forwarded calls are stored and verified again later
+            or not api_call.blocking
+            or api_call.server_uid != self.server_uid
+            or getattr(self.connection, "proxy_target_uid", None) is not None
+        ):
+            return api_call.sign(credentials=self.signing_key)
+
+        expires_at = int(session_token.split(".")[1])
+        if expires_at - SESSION_RENEW_MARGIN <= time.time():
+            self.start_session()
+            session_token = _session_tokens[session_key]
+        return api_call.with_session(self.signing_key.verify_key, session_token)
+
+    def start_session(self) -> None:
+        """
+        Authenticate the next calls of this user to this server with a session
+        token, instead of signing each of them. The token is requested with a
+        signed call and renewed before it expires. Calls that are queued or
+        forwarded to other servers are still signed.
+        """
+        if self.signing_key is None:
+            raise SyftException(public_message="API signing key is None")
+        if getattr(self.connection, "proxy_target_uid", None) is not None:
+            raise SyftException(
+                public_message="Sessions can't be started through a gateway."
+            )
+        session_token = self._make_signed_call("session.start")
+        _session_tokens[(self.server_uid, self.signing_key.verify_key)] = session_token
+
+    def end_session(self) -> None:
+        """Revoke the session token of this user, the next calls are signed again."""
+        if self.signing_key is None:
+            return
+        session_token = _session_tokens.pop(
+            (self.server_uid, self.signing_key.verify_key), None
+        )
+        if session_token is not None:
+            self._make_signed_call("session.end", session_token=session_token)
+
+    def _make_signed_call(self, path: str, **kwargs: Any) -> Any:
+        if self.connection is None:
+            raise SyftException(public_message="API connection is None")
+        signed_call = SyftAPICall(
+            server_uid=self.server_uid, path=path, args=[], kwargs=kwargs
+        ).sign(credentials=self.signing_key)
+        signed_result = self.connection.make_call(signed_call)
+        result = debox_signed_syftapicall_response(signed_result=signed_result).unwrap()
+        return post_process_result(result, unwrap_on_success=True)
+
+    def _call_options(self, compress: bool = True) -> dict[str, Any]:
+        compression = None
+        if compress and self.metadata is not None:
+            compression = choose_compression(self.metadata.supported_compressions)
+        type_ids = self.metadata is not None and accepts_type_ids(
+            self.metadata.type_table_id
+        )
+        return {"compression": compression, "type_ids": type_ids}
+
+    def _handle_result(self, result: Any) -> Any:
+        proxy_target_uid = getattr(self.connection, "proxy_target_uid", None)
+        if proxy_target_uid is not None:
+            # relative
+            from ..store.blob_storage import BlobRetrievalByURL
+            from ..store.blob_storage.seaweedfs import SeaweedFSBlobDeposit
+
+            # blobs of a server behind a gateway are streamed through the gateway
+            if isinstance(result, BlobRetrievalByURL | SeaweedFSBlobDeposit):
+                result.proxy_server_uid = proxy_target_uid
         if isinstance(result, SyftResponseMessage):
             for warning in result.client_warnings:
                 prompt_warning_message(
@@ -1085,6 +1353,76 @@ class SyftAPI(SyftObject):
         self.update_api(result)
         return result
 
+    @contextmanager
+    def batch(self, transaction: bool = False) -> Iterator[APIBatch]:
+        """
+        Send the API calls made in this context to the server in one request when
+        it exits. The calls return a BatchedResult, which holds the result once the
+        batch has been sent:
+
+            with client.api.batch() as batch:
+                for request in requests:
+                    client.api.services.request.apply(request.id)
+            results = [r.result for r in batch.results]
+
+        Calls can't use the results of calls in the same batch. With
+        `transaction=True` the server runs the calls in one database transaction,
+        stops at the first failing call and rolls back the calls before it.
+        """
+        batches = _active_batches.get()
+        if id(self) in batches:
+            raise SyftException(public_message="API call batches can't be nested.")
+        if getattr(self.connection, "proxy_target_uid", None) is not None:
+            raise SyftException(
+                public_message="API call batches can't be sent through a gateway."
+            )
+        batch = APIBatch(transaction=transaction)
+        token = _active_batches.set({**batches, id(self): batch})
+        try:
+            yield batch
+        finally:
+            _active_batches.reset(token)
+        if len(batch) > 0:
+            self.send_batch(batch)
+
+    def send_batch(self, batch: APIBatch) -> None:
+        if self.connection is None:
+            raise SyftException(public_message="API connection is None")
+        signed_call = SyftAPIBatchCall(
+            server_uid=self.server_uid,
+            calls=[batched.api_call for batched in batch.results],
+            transaction=batch.transaction,
+        ).sign(credentials=self.signing_key)
+        signed_result = self.connection.make_batch_call(
+            signed_call, **self._call_options()
+        )
+        results = debox_signed_syftapicall_response(
+            signed_result=signed_result
+        ).unwrap()
+
+        for batched, result in zip(batch.results, results):
+            result, _ = migrate_args_and_kwargs(
+                [result], kwargs={}, to_latest_protocol=True
+            )
+            batched.set_result(self._handle_result(result[0]))
+
+        if batch.transaction and results and isinstance(results[-1], SyftError):
+            # the transaction stopped at the failed call and rolled back the others
+            error, failed = results[-1], len(results)
+            for i, batched in enumerate(batch.results, start=1):
+                if i != failed:
+                    batched.set_result(
+                        SyftError(
+                            message=f"Rolled back, call {failed} of the batch "
+                            f"failed: {error.message}"
+                        )
+                    )
+            raise SyftException(
+                public_message=f"Batch rolled back, call {failed} "
+                f"({batch.results[failed - 1].api_call.path}) failed: {error.message}",
+                server_trace=error.tb,
+            )
+
     def update_api(self, api_call_result: Any) -> None:
         # TODO: hacky stuff with typing and imports to prevent circular imports
         if result_needs_api_update(api_call_result):
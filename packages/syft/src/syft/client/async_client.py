@@ -0,0 +1,223 @@
+# future
+from __future__ import annotations
+
+# stdlib
+import asyncio
+from typing import Any
+from typing import TYPE_CHECKING
+
+# third party
+import httpx
+from typing_extensions import Self
+
+# relative
+from ..serde.type_ids import TYPE_TABLE_HEADER
+from ..serde.type_ids import TYPE_TABLE_MISMATCH_STATUS
+from ..types.errors import SyftException
+from ..util.util import verify_tls
+from .api import APIModule
+from .api import RemoteFunction
+from .api import SessionSyftAPICall
+from .api import SignedSyftAPICall
+from .api import SyftAPI
+from .api import SyftAPICall
+from .api import debox_signed_syftapicall_response
+from .client import HTTPConnection
+from .client import PythonConnection
+from .connection import ServerConnection
+from .http_session import HTTP_KEEP_ALIVE
+from .http_session import HTTP_POOL_SIZE
+from .http_session import HTTP_RETRIES
+from .http_session import default_timeout
+
+if TYPE_CHECKING:
+    # relative
+    from ..service.job.job_stash import Job
+    from .client import SyftClient
+
+
+def make_async_session() -> httpx.AsyncClient:
+    """The async counterpart of `make_session`, with the same pool settings."""
+    timeout = default_timeout()
+    connect, read = timeout if timeout is not None else (None, None)
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(None, connect=connect, read=read),
+        # the pool is the transport's, httpx ignores client limits given a transport.
+        # It retries failed connects only, like the adapter of `make_session`
+        transport=httpx.AsyncHTTPTransport(
+            verify=verify_tls(),
+            retries=HTTP_RETRIES,
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_SIZE,
+                max_keepalive_connections=HTTP_POOL_SIZE if HTTP_KEEP_ALIVE else 0,
+            ),
+        ),
+    )
+
+
+class AsyncConnection:
+    """Sends the signed calls of a connection without blocking the event loop.
+
+    Calls to an HTTP server are posted with httpx, calls to an in-memory server
+    run in a thread as the server handles them synchronously. Servers using an
+    in-memory sqlite database (`sqlite://`) can't be called from other threads.
+    """
+
+    def __init__(self, connection: ServerConnection) -> None:
+        if not isinstance(connection, HTTPConnection | PythonConnection):
+            raise SyftException(
+                public_message=f"{type(connection).__name__} has no async client"
+            )
+        self.connection: HTTPConnection | PythonConnection = connection
+        self._session: httpx.AsyncClient | None = None
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        # created on first use, in the event loop that uses it
+        if self._session is None:
+            self._session = make_async_session()
+        return self._session
+
+    async def make_call(
+        self,
+        signed_call: SignedSyftAPICall | SessionSyftAPICall,
+        compression: str | None = None,
+        type_ids: bool = False,
+    ) -> Any:
+        connection = self.connection
+        if isinstance(connection, HTTPConnection):
+            api_url, msg_bytes, headers = connection.prepare_api_call(
+                connection.routes.ROUTE_API_CALL.value,
+                signed_call,
+                compression,
+                type_ids,
+            )
+            response = await self.session.post(
+                api_url, content=msg_bytes, headers=headers
+            )
+            if response.status_code == TYPE_TABLE_MISMATCH_STATUS and (
+                headers is not None and TYPE_TABLE_HEADER in headers
+            ):
+                # the server no longer has the type table it advertised
+                return await self.make_call(signed_call, compression, type_ids=False)
+            return connection.read_api_response(
+                response.status_code, response.headers, response.content
+            )
+
+        return await asyncio.to_thread(connection.make_call, signed_call)  # type: ignore[unreachable]
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+
+
+class AsyncRemoteFunction:
+    """Awaitable version of a RemoteFunction, taking the same arguments."""
+
+    def __init__(self, remote_function: RemoteFunction, api: AsyncSyftAPI) -> None:
+        self.remote_function = remote_function
+        self.api = api
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        function = self.remote_function
+        api_call = function.build_api_call(function.path, args, kwargs)
+        if api_call is None:
+            return None
+        result = await self.api.make_call(api_call)
+        return function.process_result(function.path, result)
+
+    def __repr__(self) -> str:
+        return f"Async{self.remote_function!r}"
+
+
+class AsyncAPIModule:
+    """An APIModule whose endpoints return coroutines."""
+
+    def __init__(self, module: APIModule, api: AsyncSyftAPI) -> None:
+        self.module = module
+        self.api = api
+
+    def __dir__(self) -> list[str]:
+        return dir(self.module)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.module, name)
+        if isinstance(attr, APIModule):
+            return AsyncAPIModule(attr, self.api)
+        if isinstance(attr, RemoteFunction):
+            return AsyncRemoteFunction(attr, self.api)
+        return attr
+
+    def __repr__(self) -> str:
+        return f"AsyncAPIModule(api{self.module.path})"
+
+
+class AsyncSyftAPI:
+    """Signs and sends API calls like SyftAPI, over an AsyncConnection."""
+
+    def __init__(self, api: SyftAPI, connection: AsyncConnection) -> None:
+        self.api = api
+        self.connection = connection
+
+    @property
+    def services(self) -> AsyncAPIModule:
+        return AsyncAPIModule(self.api.services, self)
+
+    async def make_call(self, api_call: SyftAPICall, compress: bool = True) -> Any:
+        signed_call = self.api.authenticate(api_call)
+        signed_result = await self.connection.make_call(
+            signed_call, **self.api._call_options(compress)
+        )
+        result = debox_signed_syftapicall_response(signed_result=signed_result).unwrap()
+        return self.api._handle_result(result)
+
+
+class AsyncSyftClient:
+    """
+    Awaitable API calls of a logged in client, for fanning out over many servers
+    or jobs from one event loop:
+
+        async with client.as_async() as aclient:
+            users = await aclient.api.services.user.get_all()
+
+        results = await asyncio.gather(*(aclient.wait(job) for job in jobs))
+
+    Logging in and the API schema stay with the SyftClient, which is shared.
+    """
+
+    def __init__(self, client: SyftClient) -> None:
+        self.client = client
+        self.connection = AsyncConnection(client.connection)
+        self.api = AsyncSyftAPI(client.api, self.connection)
+
+    @property
+    def services(self) -> AsyncAPIModule:
+        return self.api.services
+
+    async def wait(
+        self, job: Job, timeout: float | None = None, poll_interval: float = 1.0
+    ) -> Any:
+        """Wait for `job` to be resolved and return its result, like
+        `job.wait(job_only=True)`, without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            fetched = await self.api.services.job.get(job.id)
+            if fetched.resolved:
+                return fetched.result
+            if deadline is not None and loop.time() >= deadline:
+                raise SyftException(public_message="Reached Timeout!")
+            await asyncio.sleep(poll_interval)
+
+    async def aclose(self) -> None:
+        await self.connection.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        return f"Async{self.client!r}"
@@ -4,8 +4,8 @@ from __future__ import annotations
 # stdlib
 import base64
 from collections.abc import Callable
-from collections.abc import Generator
 from collections.abc import Iterable
+from collections.abc import Mapping
 from enum import Enum
 from getpass import getpass
 import json
@@ -23,8 +23,6 @@ from pydantic import field_validator
 import requests
 from requests import Response
 from requests import Session
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry  # type: ignore[import-untyped]
 from typing_extensions import Self
 
 # relative
@@ -35,9 +33,20 @@ from ..abstract_server import ServerType
 from ..protocol.data_protocol import DataProtocol
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
+from ..serde.compression import ACCEPT_COMPRESSION_HEADER
+from ..serde.compression import COMPRESSION_HEADER
+from ..serde.compression import decompress
+from ..serde.compression import maybe_compress
+from ..serde.compression import supported_compressions
 from ..serde.deserialize import _deserialize
+from ..serde.deserialize import _deserialize_from
 from ..serde.serializable import serializable
+from ..serde.serialize import STREAM_RESPONSE_SIZE
 from ..serde.serialize import _serialize
+from ..serde.type_ids import TYPE_TABLE_HEADER
+from ..serde.type_ids import TYPE_TABLE_MISMATCH_STATUS
+from ..serde.type_ids import type_table_id
+from ..serde.type_ids import use_type_ids
 from ..server.credentials import SyftSigningKey
 from ..server.credentials import SyftVerifyKey
 from ..server.credentials import UserLoginCredentials
@@ -60,12 +69,16 @@ from ..util.util import thread_ident
 from ..util.util import verify_tls
 from .api import APIModule
 from .api import APIRegistry
+from .api import SessionSyftAPICall
 from .api import SignedSyftAPICall
 from .api import SyftAPI
 from .api import SyftAPICall
 from .api import debox_signed_syftapicall_response
 from .api import post_process_result
 from .connection import ServerConnection
+from .disk_cache import get_disk_cache
+from .http_session import HTTPStats
+from .http_session import make_session
 from .protocol import SyftProtocol
 
 logger = logging.getLogger(__name__)
@@ -73,6 +86,7 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     # relative
     from ..service.network.server_peer import ServerPeer
+    from .async_client import AsyncSyftClient
 
 
 def upgrade_tls(url: ServerURL, response: Response) -> ServerURL:
@@ -87,6 +101,14 @@ def upgrade_tls(url: ServerURL, response: Response) -> ServerURL:
     return url
 
 
+def is_streamed_response(headers: Mapping[str, str]) -> bool:
+    """Whether an API response is large enough to be deserialized as it arrives."""
+    if headers.get(COMPRESSION_HEADER):
+        return False
+    size = headers.get("Content-Length")
+    return size is None or int(size) >= STREAM_RESPONSE_SIZE
+
+
 def forward_message_to_proxy(
     make_call: Callable,
     proxy_target_uid: UID,
@@ -129,6 +151,7 @@ class Routes(Enum):
     ROUTE_LOGIN = f"{API_PATH}/login"
     ROUTE_REGISTER = f"{API_PATH}/register"
     ROUTE_API_CALL = f"{API_PATH}/api_call"
+    ROUTE_API_BATCH_CALL = f"{API_PATH}/api_batch_call"
     ROUTE_BLOB_STORE = "/blob"
     ROUTE_FORGOT_PASSWORD = f"{API_PATH}/forgot_password"
     ROUTE_RESET_PASSWORD = f"{API_PATH}/reset_password"
@@ -189,14 +212,14 @@ class HTTPConnection(ServerConnection):
     @property
     def session(self) -> Session:
         if self.session_cache is None:
-            session = requests.Session()
-            retry = Retry(total=3, backoff_factor=0.5)
-            adapter = HTTPAdapter(max_retries=retry)
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-            self.session_cache = session
+            self.session_cache = make_session()
         return self.session_cache
 
+    @property
+    def stats(self) -> HTTPStats:
+        """Requests, latency and connection reuse of this connection's session."""
+        return self.session.get_adapter(str(self.url)).stats
+
     def _make_get(
         self, path: str, params: dict | None = None, stream: bool = False
     ) -> bytes | Iterable:
@@ -261,8 +284,86 @@ class HTTPConnection(ServerConnection):
 
         return response.content
 
+    def _make_get_stream(self, path: str) -> Response:
+        """GET `path` uncached, the body is left to be read as it arrives."""
+        url = self.url
+
+        if self.rtunnel_token:
+            self.headers = {} if self.headers is None else self.headers
+            url = ServerURL.from_url(INTERNAL_PROXY_TO_RATHOLE)
+            self.headers["Host"] = self.url.host_or_ip
+
+        url = url.with_path(path)
+
+        response = self.session.get(
+            str(url),
+            headers=self.headers,
+            verify=verify_tls(),
+            proxies={},
+            stream=True,
+        )
+        if response.status_code != 200:
+            response.close()
+            raise requests.ConnectionError(
+                f"Failed to fetch {url}. Response returned with code {response.status_code}"
+            )
+        return response
+
+    def _make_cached_get(
+        self, path: str, cache_key: tuple[str, ...], params: dict | None = None
+    ) -> bytes:
+        """GET `path`, revalidating the response cached on disk under `cache_key`."""
+        cache = get_disk_cache()
+        cached = cache.get(cache_key) if cache is not None else None
+
+        url = self.url
+
+        if self.rtunnel_token:
+            self.headers = {} if self.headers is None else self.headers
+            url = ServerURL.from_url(INTERNAL_PROXY_TO_RATHOLE)
+            self.headers["Host"] = self.url.host_or_ip
+
+        url = url.with_path(path)
+
+        headers = {} if self.headers is None else dict(self.headers)
+        if cached is not None:
+            headers["If-None-Match"] = cached.etag
+
+        response = self.session.get(
+            str(url),
+            headers=headers,
+            verify=verify_tls(),
+            proxies={},
+            params=params,
+        )
+        # the cached response is still the current one
+        if response.status_code == 304 and cached is not None:
+            return cached.content
+        if response.status_code != 200:
+            raise requests.ConnectionError(
+                f"Failed to fetch {url}. Response returned with code {response.status_code}"
+            )
+
+        # upgrade to tls if available
+        self.url = upgrade_tls(self.url, response)
+
+        etag = response.headers.get("ETag")
+        if cache is not None and etag:
+            cache.set(cache_key, etag, response.content)
+        return response.content
+
+    @cached(cache=TTLCache(maxsize=128, ttl=300))
+    def _get_metadata_content(self) -> bytes:
+        return self._make_cached_get(
+            self.routes.ROUTE_METADATA.value, cache_key=("metadata", str(self.url))
+        )
+
     def _make_put(
-        self, path: str, data: bytes | Generator, stream: bool = False
+        self,
+        path: str,
+        data: bytes | Iterable[bytes],
+        stream: bool = False,
+        headers: dict[str, str] | None = None,
     ) -> Response:
         url = self.url
 
@@ -277,7 +378,7 @@ class HTTPConnection(ServerConnection):
             verify=verify_tls(),
             proxies={},
             data=data,
-            headers=self.headers,
+            headers={**(self.headers or {}), **(headers or {})},
             stream=stream,
         )
         if response.status_code != 200:
@@ -339,7 +440,7 @@ class HTTPConnection(ServerConnection):
             )
             return response
         else:
-            response = self._make_get(self.routes.ROUTE_METADATA.value)
+            response = self._get_metadata_content()
             metadata_json = json.loads(response)
             return ServerMetadataJSON(**metadata_json)
 
@@ -365,7 +466,17 @@ class HTTPConnection(ServerConnection):
                 credentials=credentials,
             )
         else:
-            content = self._make_get(self.routes.ROUTE_API.value, params=params)
+            server_key = str(metadata.id) if metadata is not None else str(self.url)
+            content = self._make_cached_get(
+                self.routes.ROUTE_API.value,
+                cache_key=(
+                    "api",
+                    server_key,
+                    str(communication_protocol),
+                    str(credentials.verify_key),
+                ),
+                params=params,
+            )
             obj = _deserialize(content, from_bytes=True)
         obj.connection = self
         obj.signing_key = credentials
@@ -449,29 +560,132 @@ class HTTPConnection(ServerConnection):
             response = post_process_result(response, unwrap_on_success=False)
         return response
 
-    def make_call(self, signed_call: SignedSyftAPICall) -> Any:
-        msg_bytes: bytes = _serialize(obj=signed_call, to_bytes=True)
+    def make_call(
+        self,
+        signed_call: SignedSyftAPICall | SessionSyftAPICall,
+        compression: str | None = None,
+        type_ids: bool = False,
+    ) -> Any:
+        return self._post_api_call(
+            self.routes.ROUTE_API_CALL.value, signed_call, compression, type_ids
+        )
+
+    def make_batch_call(
+        self,
+        signed_call: SignedSyftAPICall,
+        compression: str | None = None,
+        type_ids: bool = False,
+    ) -> Any:
+        return self._post_api_call(
+            self.routes.ROUTE_API_BATCH_CALL.value, signed_call, compression, type_ids
+        )
+
+    def _post_api_call(
+        self,
+        path: str,
+        signed_call: SignedSyftAPICall | SessionSyftAPICall,
+        compression: str | None = None,
+        type_ids: bool = False,
+    ) -> Any:
+        api_url, msg_bytes, headers = self.prepare_api_call(
+            path, signed_call, compression, type_ids
+        )
+        response = self.session.post(
+            api_url,
+            data=msg_bytes,
+            headers=headers,
+            verify=verify_tls(),
+            proxies={},
+            stream=True,
+        )
+        if response.status_code == TYPE_TABLE_MISMATCH_STATUS and (
+            headers is not None and TYPE_TABLE_HEADER in headers
+        ):
+            # the server no longer has the type table it advertised
+            response.close()
+            return self._post_api_call(path, signed_call, compression, type_ids=False)
+        if response.status_code == 200 and is_streamed_response(response.headers):
+            # deserialized as it arrives, the body is never held as a whole
+            with response, use_type_ids(TYPE_TABLE_HEADER in response.headers):
+                response.raw.decode_content = True
+                return _deserialize_from(response.raw)
+        return self.read_api_response(
+            response.status_code, response.headers, response.content
+        )
 
+    def relay_api_call(self, data: bytes, headers: Mapping[str, str]) -> Response:
+        """
+        Post an API call serialized by someone else, such as a user of a gateway
+        relaying it to this server. The body of the response is left to be read
+        as it arrives.
+        """
         if self.rtunnel_token:
             api_url = ServerURL.from_url(INTERNAL_PROXY_TO_RATHOLE)
             api_url = api_url.with_path(self.routes.ROUTE_API_CALL.value)
             self.headers = {} if self.headers is None else self.headers
             self.headers["Host"] = self.url.host_or_ip
         else:
-            api_url = self.api_url
+            api_url = self.url.with_path(self.routes.ROUTE_API_CALL.value)
 
-        response = requests.post(  # nosec
-            url=api_url,
-            data=msg_bytes,
-            headers=self.headers,
+        return self.session.post(
+            str(api_url),
+            data=data,
+            headers={**(self.headers or {}), **headers},
+            verify=verify_tls(),
+            proxies={},
+            stream=True,
         )
 
-        if response.status_code != 200:
+    def prepare_api_call(
+        self,
+        path: str,
+        signed_call: SignedSyftAPICall | SessionSyftAPICall,
+        compression: str | None = None,
+        type_ids: bool = False,
+    ) -> tuple[str, bytes, dict[str, str] | None]:
+        """The url, body and headers of the request posting `signed_call`."""
+        # proxied calls are decoded by the gateway, which we didn't negotiate with
+        negotiated = self.proxy_target_uid is None
+        table_id = type_table_id() if type_ids and negotiated else None
+
+        with use_type_ids(table_id is not None):
+            msg_bytes: bytes = _serialize(obj=signed_call, to_bytes=True)
+
+        if self.rtunnel_token:
+            api_url = ServerURL.from_url(INTERNAL_PROXY_TO_RATHOLE)
+            api_url = api_url.with_path(path)
+            self.headers = {} if self.headers is None else self.headers
+            self.headers["Host"] = self.url.host_or_ip
+        else:
+            api_url = self.url.with_path(path)
+
+        headers = self.headers
+        if compression is not None and negotiated:
+            msg_bytes, codec = maybe_compress(msg_bytes, compression)
+            headers = {} if headers is None else dict(headers)
+            headers[ACCEPT_COMPRESSION_HEADER] = ",".join(supported_compressions())
+            if codec is not None:
+                headers[COMPRESSION_HEADER] = codec
+        if table_id is not None:
+            # the server answers with type ids as well
+            headers = {} if headers is None else dict(headers)
+            headers[TYPE_TABLE_HEADER] = table_id
+        return str(api_url), msg_bytes, headers
+
+    def read_api_response(
+        self, status_code: int, headers: Mapping[str, str], content: bytes
+    ) -> Any:
+        if status_code != 200:
             raise requests.ConnectionError(
-                f"Failed to fetch metadata. Response returned with code {response.status_code}"
+                f"Failed to fetch metadata. Response returned with code {status_code}"
             )
 
-        result = _deserialize(response.content, from_bytes=True)
+        response_codec = headers.get(COMPRESSION_HEADER)
+        if response_codec:
+            content = decompress(content, response_codec)
+
+        with use_type_ids(TYPE_TABLE_HEADER in headers):
+            result = _deserialize(content, from_bytes=True)
         return result
 
     def __repr__(self) -> str:
@@ -664,9 +878,23 @@ class PythonConnection(ServerConnection):
             response = post_process_result(response, unwrap_on_success=False)
         return response
 
-    def make_call(self, signed_call: SignedSyftAPICall) -> Any:
+    def make_call(
+        self,
+        signed_call: SignedSyftAPICall | SessionSyftAPICall,
+        compression: str | None = None,
+        type_ids: bool = False,
+    ) -> Any:
+        # in-process calls are never serialized, so there is nothing to compress
         return self.server.handle_api_call(signed_call)
 
+    def make_batch_call(
+        self,
+        signed_call: SignedSyftAPICall,
+        compression: str | None = None,
+        type_ids: bool = False,
+    ) -> Any:
+        return self.server.handle_api_batch_call(signed_call)
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}"
 
@@ -846,6 +1074,13 @@ class SyftClient:
             self._fetch_api(self.credentials)
         return cast(SyftAPI, self._api)  # we are sure self._api is not None after fetch
 
+    def as_async(self) -> AsyncSyftClient:
+        """A client sending the API calls of this one from an event loop."""
+        # relative
+        from .async_client import AsyncSyftClient
+
+        return AsyncSyftClient(self)
+
     def guest(self) -> Self:
         return self.__class__(
             connection=self.connection,
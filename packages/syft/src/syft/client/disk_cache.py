@@ -0,0 +1,76 @@
+# stdlib
+from dataclasses import dataclass
+import hashlib
+import logging
+import os
+from pathlib import Path
+import shutil
+import tempfile
+
+# relative
+from ..util.util import str_to_bool
+
+logger = logging.getLogger(__name__)
+
+# the APIs and metadata of the servers a client connected to, revalidated with
+# their ETag instead of being downloaded again
+CLIENT_CACHE = str_to_bool(os.getenv("SYFT_CLIENT_CACHE", "true"))
+CLIENT_CACHE_DIR = Path(
+    os.getenv("SYFT_CLIENT_CACHE_DIR", Path.home() / ".syft" / "cache")
+)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    etag: str
+    content: bytes
+
+
+class DiskCache:
+    """
+    Responses of servers stored with their ETag, one file per key. The last part
+    of a key is hashed, the others are directories:
+
+        ("api", <server id>, <protocol>, <verify key>) -> api/<id>/<protocol>/<hash>
+
+    Files are only read when their key is asked for. Failing to read or write
+    the cache is never an error, the response is downloaded instead.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def path(self, key: tuple[str, ...]) -> Path:
+        *dirs, name = key
+        return self.root.joinpath(*dirs, hashlib.sha256(name.encode()).hexdigest())
+
+    def get(self, key: tuple[str, ...]) -> CachedResponse | None:
+        try:
+            data = self.path(key).read_bytes()
+        except OSError:
+            return None
+        etag, sep, content = data.partition(b"\n")
+        if not sep:
+            return None
+        return CachedResponse(etag=etag.decode(), content=content)
+
+    def set(self, key: tuple[str, ...], etag: str, content: bytes) -> None:
+        path = self.path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # written next to the file and renamed, readers never see half of it
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+                f.write(etag.encode() + b"\n" + content)
+            os.replace(f.name, path)
+        except OSError as e:
+            logger.debug(f"Failed to cache {key[0]} in {path}: {e}")
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def get_disk_cache() -> DiskCache | None:
+    """The cache of this client, None when SYFT_CLIENT_CACHE is off."""
+    if not CLIENT_CACHE:
+        return None
+    return DiskCache(CLIENT_CACHE_DIR)
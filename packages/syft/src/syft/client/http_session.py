@@ -0,0 +1,154 @@
+# stdlib
+from dataclasses import dataclass
+from dataclasses import field
+import os
+import threading
+import time
+from typing import Any
+
+# third party
+from requests import PreparedRequest
+from requests import Response
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry  # type: ignore[import-untyped]
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.connectionpool import HTTPSConnectionPool
+
+# connections kept open per host
+HTTP_POOL_SIZE = int(os.getenv("SYFT_HTTP_POOL_SIZE", 10))
+HTTP_KEEP_ALIVE = os.getenv("SYFT_HTTP_KEEP_ALIVE", "true").lower() == "true"
+HTTP_RETRIES = int(os.getenv("SYFT_HTTP_RETRIES", 3))
+HTTP_BACKOFF_FACTOR = float(os.getenv("SYFT_HTTP_BACKOFF_FACTOR", 0.5))
+# seconds, requests wait forever when unset
+HTTP_CONNECT_TIMEOUT = os.getenv("SYFT_HTTP_CONNECT_TIMEOUT")
+HTTP_READ_TIMEOUT = os.getenv("SYFT_HTTP_READ_TIMEOUT")
+
+Timeout = tuple[float | None, float | None] | None
+
+
+def default_timeout() -> Timeout:
+    if HTTP_CONNECT_TIMEOUT is None and HTTP_READ_TIMEOUT is None:
+        return None
+    return (
+        float(HTTP_CONNECT_TIMEOUT) if HTTP_CONNECT_TIMEOUT else None,
+        float(HTTP_READ_TIMEOUT) if HTTP_READ_TIMEOUT else None,
+    )
+
+
+@dataclass
+class HTTPStats:
+    requests: int = 0
+    failed_requests: int = 0
+    connections: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of requests sent over a connection that was already open."""
+        if self.requests == 0:
+            return 0.0
+        return max(0.0, 1 - self.connections / self.requests)
+
+    @property
+    def mean_seconds(self) -> float:
+        if self.requests == 0:
+            return 0.0
+        return self.total_seconds / self.requests
+
+    def record(self, seconds: float, connections: int, failed: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            self.failed_requests += failed
+            self.connections = connections
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+
+class _CountingPoolMixin:
+    """Counts the connections opened by a pool, also reconnects of closed ones."""
+
+    num_connects = 0
+
+    def _new_conn(self) -> HTTPConnection:
+        conn = super()._new_conn()  # type: ignore[misc]
+        connect = conn.connect
+
+        def counted_connect() -> None:
+            self.num_connects += 1
+            connect()
+
+        conn.connect = counted_connect
+        return conn
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with a default timeout, recording the latency of every request."""
+
+    def __init__(self, timeout: Timeout = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.timeout = timeout
+        self.stats = HTTPStats()
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def connections_opened(self) -> int:
+        # pools evicted by the pool manager take their count with them
+        pools = self.poolmanager.pools
+        return sum(
+            getattr(pool, "num_connects", 0)
+            for pool in (pools.get(key) for key in pools.keys())
+            if pool is not None
+        )
+
+    def send(  # type: ignore[override]
+        self, request: PreparedRequest, timeout: Timeout = None, **kwargs: Any
+    ) -> Response:
+        if timeout is None:
+            timeout = self.timeout
+        start = time.perf_counter()
+        try:
+            response = super().send(request, timeout=timeout, **kwargs)
+        except Exception:
+            self.stats.record(
+                time.perf_counter() - start, self.connections_opened(), failed=True
+            )
+            raise
+        self.stats.record(time.perf_counter() - start, self.connections_opened())
+        return response
+
+    def close(self) -> None:
+        super().close()
+        self.stats = HTTPStats()
+
+
+def make_session() -> Session:
+    """A session keeping up to HTTP_POOL_SIZE connections open per host."""
+    session = Session()
+    adapter = PooledHTTPAdapter(
+        timeout=default_timeout(),
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=HTTP_RETRIES, backoff_factor=HTTP_BACKOFF_FACTOR),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not HTTP_KEEP_ALIVE:
+        session.headers["Connection"] = "close"
+    return session
@@ -175,6 +175,7 @@ def deploy_to_python(
     enable_warnings: bool,
     n_consumers: int,
     thread_workers: bool,
+    http_workers: int = 1,
     create_producer: bool = False,
     queue_port: int | None = None,
     association_request_auto_approval: bool = False,
@@ -201,6 +202,7 @@ def deploy_to_python(
         "port": port,
         "reset": reset,
         "processes": processes,
+        "http_workers": http_workers,
         "dev_mode": dev_mode,
         "tail": tail,
         "server_type": server_type_enum,
@@ -312,6 +314,7 @@ class Orchestra:
         # worker related inputs
         port: int | str | None = None,
         processes: int = 1,  # temporary work around for jax in subprocess
+        http_workers: int = 1,  # uvicorn worker processes serving requests
         dev_mode: bool = False,
         reset: bool = False,
         log_level: str | int | None = None,
@@ -365,6 +368,7 @@ class Orchestra:
                 tail=tail,
                 dev_mode=dev_mode,
                 processes=processes,
+                http_workers=http_workers,
                 server_side_type=server_side_type_enum,
                 enable_warnings=enable_warnings,
                 log_level=log_level,
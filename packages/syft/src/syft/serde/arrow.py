@@ -53,6 +53,30 @@ def arrow_deserialize(
     return np_array.astype(original_dtype)
 
 
+# codecs arrow supports for IPC buffers, other codecs write uncompressed streams
+IPC_COMPRESSIONS = {ApacheArrowCompression.ZSTD, ApacheArrowCompression.LZ4}
+
+
+def arrow_table_serialize(table: pa.Table) -> bytes:
+    """Write a table as an Arrow IPC stream.
+
+    The columns are written as is, categoricals stay dictionary encoded.
+    """
+    compression = flags.APACHE_ARROW_COMPRESSION
+    codec = compression.value if compression in IPC_COMPRESSIONS else None
+    options = pa.ipc.IpcWriteOptions(compression=codec)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_table_deserialize(buf: bytes) -> pa.Table:
+    # uncompressed columns point into `buf` instead of being copied
+    with pa.ipc.open_stream(pa.py_buffer(buf)) as reader:
+        return reader.read_all()
+
+
 def numpyutf8toarray(input_index: np.ndarray) -> np.ndarray:
     """Decodes utf-8 encoded numpy array to string numpy array.
 
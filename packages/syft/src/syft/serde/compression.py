@@ -0,0 +1,197 @@
+# stdlib
+from collections.abc import Callable
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import field
+import os
+import threading
+import time
+import zlib
+
+# the codec used for a request/response body, if any
+COMPRESSION_HEADER = "Syft-Content-Compression"
+# comma separated codecs the sender of a request can decompress
+ACCEPT_COMPRESSION_HEADER = "Syft-Accept-Compression"
+
+# payloads smaller than this are sent as is
+COMPRESSION_MIN_SIZE = int(os.getenv("SYFT_COMPRESSION_MIN_SIZE", 64 * 1024))
+COMPRESSION_ENABLED = os.getenv("SYFT_COMPRESSION_ENABLED", "true").lower() == "true"
+# largest payload the server decompresses a request body to
+MAX_DECOMPRESSED_SIZE = int(os.getenv("SYFT_MAX_DECOMPRESSED_SIZE", 1024**3))
+
+
+class UnsupportedCompressionError(ValueError):
+    pass
+
+
+class DecompressionError(ValueError):
+    """A payload that is corrupt or decompresses to more than allowed."""
+
+
+# compress(data) and decompress(data, max_size), unbounded when max_size is None
+Codec = tuple[Callable[[bytes], bytes], Callable[[bytes, int | None], bytes]]
+
+# ordered by preference
+_CODECS: dict[str, Codec] = {}
+
+
+def _check_decompressed(decompressed: bytes, eof: bool, max_size: int | None) -> None:
+    if max_size is not None and len(decompressed) > max_size:
+        raise DecompressionError(f"Payload decompresses to over {max_size} bytes")
+    if not eof:
+        raise DecompressionError("Payload is truncated")
+
+
+def _zlib_decompress(data: bytes, max_size: int | None) -> bytes:
+    decompressor = zlib.decompressobj()
+    max_length = 0 if max_size is None else max_size + 1
+    decompressed = decompressor.decompress(data, max_length)
+    _check_decompressed(decompressed, decompressor.eof, max_size)
+    return decompressed
+
+
+try:
+    # third party
+    import zstandard
+
+    def _zstd_decompress(data: bytes, max_size: int | None) -> bytes:
+        decompressor = zstandard.ZstdDecompressor()
+        if max_size is None:
+            return decompressor.decompress(data)
+        content_size = zstandard.get_frame_parameters(data).content_size
+        if content_size == zstandard.CONTENTSIZE_UNKNOWN:
+            # fails once the output would be larger
+            return decompressor.decompress(data, max_output_size=max_size)
+        if content_size > max_size:
+            raise DecompressionError(f"Payload decompresses to over {max_size} bytes")
+        return decompressor.decompress(data)
+
+    _CODECS["zstd"] = (
+        lambda data: zstandard.ZstdCompressor(level=3).compress(data),
+        _zstd_decompress,
+    )
+except ImportError:  # nosec
+    pass
+
+try:
+    # third party
+    import lz4.frame
+
+    def _lz4_decompress(data: bytes, max_size: int | None) -> bytes:
+        decompressor = lz4.frame.LZ4FrameDecompressor()
+        max_length = -1 if max_size is None else max_size + 1
+        decompressed = decompressor.decompress(data, max_length=max_length)
+        _check_decompressed(decompressed, decompressor.eof, max_size)
+        return decompressed
+
+    _CODECS["lz4"] = (lz4.frame.compress, _lz4_decompress)
+except ImportError:  # nosec
+    pass
+
+_CODECS["zlib"] = (lambda data: zlib.compress(data, 1), _zlib_decompress)
+
+
+@dataclass
+class CompressionStats:
+    compressed_calls: int = 0
+    skipped_calls: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    compress_seconds: float = 0.0
+    decompress_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def ratio(self) -> float:
+        """Uncompressed over compressed size of everything compressed so far."""
+        if self.bytes_out == 0:
+            return 1.0
+        return self.bytes_in / self.bytes_out
+
+    def record_compress(self, size_in: int, size_out: int, seconds: float) -> None:
+        with self._lock:
+            self.compressed_calls += 1
+            self.bytes_in += size_in
+            self.bytes_out += size_out
+            self.compress_seconds += seconds
+
+    def record_skip(self) -> None:
+        with self._lock:
+            self.skipped_calls += 1
+
+    def record_decompress(self, seconds: float) -> None:
+        with self._lock:
+            self.decompress_seconds += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self.compressed_calls = self.skipped_calls = 0
+            self.bytes_in = self.bytes_out = 0
+            self.compress_seconds = self.decompress_seconds = 0.0
+
+
+compression_stats = CompressionStats()
+
+
+def supported_compressions() -> list[str]:
+    if not COMPRESSION_ENABLED:
+        return []
+    return list(_CODECS.keys())
+
+
+def choose_compression(offered: Iterable[str] | None) -> str | None:
+    """Pick our most preferred codec the other side also supports."""
+    if not offered:
+        return None
+    offered_set = {codec.strip() for codec in offered}
+    for codec in supported_compressions():
+        if codec in offered_set:
+            return codec
+    return None
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    if codec not in _CODECS:
+        raise UnsupportedCompressionError(f"Unsupported compression: {codec}")
+    start = time.perf_counter()
+    compressed = _CODECS[codec][0](data)
+    compression_stats.record_compress(
+        len(data), len(compressed), time.perf_counter() - start
+    )
+    return compressed
+
+
+def decompress(data: bytes, codec: str, max_size: int | None = None) -> bytes:
+    """Decompress data with codec, to at most `max_size` bytes if given.
+
+    Raises UnsupportedCompressionError for unknown codecs and DecompressionError
+    for corrupt payloads and those larger than `max_size` once decompressed.
+    """
+    if codec not in _CODECS:
+        raise UnsupportedCompressionError(f"Unsupported compression: {codec}")
+    start = time.perf_counter()
+    try:
+        decompressed = _CODECS[codec][1](data, max_size)
+    except DecompressionError:
+        raise
+    except Exception as e:
+        raise DecompressionError(f"Cannot decompress {codec} payload: {e}") from e
+    compression_stats.record_decompress(time.perf_counter() - start)
+    return decompressed
+
+
+def maybe_compress(
+    data: bytes, codec: str | None, min_size: int = COMPRESSION_MIN_SIZE
+) -> tuple[bytes, str | None]:
+    """Compress data with codec when it is large enough to be worth it.
+
+    Returns the payload to send and the codec used, None if it was sent as is.
+    """
+    if codec is None or len(data) < min_size:
+        return data, None
+
+    compressed = compress(data, codec)
+    if len(compressed) >= len(data):
+        compression_stats.record_skip()
+        return data, None
+    return compressed, codec
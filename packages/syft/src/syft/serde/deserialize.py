@@ -1,9 +1,15 @@
 # stdlib
+from collections.abc import Collection
+import struct
 from typing import Any
+from typing import IO
 
 # third party
 from capnp.lib.capnp import _DynamicStructBuilder
 
+# relative
+from .serialize import STREAM_BUFFER_SIZE
+
 
 def _deserialize(
     blob: Any,
@@ -30,3 +36,54 @@ def _deserialize(
 
     if from_proto:
         return rs_proto2object(blob)
+
+
+def _deserialize_fields(blob: bytes, names: Collection[str]) -> dict[str, Any]:
+    """Decode only the fields `names` of the object serialized in `blob`."""
+    # relative
+    from .recursive import rs_bytes2fields
+
+    return rs_bytes2fields(blob, names)
+
+
+def _read_exactly(reader: IO[bytes], size: int) -> bytes:
+    data = reader.read(size)
+    if len(data) != size:
+        raise EOFError(
+            f"Unexpected end of stream, expected {size} bytes got {len(data)}."
+        )
+    return data
+
+
+def _deserialize_from(reader: IO[bytes]) -> Any:
+    """Read a single serialized message from a binary file-like object.
+
+    Only the bytes of that message are consumed, so several messages written with
+    `_serialize_to` can be read back one after another from the same stream.
+    """
+    # relative
+    from .recursive import rs_bytes2object
+
+    # capnp stream framing: segment count - 1, the size of each segment in
+    # words, padded to a full word
+    segment_count = struct.unpack("<I", _read_exactly(reader, 4))[0] + 1
+    header_size = 4 * segment_count + (4 if segment_count % 2 == 0 else 0)
+    header = _read_exactly(reader, header_size)
+    segment_sizes = struct.unpack(f"<{segment_count}I", header[: 4 * segment_count])
+
+    blob = bytearray(4 + header_size + 8 * sum(segment_sizes))
+    view = memoryview(blob)
+    view[0:4] = struct.pack("<I", segment_count - 1)
+    view[4 : 4 + header_size] = header
+    offset = 4 + header_size
+    while offset < len(blob):
+        chunk = reader.read(min(len(blob) - offset, STREAM_BUFFER_SIZE))
+        if not chunk:
+            raise EOFError(
+                f"Unexpected end of stream, expected {len(blob) - offset} more bytes."
+            )
+        view[offset : offset + len(chunk)] = chunk
+        offset += len(chunk)
+    del view
+
+    return rs_bytes2object(blob)
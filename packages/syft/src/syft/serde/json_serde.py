@@ -26,7 +26,12 @@ from ..types.syft_object import BaseDateTime
 from ..types.syft_object_registry import SyftObjectRegistry
 from ..types.uid import LineageID
 from ..types.uid import UID
+from .lazy import JSON_ENCODING
+from .lazy import LazyValue
+from .lazy import get_unresolved
 from .recursive import DEFAULT_EXCLUDE_ATTRS
+from .recursive import construct_unvalidated
+from .recursive import get_deserialize_plan
 
 T = TypeVar("T")
 
@@ -58,6 +63,19 @@ class JSONSerde(Generic[T]):
 JSON_SERDE_REGISTRY: dict[type[T], JSONSerde[T]] = {}
 
 
+# Compiled serializers and deserializers, keyed by type annotation. Resolving an
+# annotation (unwrapping Optional, registry lookups, subclass checks) happens
+# once, when it is first seen.
+_SERIALIZER_CACHE: dict[Any, Callable[[Any], Json]] = {}
+_DESERIALIZER_CACHE: dict[tuple[Any, bool], Callable[[Json], Any]] = {}
+
+
+def _clear_compiled_serde_cache() -> None:
+    _SERIALIZER_CACHE.clear()
+    _DESERIALIZER_CACHE.clear()
+    SyftObjectRegistry.clear_serde_plan_cache()
+
+
 def register_json_serde(
     type_: type[T],
     serialize: Callable[[T], Json] | None = None,
@@ -77,6 +95,7 @@ def register_json_serde(
         serialize_fn=serialize,
         deserialize_fn=deserialize,
     )
+    _clear_compiled_serde_cache()
 
 
 # Standard JSON primitives
@@ -158,96 +177,169 @@ def _annotation_issubclass(annotation: Any, cls: type) -> bool:
         return False
 
 
-def _serialize_pydantic_to_json(obj: pydantic.BaseModel) -> dict[str, Json]:
-    canonical_name, version = SyftObjectRegistry.get_canonical_name_version(obj)
-    serde_attributes = SyftObjectRegistry.get_serde_properties(canonical_name, version)
-    exclude_attrs = serde_attributes[4]
+def get_property_return_type(obj: Any, attr_name: str) -> Any:
+    """
+    Get the return type annotation of a @property.
+    """
+    cls = obj if isinstance(obj, type) else type(obj)
+    attr = getattr(cls, attr_name, None)
+
+    if isinstance(attr, property):
+        return attr.fget.__annotations__.get("return", None)
+
+    return None
 
-    result: dict[str, Json] = {
-        JSON_CANONICAL_NAME_FIELD: canonical_name,
-        JSON_VERSION_FIELD: version,
-    }
 
+@dataclass
+class JSONSerializePlan:
+    """Field handlers for serializing one pydantic class, built once per class."""
+
+    canonical_name: str
+    version: int
+    # (field name, serializer) for every serialized field, in model_fields order
+    fields: list[tuple[str, Callable[[Any], Json]]]
+    # searchable and unique attributes that are not fields, like @property
+    extra_attrs: list[tuple[str, Callable[[Any], Json]]]
+    lazy_fields: frozenset[str]
+
+
+@dataclass
+class JSONDeserializePlan:
+    """Field handlers for deserializing one (canonical_name, version), built once."""
+
+    cls: type[pydantic.BaseModel]
+    fields: list[tuple[str, Callable[[Json], Any]]]
+    # same fields, with nested objects built without validation as well
+    trusted_fields: list[tuple[str, Callable[[Json], Any]]]
+    lazy_fields: frozenset[str]
+    # only the latest version of a class can skip validation, older versions
+    # are validated in full
+    is_latest_version: bool
+
+
+def _build_serialize_plan(obj: pydantic.BaseModel) -> JSONSerializePlan:
+    cls = type(obj)
+    canonical_name, version = SyftObjectRegistry.get_canonical_name_version(obj)
+    exclude_attrs = SyftObjectRegistry.get_serde_properties(canonical_name, version)[4]
     all_exclude_attrs = set(exclude_attrs) | DEFAULT_EXCLUDE_ATTRS
 
-    for key, type_ in obj.model_fields.items():
-        if key in all_exclude_attrs:
-            continue
-        result[key] = serialize_json(getattr(obj, key), type_.annotation)
+    fields = [
+        (key, _get_serializer(field_info.annotation))
+        for key, field_info in cls.model_fields.items()
+        if key not in all_exclude_attrs
+    ]
+
+    # Add searchable attrs and unique attrs, if they are not already present.
+    # Needed for adding non-field attributes (like @property)
+    searchable_attrs: list[str] = getattr(cls, "__attr_searchable__", [])
+    unique_attrs: list[str] = getattr(cls, "__attr_unique__", [])
+    field_names = {key for key, _ in fields}
+    extra_attrs = [
+        (attr, _get_serializer(get_property_return_type(cls, attr)))
+        for attr in set(searchable_attrs) | set(unique_attrs)
+        if attr not in field_names
+    ]
+
+    return JSONSerializePlan(
+        canonical_name=canonical_name,
+        version=version,
+        fields=fields,
+        extra_attrs=extra_attrs,
+        lazy_fields=get_deserialize_plan(canonical_name, version).lazy_fields,
+    )
 
-    result = _add_searchable_and_unique_attrs(obj, result, raise_errors=False)
 
-    return result
+def _build_deserialize_plan(canonical_name: str, version: int) -> JSONDeserializePlan:
+    cls = SyftObjectRegistry.get_serde_class(canonical_name, version)
+    return JSONDeserializePlan(
+        cls=cls,
+        fields=[
+            (key, _get_deserializer(field_info.annotation))
+            for key, field_info in cls.model_fields.items()
+        ],
+        trusted_fields=[
+            (key, _get_deserializer(field_info.annotation, trusted=True))
+            for key, field_info in cls.model_fields.items()
+        ],
+        lazy_fields=get_deserialize_plan(canonical_name, version).lazy_fields,
+        is_latest_version=(
+            version == SyftObjectRegistry.get_latest_version(canonical_name)
+        ),
+    )
 
 
-def get_property_return_type(obj: Any, attr_name: str) -> Any:
-    """
-    Get the return type annotation of a @property.
-    """
+def get_json_serialize_plan(obj: pydantic.BaseModel) -> JSONSerializePlan:
     cls = type(obj)
-    attr = getattr(cls, attr_name, None)
+    plan = SyftObjectRegistry.__json_serialize_plan_cache__.get(cls, None)
+    if plan is None:
+        plan = _build_serialize_plan(obj)
+        SyftObjectRegistry.__json_serialize_plan_cache__[cls] = plan
+    return plan
 
-    if isinstance(attr, property):
-        return attr.fget.__annotations__.get("return", None)
 
-    return None
+def get_json_deserialize_plan(canonical_name: str, version: int) -> JSONDeserializePlan:
+    key = (canonical_name, version)
+    plan = SyftObjectRegistry.__json_deserialize_plan_cache__.get(key, None)
+    if plan is None:
+        plan = _build_deserialize_plan(canonical_name, version)
+        SyftObjectRegistry.__json_deserialize_plan_cache__[key] = plan
+    return plan
 
 
-def _add_searchable_and_unique_attrs(
-    obj: pydantic.BaseModel, obj_dict: dict[str, Json], raise_errors: bool = True
-) -> dict[str, Json]:
-    """
-    Add searchable attrs and unique attrs to the serialized object dict, if they are not already present.
-    Needed for adding non-field attributes (like @property)
+def _serialize_pydantic_to_json(obj: pydantic.BaseModel) -> dict[str, Json]:
+    plan = get_json_serialize_plan(obj)
 
-    Args:
-        obj (pydantic.BaseModel): Object to serialize.
-        obj_dict (dict[str, Json]): Serialized object dict. Should contain the object's fields.
-        raise_errors (bool, optional): Raise errors if an attribute cannot be accessed.
-            If False, the attribute will be skipped. Defaults to True.
+    result: dict[str, Json] = {
+        JSON_CANONICAL_NAME_FIELD: plan.canonical_name,
+        JSON_VERSION_FIELD: plan.version,
+    }
 
-    Raises:
-        Exception: Any exception raised when accessing an attribute.
+    for key, serializer in plan.fields:
+        if key in plan.lazy_fields:
+            lazy_value = get_unresolved(obj, key)
+            if lazy_value is not None and lazy_value.encoding == JSON_ENCODING:
+                # never read since it was deserialized, write it back as is
+                result[key] = lazy_value.data
+                continue
+        result[key] = serializer(getattr(obj, key))
 
-    Returns:
-        dict[str, Json]: Serialized object dict including searchable attributes.
-    """
-    searchable_attrs: list[str] = getattr(obj, "__attr_searchable__", [])
-    unique_attrs: list[str] = getattr(obj, "__attr_unique__", [])
-
-    attrs_to_add = set(searchable_attrs) | set(unique_attrs)
-    for attr in attrs_to_add:
-        if attr not in obj_dict:
-            try:
-                value = getattr(obj, attr)
-            except Exception as e:
-                if raise_errors:
-                    raise e
-                else:
-                    continue
-            property_annotation = get_property_return_type(obj, attr)
-            obj_dict[attr] = serialize_json(
-                value, validate=False, annotation=property_annotation
-            )
-
-    return obj_dict
+    for attr, serializer in plan.extra_attrs:
+        try:
+            value = getattr(obj, attr)
+        except Exception:  # nosec
+            continue
+        result[attr] = serializer(value)
+
+    return result
 
 
 def _deserialize_pydantic_from_json(
-    obj_dict: dict[str, Json],
+    obj_dict: dict[str, Json], trusted: bool = False
 ) -> pydantic.BaseModel:
     try:
-        canonical_name = obj_dict[JSON_CANONICAL_NAME_FIELD]
-        version = obj_dict[JSON_VERSION_FIELD]
-        obj_type = SyftObjectRegistry.get_serde_class(canonical_name, version)
+        plan = get_json_deserialize_plan(
+            obj_dict[JSON_CANONICAL_NAME_FIELD],  # type: ignore[arg-type]
+            obj_dict[JSON_VERSION_FIELD],  # type: ignore[arg-type]
+        )
+        trusted = trusted and plan.is_latest_version
+        # only trusted data, like rows loaded from the database, keeps lazy fields
+        lazy_fields = plan.lazy_fields if trusted else frozenset()
 
         result = {}
-        for key, type_ in obj_type.model_fields.items():
+        for key, deserializer in plan.trusted_fields if trusted else plan.fields:
             if key not in obj_dict:
                 continue
-            result[key] = deserialize_json(obj_dict[key], type_.annotation)
+            value = obj_dict[key]
+            if key in lazy_fields and value is not None:
+                result[key] = LazyValue(value, deserializer, JSON_ENCODING)
+                continue
+            result[key] = deserializer(value)
 
-        return obj_type.model_validate(result)
+        if trusted:
+            # trusted data was already validated when the object was serialized,
+            # and lazy values can't be validated
+            return construct_unvalidated(plan.cls, result)
+        return plan.cls.model_validate(result)
     except Exception as e:
         print(f"Failed to deserialize Pydantic model: {e}")
         print(json.dumps(obj_dict, indent=2))
@@ -273,24 +365,6 @@ def _is_serializable_iterable(annotation: Any) -> bool:
     )
 
 
-def _serialize_iterable_to_json(value: Any, annotation: Any) -> Json:
-    # No need to validate in recursive calls
-    return [serialize_json(v, validate=False) for v in value]
-
-
-def _deserialize_iterable_from_json(value: Json, annotation: Any) -> Any:
-    if not isinstance(value, list):
-        raise ValueError(f"Cannot deserialize {type(value)} to {annotation}")
-
-    annotation = _unwrap_type_annotation(annotation)
-
-    if not _is_serializable_iterable(annotation):
-        raise ValueError(f"Cannot deserialize {annotation} from JSON")
-
-    inner_type = _unwrap_type_annotation(get_args(annotation)[0])
-    return [deserialize_json(v, inner_type) for v in value]
-
-
 def _is_serializable_mapping(annotation: Any) -> bool:
     """
     Mapping is serializable if:
@@ -317,33 +391,175 @@ def _is_serializable_mapping(annotation: Any) -> bool:
     )
 
 
-def _serialize_mapping_to_json(value: Any, annotation: Any) -> Json:
-    _, value_type = get_args(annotation)
-    # No need to validate in recursive calls
-    return {k: serialize_json(v, value_type, validate=False) for k, v in value.items()}
+def _serialize_to_json_bytes(obj: Any) -> str:
+    obj_bytes = sy.serialize(obj, to_bytes=True)
+    return base64.b64encode(obj_bytes).decode("utf-8")
+
+
+def _deserialize_from_json_bytes(obj: str) -> Any:
+    obj_bytes = base64.b64decode(obj)
+    return sy.deserialize(obj_bytes, from_bytes=True)
 
 
-def _deserialize_mapping_from_json(value: Json, annotation: Any) -> Any:
-    if not isinstance(value, dict):
-        raise ValueError(f"Cannot deserialize {type(value)} to {annotation}")
+def _serialize_by_type(value: Any) -> Json:
+    # values without an annotation are serialized according to their own type
+    return _get_serializer(type(value))(value)
 
+
+def _get_serializer(annotation: Any) -> Callable[[Any], Json]:
+    if annotation is None:
+        return _serialize_by_type
+    try:
+        serializer = _SERIALIZER_CACHE.get(annotation, None)
+    except TypeError:
+        # unhashable annotation
+        return _compile_serializer(annotation)
+    if serializer is None:
+        serializer = _compile_serializer(annotation)
+        _SERIALIZER_CACHE[annotation] = serializer
+    return serializer
+
+
+def _serialize_none(value: Any) -> Json:
+    return None
+
+
+def _compile_serializer(annotation: Any) -> Callable[[Any], Json]:
+    if annotation is type(None):
+        return _serialize_none
+
+    # Remove None type from annotation if it is present.
     annotation = _unwrap_type_annotation(annotation)
 
-    if not _is_serializable_mapping(annotation):
-        raise ValueError(f"Cannot deserialize {annotation} from JSON")
+    serialize_fn: Callable[[Any], Json]
+    if annotation in JSON_SERDE_REGISTRY:
+        serialize_fn = JSON_SERDE_REGISTRY[annotation].serialize_fn
+    elif _annotation_issubclass(annotation, pydantic.BaseModel):
+        serialize_fn = _serialize_pydantic_to_json
+    elif _annotation_issubclass(annotation, Enum):
+
+        def serialize_fn(value: Any) -> Json:
+            return value.name
+
+    # JSON recursive types
+    # only strictly annotated iterables and mappings are supported
+    # example: list[int] is supported, but not list[int | str]
+    elif _is_serializable_iterable(annotation):
+
+        def serialize_fn(value: Any) -> Json:
+            return [_serialize_by_type(v) for v in value]
 
-    _, value_type = get_args(annotation)
-    return {k: deserialize_json(v, value_type) for k, v in value.items()}
+    elif _is_serializable_mapping(annotation):
+        value_serializer = _get_serializer(get_args(annotation)[1])
 
+        def serialize_fn(value: Any) -> Json:
+            return {k: value_serializer(v) for k, v in value.items()}
 
-def _serialize_to_json_bytes(obj: Any) -> str:
-    obj_bytes = sy.serialize(obj, to_bytes=True)
-    return base64.b64encode(obj_bytes).decode("utf-8")
+    else:
+        serialize_fn = _serialize_to_json_bytes
 
+    def serialize(value: Any) -> Json:
+        if value is None:
+            return None
+        return serialize_fn(value)
+
+    return serialize
+
+
+def _deserialize_trusted_pydantic_from_json(
+    obj_dict: dict[str, Json],
+) -> pydantic.BaseModel:
+    return _deserialize_pydantic_from_json(obj_dict, trusted=True)
 
-def _deserialize_from_json_bytes(obj: str) -> Any:
-    obj_bytes = base64.b64decode(obj)
-    return sy.deserialize(obj_bytes, from_bytes=True)
+
+def _get_deserializer(annotation: Any, trusted: bool = False) -> Callable[[Json], Any]:
+    key = (annotation, trusted)
+    try:
+        deserializer = _DESERIALIZER_CACHE.get(key, None)
+    except TypeError:
+        # unhashable annotation
+        return _compile_deserializer(annotation, trusted)
+    if deserializer is None:
+        deserializer = _compile_deserializer(annotation, trusted)
+        _DESERIALIZER_CACHE[key] = deserializer
+    return deserializer
+
+
+def _compile_deserializer(
+    annotation: Any, trusted: bool = False
+) -> Callable[[Json], Any]:
+    deserialize_pydantic: Callable[..., Any]
+    if trusted:
+        deserialize_pydantic = _deserialize_trusted_pydantic_from_json
+    else:
+        deserialize_pydantic = _deserialize_pydantic_from_json
+
+    deserialize_fn: Callable[[Any], Any]
+    if annotation is None or annotation is type(None):
+
+        def deserialize_fn(value: Any) -> Any:
+            raise ValueError("Annotation is required for deserialization")
+
+    else:
+        # Remove None type from annotation if it is present.
+        annotation = _unwrap_type_annotation(annotation)
+
+        if annotation in JSON_SERDE_REGISTRY:
+            deserialize_fn = JSON_SERDE_REGISTRY[annotation].deserialize_fn
+        elif _annotation_issubclass(annotation, pydantic.BaseModel):
+            deserialize_fn = deserialize_pydantic
+        elif _annotation_issubclass(annotation, Enum):
+
+            def deserialize_fn(value: Any) -> Any:
+                return annotation[value]
+
+        else:
+            deserialize_fn = _compile_container_deserializer(annotation, trusted)
+
+    def deserialize(value: Json) -> Any:
+        if (
+            isinstance(value, dict)
+            and JSON_CANONICAL_NAME_FIELD in value
+            and JSON_VERSION_FIELD in value
+        ):
+            return deserialize_pydantic(value)
+
+        if value is None:
+            return None
+
+        return deserialize_fn(value)
+
+    return deserialize
+
+
+def _compile_container_deserializer(
+    annotation: Any, trusted: bool
+) -> Callable[[Json], Any]:
+    iterable_deserializer = None
+    if _is_serializable_iterable(annotation):
+        iterable_deserializer = _get_deserializer(
+            _unwrap_type_annotation(get_args(annotation)[0]), trusted
+        )
+
+    mapping_deserializer = None
+    if _is_serializable_mapping(annotation):
+        mapping_deserializer = _get_deserializer(get_args(annotation)[1], trusted)
+
+    def deserialize(value: Json) -> Any:
+        if isinstance(value, list):
+            if iterable_deserializer is None:
+                raise ValueError(f"Cannot deserialize {annotation} from JSON")
+            return [iterable_deserializer(v) for v in value]
+        elif isinstance(value, dict):
+            if mapping_deserializer is None:
+                raise ValueError(f"Cannot deserialize {annotation} from JSON")
+            return {k: mapping_deserializer(v) for k, v in value.items()}
+        elif isinstance(value, str):
+            return _deserialize_from_json_bytes(value)
+        else:
+            raise ValueError(f"Cannot deserialize {value} to {annotation}")
+
+    return deserialize
 
 
 def serialize_json(value: Any, annotation: Any = None, validate: bool = True) -> Json:
@@ -365,6 +581,9 @@ def serialize_json(value: Any, annotation: Any = None, validate: bool = True) ->
     4. Mapping serialization, if the annotation is a strictly typed mapping with string keys.
     5. Serialize the object to bytes and encode it as base64.
 
+    The choice is made once per annotation and per pydantic class, later calls reuse
+    the compiled serializer.
+
     Args:
         value (Any): Value to serialize.
         annotation (Any, optional): Type annotation for the value. Defaults to None.
@@ -375,28 +594,7 @@ def serialize_json(value: Any, annotation: Any = None, validate: bool = True) ->
     if annotation is None:
         annotation = type(value)
 
-    if value is None:
-        return None
-
-    # Remove None type from annotation if it is present.
-    annotation = _unwrap_type_annotation(annotation)
-
-    if annotation in JSON_SERDE_REGISTRY:
-        result = JSON_SERDE_REGISTRY[annotation].serialize(value)
-    elif _annotation_issubclass(annotation, pydantic.BaseModel):
-        result = _serialize_pydantic_to_json(value)
-    elif _annotation_issubclass(annotation, Enum):
-        result = value.name
-
-    # JSON recursive types
-    # only strictly annotated iterables and mappings are supported
-    # example: list[int] is supported, but not list[int | str]
-    elif _is_serializable_iterable(annotation):
-        result = _serialize_iterable_to_json(value, annotation)
-    elif _is_serializable_mapping(annotation):
-        result = _serialize_mapping_to_json(value, annotation)
-    else:
-        result = _serialize_to_json_bytes(value)
+    result = _get_serializer(annotation)(value)
 
     if validate:
         _validate_json(result)
@@ -404,47 +602,24 @@ def serialize_json(value: Any, annotation: Any = None, validate: bool = True) ->
     return result
 
 
-def deserialize_json(value: Json, annotation: Any = None) -> Any:
+def deserialize_json(value: Json, annotation: Any = None, trusted: bool = False) -> Any:
     """Deserialize a JSON-serializable object to a value, using the schema defined by the
     provided annotation. Inverse of `serialize_json`.
 
     Args:
         value (Json): JSON-serializable object.
         annotation (Any): Type annotation for the value.
+        trusted (bool, optional): The value was written by the server after it was
+            validated, like a row loaded from the database. Pydantic models stored at
+            the latest version of their class are built with `model_construct`,
+            skipping validation, and their lazy fields are only decoded when read.
+            Never use this for data coming from clients.
+            Defaults to False.
 
     Returns:
         Any: Deserialized value.
     """
-    if (
-        isinstance(value, dict)
-        and JSON_CANONICAL_NAME_FIELD in value
-        and JSON_VERSION_FIELD in value
-    ):
-        return _deserialize_pydantic_from_json(value)
-
-    if value is None:
-        return None
-
-    # Remove None type from annotation if it is present.
-    if annotation is None:
-        raise ValueError("Annotation is required for deserialization")
-
-    annotation = _unwrap_type_annotation(annotation)
-
-    if annotation in JSON_SERDE_REGISTRY:
-        return JSON_SERDE_REGISTRY[annotation].deserialize(value)
-    elif _annotation_issubclass(annotation, pydantic.BaseModel):
-        return _deserialize_pydantic_from_json(value)
-    elif _annotation_issubclass(annotation, Enum):
-        return annotation[value]
-    elif isinstance(value, list):
-        return _deserialize_iterable_from_json(value, annotation)
-    elif isinstance(value, dict):
-        return _deserialize_mapping_from_json(value, annotation)
-    elif isinstance(value, str):
-        return _deserialize_from_json_bytes(value)
-    else:
-        raise ValueError(f"Cannot deserialize {value} to {annotation}")
+    return _get_deserializer(annotation, trusted)(value)
 
 
 def is_json_primitive(value: Any) -> bool:
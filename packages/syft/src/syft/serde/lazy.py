@@ -0,0 +1,152 @@
+# stdlib
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+import os
+import threading
+from typing import Any
+
+# third party
+import pydantic
+
+# set to false to always decode every field while deserializing
+LAZY_FIELDS_ENABLED = os.getenv("SYFT_LAZY_FIELDS_ENABLED", "true").lower() == "true"
+
+# encodings a LazyValue can hold, used to write the data back out without decoding
+CAPNP_ENCODING = "capnp"
+JSON_ENCODING = "json"
+
+_UNRESOLVED = object()
+
+
+class LazyValue:
+    """An undecoded field value, decoded the first time it is read.
+
+    Classes list the fields that are expensive to decode and rarely read in
+    `__lazy_attrs__`. While deserializing trusted data, see `use_lazy_fields`,
+    those fields are stored as a LazyValue and a `LazyAttribute` descriptor on
+    the class swaps in the decoded value on first access.
+    """
+
+    __slots__ = ("data", "decode", "encoding", "type_table_id", "_value")
+
+    def __init__(
+        self,
+        data: Any,
+        decode: Callable[[Any], Any],
+        encoding: str,
+        type_table_id: str | None = None,
+    ) -> None:
+        self.data = data
+        self.decode = decode
+        self.encoding = encoding
+        # the type table the data was encoded with, see syft.serde.type_ids
+        self.type_table_id = type_table_id
+        self._value = _UNRESOLVED
+
+    def resolve(self) -> Any:
+        if self._value is _UNRESOLVED:
+            self._value = self.decode(self.data)
+        return self._value
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyValue):
+            other = other.resolve()
+        return self.resolve() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self.resolve())
+
+
+class LazyAttribute:
+    """Data descriptor that resolves a LazyValue stored in the instance __dict__."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        try:
+            value = obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+        if type(value) is LazyValue:
+            value = value.resolve()
+            obj.__dict__[self.name] = value
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.name] = value
+
+
+def install_lazy_attrs(cls: type) -> frozenset[str]:
+    """Install a LazyAttribute for every name in `cls.__lazy_attrs__`."""
+    lazy_attrs = frozenset(getattr(cls, "__lazy_attrs__", []))
+    for name in lazy_attrs:
+        if not isinstance(cls.__dict__.get(name), LazyAttribute):
+            setattr(cls, name, LazyAttribute(name))
+    return lazy_attrs
+
+
+def get_unresolved(obj: Any, name: str) -> LazyValue | None:
+    """The LazyValue of a field that has not been read yet, if any."""
+    value = obj.__dict__.get(name, None)
+    return value if type(value) is LazyValue else None
+
+
+def resolve_lazy_values(obj: Any) -> None:
+    """Decode the lazy fields of `obj` and of the models nested in it.
+
+    For code reading the fields of a model without its attributes, like
+    pydantic's `model_dump`.
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, list | tuple | set | frozenset):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, pydantic.BaseModel):
+            fields = value.__dict__
+            for name, field_value in fields.items():
+                if type(field_value) is LazyValue:
+                    field_value = fields[name] = field_value.resolve()
+                stack.append(field_value)
+
+
+class _LazyState(threading.local):
+    enabled: bool = False
+
+
+_lazy_state = _LazyState()
+
+
+def lazy_fields_enabled() -> bool:
+    """Whether the deserialization running in this thread keeps lazy fields."""
+    return _lazy_state.enabled
+
+
+@contextmanager
+def use_lazy_fields(enabled: bool = True) -> Iterator[None]:
+    """Keep the fields in `__lazy_attrs__` undecoded while deserializing inside
+    this block.
+
+    Objects with lazy fields are built without running their validators, so
+    this is only for data that was validated before it was serialized, like the
+    signed responses of a server. Everything else, like the calls a server
+    receives, is decoded and validated in full.
+    """
+    previous = _lazy_state.enabled
+    _lazy_state.enabled = enabled
+    try:
+        yield
+    finally:
+        _lazy_state.enabled = previous
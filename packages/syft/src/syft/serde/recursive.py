@@ -1,5 +1,7 @@
 # stdlib
 from collections.abc import Callable
+from collections.abc import Collection
+from dataclasses import dataclass
 from enum import Enum
 from enum import EnumMeta
 import os
@@ -11,12 +13,20 @@ from typing import Any
 from capnp.lib.capnp import _DynamicStructBuilder
 from pydantic import BaseModel
 
-# syft absolute
-import syft as sy
-
 # relative
 from ..types.syft_object_registry import SyftObjectRegistry
 from .capnp import get_capnp_schema
+from .lazy import CAPNP_ENCODING
+from .lazy import LAZY_FIELDS_ENABLED
+from .lazy import LazyValue
+from .lazy import get_unresolved
+from .lazy import install_lazy_attrs
+from .lazy import lazy_fields_enabled
+from .serialize import _serialize
+from .type_ids import NO_TYPE_ID
+from .type_ids import get_type_table
+from .type_ids import use_type_ids
+from .type_ids import wire_type_table
 from .util import compatible_with_large_file_writes_capnp
 
 TYPE_BANK = {}  # type: ignore
@@ -26,6 +36,10 @@ recursive_scheme = get_capnp_schema("recursive_serde.capnp").RecursiveSerde
 
 SPOOLED_FILE_MAX_SIZE_SERDE = 50 * (1024**2)  # 50MB
 DEFAULT_EXCLUDE_ATTRS: set[str] = {"syft_pre_hooks__", "syft_post_hooks__"}
+# builtin types that take the serialize_primitive fast path
+PRIMITIVE_TYPES: frozenset[type] = frozenset({int, float, str, bytes, bool, type(None)})
+SMALL_DATA_MAX_SIZE = 1024**2  # 1MB, always fits in a single capnp chunk
+_MISSING = object()
 
 
 def get_types(cls: type, keys: list[str] | None = None) -> list[type] | None:
@@ -163,7 +177,7 @@ def recursive_serde_register(
     _serialize = serialize if nonrecursive else rs_object2proto
     _deserialize = deserialize if nonrecursive else rs_proto2object
     is_pydantic = issubclass(cls, BaseModel)
-    hash_exclude_attrs = getattr(cls, "__hash_exclude_attrs__", [])
+    hash_exclude_attrs = frozenset(getattr(cls, "__hash_exclude_attrs__", []))
 
     if inherit_attrs and not is_pydantic:
         # get attrs from base class
@@ -219,6 +233,8 @@ def recursive_serde_register(
     )
 
     SyftObjectRegistry.register_cls(canonical_name, version, serde_attributes)
+    if is_pydantic:
+        install_lazy_attrs(cls)
 
     alias_fqn = check_fqn_alias(cls)
     if isinstance(alias_fqn, tuple):
@@ -235,6 +251,9 @@ def chunk_bytes(
 ) -> None:
     data = ser_func(field_obj)
     size_of_data = len(data)
+    if size_of_data < SMALL_DATA_MAX_SIZE:
+        builder.init(field_name, 1)[0] = data
+        return
     if compatible_with_large_file_writes_capnp(size_of_data):
         with tempfile.TemporaryFile() as tmp_file:
             # Write data to a file to save RAM
@@ -261,93 +280,272 @@ def chunk_bytes(
 
 
 def combine_bytes(capnp_list: list[bytes]) -> bytes:
-    # TODO: make sure this doesn't copy, perhaps allocate a fixed size buffer
-    # and move the bytes into it as we go
-    bytes_value = b""
-    for value in capnp_list:
-        bytes_value += value
-    return bytes_value
+    if len(capnp_list) == 1:
+        return capnp_list[0]
+    return b"".join(capnp_list)
+
+
+@dataclass
+class SerdePlan:
+    """Serialization metadata of a registered (canonical_name, version),
+    resolved once so the per-object hot path only does attribute lookups."""
+
+    canonical_name: str
+    version: int
+    nonrecursive: bool
+    serialize: Callable | None
+    deserialize: Callable | None
+    cls: type
+    # sorted field names, None when the fields are taken from __dict__
+    fields: tuple[str, ...] | None
+    hash_fields: tuple[str, ...] | None
+    exclude_attrs: frozenset[str]
+    hash_exclude_attrs: frozenset[str]
+    serde_overrides: dict[str, tuple[Callable, Callable]]
+    has_serde_constructor: bool
+    is_enum: bool
+    is_pydantic: bool
+    # fields kept as a LazyValue until first read, see syft.serde.lazy
+    lazy_fields: frozenset[str]
+    # (canonical_name, version), the key of the type in the type id table
+    type_key: tuple[str, int]
+
+    def get_fields(self, obj: Any, for_hashing: bool) -> tuple[str, ...]:
+        fields = self.hash_fields if for_hashing else self.fields
+        if fields is not None:
+            return fields
+        excluded = self.exclude_attrs
+        if for_hashing:
+            excluded = excluded | self.hash_exclude_attrs
+        return tuple(sorted(set(obj.__dict__.keys()) - excluded))
+
+    def construct(self, kwargs: dict[str, Any]) -> Any:
+        class_type = self.cls
+        if self.has_serde_constructor:
+            return class_type.serde_constructor(kwargs)  # type: ignore
+
+        if self.is_enum and "value" in kwargs:
+            return class_type.__new__(class_type, kwargs["value"])  # type: ignore
+        if self.is_pydantic:
+            if self.lazy_fields and any(
+                type(kwargs.get(name)) is LazyValue for name in self.lazy_fields
+            ):
+                # lazy values can't be validated, they are only made from data
+                # validated before it was serialized, see use_lazy_fields
+                return construct_unvalidated(class_type, kwargs)
+            # if we skip the __new__ flow of BaseModel we get the error
+            # AttributeError: object has no attribute '__fields_set__'
+            return class_type(**kwargs)
 
+        obj = class_type.__new__(class_type)  # type: ignore
+        for attr_name, attr_value in kwargs.items():
+            setattr(obj, attr_name, attr_value)
+        return obj
 
-def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuilder:
-    # relative
-    from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
-
-    is_type = False
-    if isinstance(self, type):
-        is_type = True
 
-    msg = recursive_scheme.new_message()
+def construct_unvalidated(cls: type[BaseModel], kwargs: dict[str, Any]) -> Any:
+    """Build a pydantic object from validated data without running its validators,
+    with the same setup of private attributes as SyftObject.__init__."""
+    obj = cls.model_construct(**kwargs)
+    if hasattr(obj, "_syft_set_validate_private_attrs_"):
+        obj._syft_set_validate_private_attrs_(**kwargs)
+        obj.__post_init__()
+    return obj
 
-    # todo: rewrite and make sure every object has a canonical name and version
-    canonical_name, version = SyftObjectRegistry.get_canonical_name_version(self)
 
-    if not SyftObjectRegistry.has_serde_class(canonical_name, version):
-        # third party
-        raise Exception(
-            f"obj2proto: {canonical_name} version {version} not in SyftObjectRegistry"
-        )
-
-    msg.canonicalName = canonical_name
-    msg.version = version
+def build_serde_plan(canonical_name: str, version: int) -> SerdePlan:
+    # relative
+    from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
 
     (
         nonrecursive,
         serialize,
-        _,
+        deserialize,
         attribute_list,
         exclude_attrs_list,
         serde_overrides,
         hash_exclude_attrs,
-        _,
+        cls,
         _,
         _,
     ) = SyftObjectRegistry.get_serde_properties(canonical_name, version)
 
-    if nonrecursive or is_type:
-        if serialize is None:
+    exclude_attrs = frozenset(exclude_attrs_list or [])
+    hash_exclude = frozenset(hash_exclude_attrs or []) | frozenset(
+        DYNAMIC_SYFT_ATTRIBUTES
+    )
+
+    is_pydantic = isinstance(cls, type) and issubclass(cls, BaseModel)
+    lazy_fields: frozenset[str] = frozenset()
+    if is_pydantic and LAZY_FIELDS_ENABLED:
+        lazy_fields = frozenset(getattr(cls, "__lazy_attrs__", [])) - frozenset(
+            serde_overrides
+        )
+
+    fields = hash_fields = None
+    if attribute_list is not None:
+        fields = tuple(sorted(set(attribute_list) - exclude_attrs))
+        hash_fields = tuple(f for f in fields if f not in hash_exclude)
+
+    return SerdePlan(
+        canonical_name=canonical_name,
+        version=version,
+        nonrecursive=nonrecursive,
+        serialize=serialize,
+        deserialize=deserialize,
+        cls=cls,
+        fields=fields,
+        hash_fields=hash_fields,
+        exclude_attrs=exclude_attrs,
+        hash_exclude_attrs=hash_exclude,
+        serde_overrides=serde_overrides,
+        has_serde_constructor=hasattr(cls, "serde_constructor"),
+        is_enum=isinstance(cls, type) and issubclass(cls, Enum),
+        is_pydantic=is_pydantic,
+        lazy_fields=lazy_fields,
+        type_key=(canonical_name, version),
+    )
+
+
+def get_serialize_plan(obj: Any) -> SerdePlan:
+    # types are all serialized by the registered "type" serde
+    key = type(obj)
+    if isinstance(obj, type):
+        key = type
+    plan = SyftObjectRegistry.__serialize_plan_cache__.get(key, None)
+    if plan is not None:
+        return plan
+
+    # todo: rewrite and make sure every object has a canonical name and version
+    canonical_name, version = SyftObjectRegistry.get_canonical_name_version(obj)
+
+    if not SyftObjectRegistry.has_serde_class(canonical_name, version):
+        # third party
+        raise Exception(
+            f"obj2proto: {canonical_name} version {version} not in SyftObjectRegistry"
+        )
+
+    plan = build_serde_plan(canonical_name, version)
+    SyftObjectRegistry.__serialize_plan_cache__[key] = plan
+    return plan
+
+
+def get_deserialize_plan(canonical_name: str, version: int) -> SerdePlan:
+    key = (canonical_name, version)
+    plan = SyftObjectRegistry.__deserialize_plan_cache__.get(key, None)
+    if plan is not None:
+        return plan
+
+    if not SyftObjectRegistry.has_serde_class(canonical_name, version):
+        # relative
+        from ..server.server import CODE_RELOADER
+
+        for load_user_code in CODE_RELOADER.values():
+            load_user_code()
+        # third party
+        if not SyftObjectRegistry.has_serde_class(canonical_name, version):
             raise Exception(
-                f"Cant serialize {type(self)} nonrecursive without serialize."
+                f"proto2obj: {canonical_name} version {version} not in SyftObjectRegistry"
             )
-        chunk_bytes(self, serialize, "nonrecursiveBlob", msg)
-        return msg
 
-    if attribute_list is None:
-        attribute_list = self.__dict__.keys()
+    plan = build_serde_plan(canonical_name, version)
+    SyftObjectRegistry.__deserialize_plan_cache__[key] = plan
+    return plan
 
-    hash_exclude_attrs_set = (
-        set(hash_exclude_attrs).union(set(DYNAMIC_SYFT_ATTRIBUTES))
-        if for_hashing
-        else set()
-    )
-    attribute_list = (
-        set(attribute_list) - set(exclude_attrs_list) - hash_exclude_attrs_set
-    )
 
-    msg.init("fieldsName", len(attribute_list))
-    msg.init("fieldsData", len(attribute_list))
+def set_type(msg: _DynamicStructBuilder, plan: SerdePlan) -> None:
+    table = wire_type_table()
+    if table is not None:
+        type_id = table.ids.get(plan.type_key, NO_TYPE_ID)
+        if type_id != NO_TYPE_ID:
+            msg.typeId = type_id
+            return
+    msg.canonicalName = plan.canonical_name
+    msg.version = plan.version
+
+
+def get_type_name(type_id: int) -> tuple[str, int]:
+    names = get_type_table().names
+    if type_id >= len(names):
+        raise Exception(f"proto2obj: unknown type id {type_id}")
+    return names[type_id]
+
+
+def serialize_primitive(obj: Any, plan: SerdePlan) -> bytes:
+    """Fast path for small builtin values, which make up most fields: they always
+    fit in a single chunk, so the large file handling can be skipped."""
+    msg = recursive_scheme.new_message()
+    set_type(msg, plan)
+    msg.init("nonrecursiveBlob", 1)[0] = plan.serialize(obj)  # type: ignore
+    return msg.to_bytes()
+
+
+def serialize_field(obj: Any, for_hashing: bool) -> bytes:
+    if type(obj) in PRIMITIVE_TYPES and (
+        not isinstance(obj, str | bytes) or len(obj) < SMALL_DATA_MAX_SIZE
+    ):
+        return serialize_primitive(obj, get_serialize_plan(obj))
+    return _serialize(obj, to_bytes=True, for_hashing=for_hashing)
+
+
+def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuilder:
+    plan = get_serialize_plan(self)
+
+    msg = recursive_scheme.new_message()
+    set_type(msg, plan)
+
+    if plan.nonrecursive or isinstance(self, type):
+        if plan.serialize is None:
+            raise Exception(
+                f"Cant serialize {type(self)} nonrecursive without serialize."
+            )
+        chunk_bytes(self, plan.serialize, "nonrecursiveBlob", msg)
+        return msg
 
-    for idx, attr_name in enumerate(sorted(attribute_list)):
-        if not hasattr(self, attr_name):
+    attribute_list = plan.get_fields(self, for_hashing)
+    serde_overrides = plan.serde_overrides
+    table_id = None
+    if plan.lazy_fields:
+        table = wire_type_table()
+        table_id = table.table_id if table is not None else None
+
+    fields_name = msg.init("fieldsName", len(attribute_list))
+    fields_data = msg.init("fieldsData", len(attribute_list))
+
+    for idx, attr_name in enumerate(attribute_list):
+        if not for_hashing and attr_name in plan.lazy_fields:
+            lazy_value = get_unresolved(self, attr_name)
+            if (
+                lazy_value is not None
+                and lazy_value.encoding == CAPNP_ENCODING
+                and lazy_value.type_table_id == table_id
+            ):
+                # never read since it was deserialized with the same type table,
+                # write the bytes back as is
+                fields_name[idx] = attr_name
+                chunk_bytes(lazy_value.data, lambda x: x, idx, fields_data)
+                continue
+
+        field_obj = getattr(self, attr_name, _MISSING)
+        if field_obj is _MISSING:
             raise ValueError(
                 f"{attr_name} on {type(self)} does not exist, serialization aborted!"
             )
 
-        field_obj = getattr(self, attr_name)
-        transforms = serde_overrides.get(attr_name, None)
-
-        if transforms is not None:
-            field_obj = transforms[0](field_obj)
+        if serde_overrides:
+            transforms = serde_overrides.get(attr_name, None)
+            if transforms is not None:
+                field_obj = transforms[0](field_obj)
 
         if isinstance(field_obj, types.FunctionType):
             continue
 
-        msg.fieldsName[idx] = attr_name
+        fields_name[idx] = attr_name
         chunk_bytes(
             field_obj,
-            lambda x: sy.serialize(x, to_bytes=True, for_hashing=for_hashing),
+            lambda x: serialize_field(x, for_hashing),
             idx,
-            msg.fieldsData,
+            fields_data,
         )
 
     return msg
@@ -362,6 +560,21 @@ def rs_bytes2object(blob: bytes) -> Any:
         return rs_proto2object(msg)
 
 
+def rs_bytes2fields(blob: bytes, names: Collection[str]) -> dict[str, Any]:
+    """Decode only the fields `names` of the object serialized in `blob`, without
+    decoding its other fields or building the object."""
+    MAX_TRAVERSAL_LIMIT = 2**64 - 1
+
+    with recursive_scheme.from_bytes(
+        blob, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
+    ) as msg:
+        return {
+            attr_name: rs_bytes2object(combine_bytes(attr_bytes_list))
+            for attr_name, attr_bytes_list in zip(msg.fieldsName, msg.fieldsData)
+            if attr_name in names
+        }
+
+
 def map_fqns_for_backward_compatibility(fqn: str) -> str:
     """for backwards compatibility with 0.8.6. Sometimes classes where moved to another file. Which is
     exactly why we are implementing it differently"""
@@ -375,92 +588,63 @@ def map_fqns_for_backward_compatibility(fqn: str) -> str:
         return fqn
 
 
-def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
-    # relative
-    from .deserialize import _deserialize
+def _rs_bytes2object_with_type_ids(blob: bytes) -> Any:
+    # lazy fields decoded later keep the type table of the message they came in
+    with use_type_ids():
+        return rs_bytes2object(blob)
 
-    class_type: type | Any = type(None)
 
-    canonical_name = proto.canonicalName
-    version = getattr(proto, "version", -1)
-
-    if not SyftObjectRegistry.has_serde_class(canonical_name, version):
-        # relative
-        from ..server.server import CODE_RELOADER
-
-        for load_user_code in CODE_RELOADER.values():
-            load_user_code()
-        # third party
-        if not SyftObjectRegistry.has_serde_class(canonical_name, version):
-            raise Exception(
-                f"proto2obj: {canonical_name} version {version} not in SyftObjectRegistry"
-            )
+def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
+    type_id = proto.typeId
+    if type_id != NO_TYPE_ID:
+        canonical_name, version = get_type_name(type_id)
+    else:
+        canonical_name = proto.canonicalName
+        version = getattr(proto, "version", -1)
 
     # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
     # module name space in sub-processes or threads even though they are loaded on start
     # its possible that the uvicorn awsgi server is preloading a bunch of threads
     # however simply getting the class from the TYPE_BANK doesn't always work and
     # causes some errors so it seems like we want to get the local one where possible
-    (
-        nonrecursive,
-        _,
-        deserialize,
-        _,
-        _,
-        serde_overrides,
-        _,
-        cls,
-        _,
-        version,
-    ) = SyftObjectRegistry.get_serde_properties(canonical_name, version)
+    plan = get_deserialize_plan(canonical_name, version)
 
-    class_type = cls
-
-    if nonrecursive:
-        if deserialize is None:
+    if plan.nonrecursive:
+        if plan.deserialize is None:
             raise Exception(
                 f"Cant serialize {type(proto)} nonrecursive without serialize."
             )
 
-        return deserialize(combine_bytes(proto.nonrecursiveBlob))
+        return plan.deserialize(combine_bytes(proto.nonrecursiveBlob))
 
     kwargs = {}
+    serde_overrides = plan.serde_overrides
+    table_id = None
+    lazy_fields = plan.lazy_fields if lazy_fields_enabled() else frozenset()
+    if lazy_fields:
+        table = wire_type_table()
+        table_id = table.table_id if table is not None else None
 
     for attr_name, attr_bytes_list in zip(proto.fieldsName, proto.fieldsData):
         if attr_name != "":
-            attr_bytes = combine_bytes(attr_bytes_list)
-            attr_value = _deserialize(attr_bytes, from_bytes=True)
-            transforms = serde_overrides.get(attr_name, None)
-
-            if transforms is not None:
-                attr_value = transforms[1](attr_value)
+            if attr_name in lazy_fields:
+                kwargs[attr_name] = LazyValue(
+                    combine_bytes(attr_bytes_list),
+                    rs_bytes2object
+                    if table_id is None
+                    else _rs_bytes2object_with_type_ids,
+                    CAPNP_ENCODING,
+                    table_id,
+                )
+                continue
+            attr_value = rs_bytes2object(combine_bytes(attr_bytes_list))
+            if serde_overrides:
+                transforms = serde_overrides.get(attr_name, None)
+                if transforms is not None:
+                    attr_value = transforms[1](attr_value)
             kwargs[attr_name] = attr_value
 
-    if hasattr(class_type, "serde_constructor"):
-        return class_type.serde_constructor(kwargs)
-
-    if issubclass(class_type, Enum) and "value" in kwargs:
-        obj = class_type.__new__(class_type, kwargs["value"])
-    elif issubclass(class_type, BaseModel):
-        # if we skip the __new__ flow of BaseModel we get the error
-        # AttributeError: object has no attribute '__fields_set__'
-
-        # if "syft.user" in proto.fullyQualifiedName:
-        #     # weird issues with pydantic and ForwardRef on user classes being inited
-        #     # with custom state args / kwargs
-        #     obj = class_type()
-        #     for attr_name, attr_value in kwargs.items():
-        #         setattr(obj, attr_name, attr_value)
-        # else:
-        #     obj = class_type(**kwargs)
-        obj = class_type(**kwargs)
-
-    else:
-        obj = class_type.__new__(class_type)  # type: ignore
-        for attr_name, attr_value in kwargs.items():
-            setattr(obj, attr_name, attr_value)
-
-    return obj
+    return plan.construct(kwargs)
 
 
 # how else do you import a relative file to execute it?
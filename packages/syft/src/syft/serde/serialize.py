@@ -1,10 +1,27 @@
 # stdlib
+from collections.abc import Iterator
+import io
+import os
+import struct
 import tempfile
 from typing import Any
+from typing import IO
 
 # relative
+from .type_ids import use_type_ids
+from .type_ids import wire_type_table
 from .util import compatible_with_large_file_writes_capnp
 
+# size of the buffer used when copying serialized data between file-like objects
+STREAM_BUFFER_SIZE = 1024 * 1024 * 8  # 8MB
+# serialized data above this size is spooled to disk instead of memory
+SPOOL_MAX_SIZE = 1024 * 1024 * 64  # 64MB
+# API results above this size are sent in chunks as they are read back from a
+# spooled file, and deserialized as they arrive
+STREAM_RESPONSE_SIZE = int(
+    os.getenv("SYFT_STREAM_RESPONSE_SIZE", 1024 * 1024 * 16)
+)  # 16MB
+
 
 def _serialize(
     obj: object,
@@ -15,6 +32,11 @@ def _serialize(
     # relative
     from .recursive import rs_object2proto
 
+    if for_hashing and wire_type_table() is not None:
+        # hashes are computed over canonical names, never over type ids
+        with use_type_ids(False):
+            return _serialize(obj, to_proto, to_bytes, for_hashing)
+
     proto = rs_object2proto(obj, for_hashing=for_hashing)
     if to_bytes:
         if compatible_with_large_file_writes_capnp(proto):
@@ -32,3 +54,105 @@ def _serialize(
 
     if to_proto:
         return proto
+
+
+def _get_fileno(writer: IO[bytes]) -> int | None:
+    try:
+        return writer.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _write_buffered(writer: IO[bytes], data: bytes) -> None:
+    view = memoryview(data)
+    for i in range(0, len(view), STREAM_BUFFER_SIZE):
+        writer.write(view[i : i + STREAM_BUFFER_SIZE])
+
+
+def _iter_segments(proto: Any) -> Iterator[bytes]:
+    # capnp stream framing: segment count - 1, the size of each segment in
+    # words, padded to a full word, followed by the segments themselves
+    segments = proto.to_segments()
+    header = struct.pack(
+        f"<{len(segments) + 1}I",
+        len(segments) - 1,
+        *(len(segment) // 8 for segment in segments),
+    )
+    yield header + b"\x00" * (len(header) % 8)
+    yield from segments
+
+
+def _serialize_segments(obj: object, for_hashing: bool = False) -> Iterator[bytes]:
+    """Serialize `obj`, yielding the message in the pieces capnp holds it in.
+
+    Joining the pieces gives the same bytes as `_serialize(obj, to_bytes=True)`.
+    """
+    # relative
+    from .recursive import rs_object2proto
+
+    if for_hashing and wire_type_table() is not None:
+        # hashes are computed over canonical names, never over type ids
+        with use_type_ids(False):
+            proto = rs_object2proto(obj, for_hashing=for_hashing)
+    else:
+        proto = rs_object2proto(obj, for_hashing=for_hashing)
+    yield from _iter_segments(proto)
+
+
+def _serialize_to(
+    obj: object,
+    writer: IO[bytes],
+    for_hashing: bool = False,
+) -> None:
+    """Serialize `obj` and write the resulting message to a binary file-like object.
+
+    Produces the same bytes as `_serialize(obj, to_bytes=True)`, without building
+    them as a single python object when the message is large.
+    """
+    # relative
+    from .recursive import rs_object2proto
+
+    proto = rs_object2proto(obj, for_hashing=for_hashing)
+    if not compatible_with_large_file_writes_capnp(proto):
+        for segment in _iter_segments(proto):
+            _write_buffered(writer, segment)
+        return
+
+    if _get_fileno(writer) is not None:
+        # capnp writes the segments straight to the file descriptor
+        writer.flush()
+        proto.write(writer)
+        return
+
+    with tempfile.TemporaryFile() as tmp_file:
+        proto.write(tmp_file)
+        del proto
+        tmp_file.seek(0)
+        while chunk := tmp_file.read(STREAM_BUFFER_SIZE):
+            writer.write(chunk)
+
+
+def _serialize_to_file(obj: object) -> tuple[IO[bytes], int]:
+    """Serialize `obj` into a temporary file, kept in memory while it is small.
+
+    Returns the file, positioned at the start, and the size of the serialized data.
+    The caller is responsible for closing the file.
+    """
+    tmp_file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    try:
+        _serialize_to(obj, tmp_file)  # type: ignore[arg-type]
+        size = tmp_file.tell()
+        tmp_file.seek(0)
+    except Exception:
+        tmp_file.close()
+        raise
+    return tmp_file, size  # type: ignore[return-value]
+
+
+def _iter_file(file: IO[bytes]) -> Iterator[bytes]:
+    """Yield the rest of `file` in chunks of STREAM_BUFFER_SIZE, then close it."""
+    try:
+        while chunk := file.read(STREAM_BUFFER_SIZE):
+            yield chunk
+    finally:
+        file.close()
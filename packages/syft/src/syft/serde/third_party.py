@@ -5,6 +5,7 @@ from datetime import time
 import functools
 from importlib.util import find_spec
 from io import BytesIO
+import struct
 
 # third party
 from dateutil import parser
@@ -20,12 +21,16 @@ import pydantic
 from pydantic._internal._model_construction import ModelMetaclass
 
 # relative
+from ..server.credentials import get_verify_key
 from ..types.dicttuple import DictTuple
 from ..types.dicttuple import _Meta as _DictTupleMetaClass
 from ..types.syft_metaclass import EmptyType
 from ..types.syft_metaclass import PartialModelMetaclass
+from ..util.experimental_flags import flags
 from .array import numpy_deserialize
 from .array import numpy_serialize
+from .arrow import arrow_table_deserialize
+from .arrow import arrow_table_serialize
 from .deserialize import _deserialize as deserialize
 from .recursive_primitives import _serialize_kv_pairs
 from .recursive_primitives import deserialize_kv
@@ -46,7 +51,7 @@ recursive_serde_register(
 recursive_serde_register(
     VerifyKey,
     serialize=lambda x: bytes(x),
-    deserialize=lambda x: VerifyKey(x),
+    deserialize=get_verify_key,
     canonical_name="nacl_verify_key",
     version=1,
 )
@@ -80,7 +85,25 @@ def deserialize_dataframe(buf: bytes) -> DataFrame:
     return df
 
 
+def arrow_table_to_pandas(table: pa.Table) -> DataFrame:
+    # with zero copy, numeric columns without nulls are read-only views of the
+    # received buffer. Only applies when arrow compression is disabled
+    return table.to_pandas(
+        split_blocks=flags.APACHE_ARROW_ZERO_COPY,
+        self_destruct=True,
+    )
+
+
+def serialize_dataframe_ipc(df: DataFrame) -> bytes:
+    return arrow_table_serialize(pa.Table.from_pandas(df))
+
+
+def deserialize_dataframe_ipc(buf: bytes) -> DataFrame:
+    return arrow_table_to_pandas(arrow_table_deserialize(buf))
+
+
 # pandas
+# version 1 is the parquet format, kept to read data stored with it
 recursive_serde_register(
     DataFrame,
     serialize=serialize_dataframe,
@@ -89,12 +112,40 @@ recursive_serde_register(
     version=1,
 )
 
+recursive_serde_register(
+    DataFrame,
+    serialize=serialize_dataframe_ipc,
+    deserialize=deserialize_dataframe_ipc,
+    canonical_name="pandas_dataframe",
+    version=2,
+)
+
+# series are written as a single column table, with the name in the schema
+# metadata as it doesn't have to be a string
+SERIES_COLUMN = "__syft_series__"
+SERIES_NAME_METADATA_KEY = b"syft_series_name"
+
 
 def deserialize_series(blob: bytes) -> Series:
     df: DataFrame = DataFrame.from_dict(deserialize(blob, from_bytes=True))
     return Series(df[df.columns[0]])
 
 
+def serialize_series_ipc(series: Series) -> bytes:
+    table = pa.Table.from_pandas(series.to_frame(name=SERIES_COLUMN))
+    metadata = dict(table.schema.metadata or {})
+    metadata[SERIES_NAME_METADATA_KEY] = serialize(series.name, to_bytes=True)
+    return arrow_table_serialize(table.replace_schema_metadata(metadata))
+
+
+def deserialize_series_ipc(buf: bytes) -> Series:
+    table = arrow_table_deserialize(buf)
+    name = deserialize(table.schema.metadata[SERIES_NAME_METADATA_KEY], from_bytes=True)
+    series = arrow_table_to_pandas(table)[SERIES_COLUMN]
+    series.name = name
+    return series
+
+
 recursive_serde_register(
     Series,
     serialize=lambda x: serialize(DataFrame(x).to_dict(), to_bytes=True),
@@ -103,6 +154,14 @@ recursive_serde_register(
     version=1,
 )
 
+recursive_serde_register(
+    Series,
+    serialize=serialize_series_ipc,
+    deserialize=deserialize_series_ipc,
+    canonical_name="pandas_series",
+    version=2,
+)
+
 recursive_serde_register(
     datetime,
     serialize=lambda x: serialize(x.isoformat(), to_bytes=True),
@@ -223,6 +282,77 @@ try:
         version=1,
     )
 
+    # version 2 writes the tensor memory as is: a length prefixed header with the
+    # dtype, shape, strides and requires_grad, followed by the raw storage bytes
+    TORCH_HEADER_SIZE = struct.Struct("<Q")
+
+    def _torch_storage_span(tensor: torch.Tensor) -> int:
+        # number of elements of the storage the tensor covers, from its offset
+        if tensor.numel() == 0:
+            return 0
+        return 1 + sum(
+            (size - 1) * stride for size, stride in zip(tensor.shape, tensor.stride())
+        )
+
+    def torch_serialize_storage(tensor: torch.Tensor) -> bytes:
+        requires_grad = tensor.requires_grad
+        tensor = tensor.detach().cpu().resolve_conj().resolve_neg()
+        if tensor.layout != torch.strided:
+            tensor = tensor.to_dense()
+
+        span = _torch_storage_span(tensor)
+        if span > 2 * tensor.numel():
+            # a sparse view into a larger tensor, only send its own elements
+            tensor = tensor.contiguous()
+            span = tensor.numel()
+
+        header = serialize(
+            (
+                str(tensor.dtype).removeprefix("torch."),
+                tuple(tensor.shape),
+                tensor.stride(),
+                requires_grad,
+            ),
+            to_bytes=True,
+        )
+        data = (
+            tensor.as_strided((span,), (1,), tensor.storage_offset())
+            .view(torch.uint8)
+            .numpy()
+        )
+        return b"".join((TORCH_HEADER_SIZE.pack(len(header)), header, data))
+
+    def torch_deserialize_storage(blob: bytes) -> torch.Tensor:
+        buffer = memoryview(blob)
+        header_size = TORCH_HEADER_SIZE.unpack_from(buffer)[0]
+        data_start = TORCH_HEADER_SIZE.size + header_size
+        dtype_name, shape, strides, requires_grad = deserialize(
+            buffer[TORCH_HEADER_SIZE.size : data_start].tobytes(), from_bytes=True
+        )
+        # the name comes from the sender, only dtypes are looked up
+        dtype = getattr(torch, dtype_name, None)
+        if not isinstance(dtype, torch.dtype):
+            raise ValueError(f"{dtype_name!r} is not a torch dtype")
+
+        data = buffer[data_start:]
+        if len(data) == 0:
+            flat = torch.empty(0, dtype=dtype)
+        else:
+            # tensors can be changed in place, so they get a writable copy
+            flat = torch.frombuffer(bytearray(data), dtype=dtype)
+        tensor = flat.as_strided(shape, strides)
+        if requires_grad:
+            tensor.requires_grad_(True)
+        return tensor
+
+    recursive_serde_register(
+        torch.Tensor,
+        serialize=torch_serialize_storage,
+        deserialize=torch_deserialize_storage,
+        canonical_name="torch_tensor",
+        version=2,
+    )
+
 except ImportError:  # nosec
     pass
 
@@ -0,0 +1,108 @@
+# stdlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from hashlib import sha256
+import json
+import os
+import threading
+
+# relative
+from ..types.syft_object_registry import SyftObjectRegistry
+
+# set to false to always send canonical names on the wire
+TYPE_IDS_ENABLED = os.getenv("SYFT_TYPE_IDS_ENABLED", "true").lower() == "true"
+
+# id of the type table a request or response body was encoded with, only sent
+# when both sides agreed on it, see ServerMetadataJSON
+TYPE_TABLE_HEADER = "Syft-Type-Table"
+# status of requests encoded with a table the server doesn't have, which the
+# client sends again by name
+TYPE_TABLE_MISMATCH_STATUS = 409
+
+# type id 0 means the message carries its canonical name and version instead
+NO_TYPE_ID = 0
+
+
+class TypeTable:
+    """Maps every registered (canonical_name, version) to a small integer id.
+
+    Ids are assigned in sorted order, so two processes with the same registered
+    types build the same table. The table is identified by a hash of its entries,
+    which servers advertise in their metadata: ids are only sent to a peer that
+    advertised the same table id. Types registered after the table was built,
+    like user code, are sent by name.
+    """
+
+    def __init__(self, names: list[tuple[str, int]]) -> None:
+        self.names: list[tuple[str, int]] = [("", 0)] + sorted(names)
+        self.ids: dict[tuple[str, int], int] = {
+            name: type_id for type_id, name in enumerate(self.names) if type_id
+        }
+        self.table_id = sha256(json.dumps(self.names[1:]).encode()).hexdigest()[:16]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+_TYPE_TABLE: TypeTable | None = None
+_TYPE_TABLE_LOCK = threading.Lock()
+
+
+def get_type_table() -> TypeTable:
+    """The type table of this process, built from the registry on first use."""
+    global _TYPE_TABLE
+    if _TYPE_TABLE is None:
+        with _TYPE_TABLE_LOCK:
+            if _TYPE_TABLE is None:
+                _TYPE_TABLE = TypeTable(
+                    [
+                        (canonical_name, version)
+                        for canonical_name, versions in list(
+                            SyftObjectRegistry.__object_serialization_registry__.items()
+                        )
+                        for version in versions
+                    ]
+                )
+    return _TYPE_TABLE
+
+
+def type_table_id() -> str | None:
+    """The id servers advertise and clients send back, None when disabled."""
+    if not TYPE_IDS_ENABLED:
+        return None
+    return get_type_table().table_id
+
+
+def accepts_type_ids(peer_table_id: str | None) -> bool:
+    """Whether messages for a peer advertising `peer_table_id` can use type ids."""
+    return peer_table_id is not None and peer_table_id == type_table_id()
+
+
+class _WireState(threading.local):
+    table: TypeTable | None = None
+
+
+_wire_state = _WireState()
+
+
+def wire_type_table() -> TypeTable | None:
+    """The table used by the serialization running in this thread, if any."""
+    return _wire_state.table
+
+
+@contextmanager
+def use_type_ids(enabled: bool = True) -> Iterator[None]:
+    """Serialize with type ids instead of canonical names inside this block.
+
+    Only for messages sent to a peer that agreed on the table, see
+    `accepts_type_ids`. Nested objects, including the items of collections, are
+    serialized with ids as well. Messages encoded with ids are deserialized
+    inside it too, so their lazy fields are not written back to messages
+    encoded by name.
+    """
+    previous = _wire_state.table
+    _wire_state.table = get_type_table() if enabled else None
+    try:
+        yield
+    finally:
+        _wire_state.table = previous
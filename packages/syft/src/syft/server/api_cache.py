@@ -0,0 +1,138 @@
+# future
+from __future__ import annotations
+
+# stdlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from dataclasses import field
+from functools import cache
+import hashlib
+import os
+import threading
+from typing import TYPE_CHECKING
+
+# relative
+from .. import __version__
+from ..client.api import APIEndpoint
+from ..client.api import SyftAPI
+from ..protocol.data_protocol import PROTOCOL_TYPE
+from ..serde.serialize import _serialize
+from ..service.service import LibConfigRegistry
+from ..service.service import ServiceConfigRegistry
+from .credentials import SyftVerifyKey
+
+if TYPE_CHECKING:
+    # relative
+    from .server import Server
+
+# built APIs kept per server, one per role and set of user endpoints
+API_CACHE_SIZE = int(os.getenv("SYFT_API_CACHE_SIZE", 128))
+
+
+@cache
+def _services_digest(n_services: int, n_libs: int) -> str:
+    # the services only change with the code, keyed by size in case more register
+    digest = hashlib.sha256()
+    for path, config in ServiceConfigRegistry.get_registered_configs().items():
+        digest.update(
+            f"{path}|{config.public_name}|{config.signature}|{config.roles}|"
+            f"{config.unwrap_on_success}|{config.warning!r}\n".encode()
+        )
+    for path in LibConfigRegistry.get_registered_configs():
+        digest.update(f"{path}\n".encode())
+    return digest.hexdigest()
+
+
+def services_digest() -> str:
+    """Fingerprint of the registered service and lib endpoints."""
+    return _services_digest(
+        len(ServiceConfigRegistry.get_registered_configs()),
+        len(LibConfigRegistry.get_registered_configs()),
+    )
+
+
+def endpoints_digest(endpoints: dict[str, APIEndpoint]) -> str:
+    digest = hashlib.sha256()
+    for path, endpoint in endpoints.items():
+        digest.update(
+            f"{path}|{endpoint.service_path}|{endpoint.name}|{endpoint.signature}|"
+            f"{endpoint.pre_kwargs}\n".encode()
+        )
+    return digest.hexdigest()
+
+
+@dataclass
+class CachedAPI:
+    api: SyftAPI
+    etag: str
+    _payload: bytes | None = field(default=None, repr=False)
+
+    @property
+    def payload(self) -> bytes:
+        """The serialized API, as sent to clients."""
+        if self._payload is None:
+            self._payload = _serialize(self.api, to_bytes=True)
+        return self._payload
+
+
+class APICache:
+    """
+    The SyftAPIs built by a server, keyed by an ETag of everything they are
+    built from: the role, the protocol, the server's settings and the user's
+    code and custom endpoints. Changing any of them makes a new ETag, so stale
+    APIs are never returned, they are evicted once `maxsize` newer ones exist.
+    """
+
+    def __init__(self, maxsize: int = API_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[str, CachedAPI] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        server: Server,
+        user_verify_key: SyftVerifyKey | None,
+        communication_protocol: PROTOCOL_TYPE | None,
+    ) -> CachedAPI:
+        """The API of the user, only built when none of the same ETag is cached.
+
+        Finding the ETag takes the role and the user endpoints, which are read
+        from the database on every call.
+        """
+        role = server.get_role_for_credentials(user_verify_key)
+        user_endpoints = SyftAPI.user_endpoints(server, user_verify_key)
+        etag = hashlib.sha256(
+            f"{__version__}|{services_digest()}|{server.id}|{server.name}|"
+            f"{server.server_side_type}|{server.enable_warnings}|{role}|"
+            f"{communication_protocol}|{endpoints_digest(user_endpoints)}".encode()
+        ).hexdigest()
+
+        with self._lock:
+            cached = self._cache.get(etag)
+            if cached is not None:
+                self._cache.move_to_end(etag)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        api = SyftAPI.for_user(
+            server=server,
+            user_verify_key=user_verify_key,
+            communication_protocol=communication_protocol,
+            user_endpoints=user_endpoints,
+        )
+        cached = CachedAPI(api=api, etag=etag)
+        with self._lock:
+            cached = self._cache.setdefault(etag, cached)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return cached
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 # stdlib
+from functools import lru_cache
 import hashlib
+import os
 from typing import Any
 
 # third party
@@ -17,37 +19,100 @@ from ..types.base import SyftBaseModel
 
 SIGNING_KEY_FOR = "Corresponding Public Key"
 
+# number of verify keys shared per process by SyftVerifyKey.from_bytes and
+# SyftVerifyKey.from_string, keyed by the bytes or hex string they were made from.
+# The table is cleared when it is full.
+VERIFY_KEY_INTERN_SIZE = int(os.getenv("SYFT_VERIFY_KEY_INTERN_SIZE", 2**12))
+_verify_key_table: dict[bytes | str, SyftVerifyKey] = {}
+
+
+@lru_cache(maxsize=VERIFY_KEY_INTERN_SIZE)
+def get_verify_key(key: bytes) -> VerifyKey:
+    """VerifyKey of the raw key bytes, keys are built once per process."""
+    return VerifyKey(key)
+
+
+def _intern_verify_key(key: bytes | str, verify_key: SyftVerifyKey) -> SyftVerifyKey:
+    if len(_verify_key_table) >= VERIFY_KEY_INTERN_SIZE:
+        _verify_key_table.clear()
+    if VERIFY_KEY_INTERN_SIZE:
+        _verify_key_table[key] = verify_key
+    return verify_key
+
 
 @serializable(canonical_name="SyftVerifyKey", version=1)
 class SyftVerifyKey(SyftBaseModel):
+    # the raw key bytes and hex string are cached in slots, verify keys are public
+    # so they are hashed and compared with the raw bytes instead of the constant
+    # time compare of VerifyKey
+    __slots__ = ("_key", "_hex")
     verify_key: VerifyKey
 
     def __init__(self, verify_key: str | VerifyKey):
         if isinstance(verify_key, str):
-            verify_key = VerifyKey(bytes.fromhex(verify_key))
+            verify_key = get_verify_key(bytes.fromhex(verify_key))
         super().__init__(verify_key=verify_key)
+        self._cache_key()
+
+    def _cache_key(self) -> bytes:
+        # copies and model_construct skip __init__, they are cached on first use
+        key = bytes(self.verify_key)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_hex", key.hex())
+        return key
+
+    @property
+    def key(self) -> bytes:
+        try:
+            return self._key
+        except AttributeError:
+            return self._cache_key()
 
     def __str__(self) -> str:
-        return self.verify_key.encode(encoder=HexEncoder).decode("utf-8")
+        try:
+            return self._hex
+        except AttributeError:
+            return self._cache_key().hex()
 
-    @staticmethod
-    def from_string(key_str: str) -> SyftVerifyKey:
-        return SyftVerifyKey(verify_key=VerifyKey(bytes.fromhex(key_str)))
+    @classmethod
+    def from_bytes(cls, key: bytes) -> SyftVerifyKey:
+        verify_key = _verify_key_table.get(key)
+        if verify_key is None:
+            verify_key = _intern_verify_key(key, cls(verify_key=get_verify_key(key)))
+        return verify_key
+
+    @classmethod
+    def from_string(cls, key_str: str) -> SyftVerifyKey:
+        verify_key = _verify_key_table.get(key_str)
+        if verify_key is None:
+            verify_key = _intern_verify_key(
+                key_str, cls.from_bytes(bytes.fromhex(key_str))
+            )
+        return verify_key
+
+    @classmethod
+    def serde_constructor(cls, kwargs: dict[str, Any]) -> SyftVerifyKey:
+        return cls.from_bytes(bytes(kwargs["verify_key"]))
 
     @property
     def verify(self) -> str:
         return str(self)
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, SyftVerifyKey):
             return False
-        return self.verify_key == other.verify_key
+        return self.key == other.key
 
     def __repr__(self) -> str:
         return str(self)
 
     def __hash__(self) -> int:
-        return hash(self.verify_key)
+        try:
+            return hash(self._key)
+        except AttributeError:
+            return hash(self._cache_key())
 
 
 @serializable(canonical_name="SyftSigningKey", version=1)
@@ -64,7 +129,7 @@ class SyftSigningKey(SyftBaseModel):
 
     @property
     def verify_key(self) -> SyftVerifyKey:
-        return SyftVerifyKey(verify_key=self.signing_key.verify_key)
+        return SyftVerifyKey.from_bytes(bytes(self.signing_key.verify_key))
 
     def __str__(self) -> str:
         return self.signing_key.encode(encoder=HexEncoder).decode("utf-8")
@@ -0,0 +1,74 @@
+# future
+from __future__ import annotations
+
+# stdlib
+from collections import OrderedDict
+import os
+import threading
+import time
+from typing import TYPE_CHECKING
+
+# relative
+from ..types.uid import UID
+
+if TYPE_CHECKING:
+    # relative
+    from ..client.client import SyftClient
+    from ..service.network.routes import ServerRoute
+
+# clients of peers kept per server, and seconds a client is used for
+PEER_CLIENT_CACHE_SIZE = int(os.getenv("SYFT_PEER_CLIENT_CACHE_SIZE", 256))
+PEER_CLIENT_CACHE_TTL = int(os.getenv("SYFT_PEER_CLIENT_CACHE_TTL", 300))
+
+
+class PeerClientCache:
+    """
+    The clients a server forwards messages to its peers with, keyed by the peer
+    and the route they were made for. Clients expire `ttl` seconds after they
+    are made, the least recently used are evicted once `maxsize` newer ones
+    exist, and all clients of a peer are evicted when it stops answering.
+    """
+
+    def __init__(
+        self, maxsize: int = PEER_CLIENT_CACHE_SIZE, ttl: int = PEER_CLIENT_CACHE_TTL
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._cache: OrderedDict[tuple[UID, int], tuple[float, SyftClient]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, server_uid: UID, route: ServerRoute) -> SyftClient | None:
+        key = (server_uid, hash(route))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                return None
+            expires_at, client = cached
+            if expires_at <= time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return client
+
+    def set(self, server_uid: UID, route: ServerRoute, client: SyftClient) -> None:
+        key = (server_uid, hash(route))
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self.ttl, client)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def evict(self, server_uid: UID) -> None:
+        """Evict the clients of a peer, for every route to it."""
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == server_uid]:
+                del self._cache[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
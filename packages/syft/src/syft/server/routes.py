@@ -1,17 +1,21 @@
 # stdlib
 import base64
 import binascii
-from collections.abc import AsyncGenerator
+from collections.abc import Iterator
+import hashlib
 import logging
 from typing import Annotated
 
 # third party
+import anyio.from_thread
+import anyio.to_thread
 from fastapi import APIRouter
 from fastapi import Body
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Request
 from fastapi import Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
@@ -19,10 +23,27 @@ import requests
 
 # relative
 from ..abstract_server import AbstractServer
+from ..client.api import SignedSyftAPICall
 from ..client.connection import ServerConnection
 from ..protocol.data_protocol import PROTOCOL_TYPE
+from ..serde.compression import ACCEPT_COMPRESSION_HEADER
+from ..serde.compression import COMPRESSION_HEADER
+from ..serde.compression import DecompressionError
+from ..serde.compression import MAX_DECOMPRESSED_SIZE
+from ..serde.compression import UnsupportedCompressionError
+from ..serde.compression import choose_compression
+from ..serde.compression import decompress
+from ..serde.compression import maybe_compress
 from ..serde.deserialize import _deserialize as deserialize
+from ..serde.serialize import STREAM_BUFFER_SIZE
+from ..serde.serialize import STREAM_RESPONSE_SIZE
+from ..serde.serialize import _iter_file as iter_file
 from ..serde.serialize import _serialize as serialize
+from ..serde.serialize import _serialize_to_file as serialize_to_file
+from ..serde.type_ids import TYPE_TABLE_HEADER
+from ..serde.type_ids import TYPE_TABLE_MISMATCH_STATUS
+from ..serde.type_ids import accepts_type_ids
+from ..serde.type_ids import use_type_ids
 from ..service.context import ServerServiceContext
 from ..service.context import UnauthedServiceContext
 from ..service.metadata.server_metadata import ServerMetadataJSON
@@ -39,6 +60,11 @@ from .worker import Worker
 logger = logging.getLogger(__name__)
 
 
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Whether the client already has the response tagged `etag`."""
+    return if_none_match is not None and etag in if_none_match.split(", ")
+
+
 def make_routes(worker: Worker) -> APIRouter:
     router = APIRouter()
 
@@ -54,8 +80,20 @@ def make_routes(worker: Worker) -> APIRouter:
         connection = route_to_connection(route=peer_server_route)
         return connection
 
+    def iter_response(response: requests.Response) -> Iterator[bytes]:
+        # the upstream body is passed on in chunks as it arrives
+        with response:
+            yield from response.iter_content(chunk_size=STREAM_BUFFER_SIZE)
+
+    def relayed_headers(response: requests.Response) -> dict[str, str]:
+        return {
+            name: response.headers[name]
+            for name in ("Content-Length", COMPRESSION_HEADER)
+            if name in response.headers
+        }
+
     @router.get("/stream/{peer_uid}/{url_path}/", name="stream")
-    async def stream_download(peer_uid: str, url_path: str) -> StreamingResponse:
+    def stream_download(peer_uid: str, url_path: str) -> StreamingResponse:
         try:
             url_path_parsed = base64.urlsafe_b64decode(url_path.encode()).decode()
         except binascii.Error:
@@ -66,17 +104,24 @@ def make_routes(worker: Worker) -> APIRouter:
         try:
             peer_connection = _get_server_connection(peer_uid_parsed)
             url = peer_connection.to_blob_route(url_path_parsed)
-            stream_response = peer_connection._make_get(url.path, stream=True)
+            stream_response = peer_connection._make_get_stream(url.path)
         except requests.RequestException:
             raise HTTPException(404, "Failed to retrieve data from datasite.")
 
-        return StreamingResponse(stream_response, media_type="text/event-stream")
+        return StreamingResponse(
+            iter_response(stream_response),
+            headers=relayed_headers(stream_response),
+            media_type="text/event-stream",
+        )
 
-    async def read_request_body_in_chunks(
-        request: Request,
-    ) -> AsyncGenerator[bytes, None]:
-        async for chunk in request.stream():
-            yield chunk
+    def iter_request_body(request: Request) -> Iterator[bytes]:
+        # read from the event loop as the thread sending it on asks for it
+        chunks = request.stream()
+        while True:
+            try:
+                yield anyio.from_thread.run(chunks.__anext__)
+            except StopAsyncIteration:
+                return
 
     @router.put("/stream/{peer_uid}/{url_path}/", name="stream")
     async def stream_upload(peer_uid: str, url_path: str, request: Request) -> Response:
@@ -85,16 +130,20 @@ def make_routes(worker: Worker) -> APIRouter:
         except binascii.Error:
             raise HTTPException(404, "Invalid `url_path`.")
 
-        data = await request.body()
-
         peer_uid_parsed = UID.from_string(peer_uid)
 
-        try:
+        def upload() -> requests.Response:
             peer_connection = _get_server_connection(peer_uid_parsed)
             url = peer_connection.to_blob_route(url_path_parsed)
+            headers = {}
+            if "Content-Length" in request.headers:
+                headers["Content-Length"] = request.headers["Content-Length"]
+            return peer_connection._make_put(
+                url.path, data=iter_request_body(request), stream=True, headers=headers
+            )
 
-            print("Url on stream", url.path)
-            response = peer_connection._make_put(url.path, data=data, stream=True)
+        try:
+            response = await anyio.to_thread.run_sync(upload)
         except requests.RequestException:
             raise HTTPException(404, "Failed to upload data to datasite")
 
@@ -121,8 +170,15 @@ def make_routes(worker: Worker) -> APIRouter:
 
     # provide information about the server in JSON
     @router.get("/metadata", response_class=JSONResponse)
-    def syft_metadata() -> JSONResponse:
-        return worker.metadata.to(ServerMetadataJSON)
+    def syft_metadata(request: Request) -> Response:
+        response = JSONResponse(
+            jsonable_encoder(worker.metadata.to(ServerMetadataJSON))
+        )
+        etag = f'"{hashlib.sha256(response.body).hexdigest()}"'
+        if etag_matches(etag, request.headers.get("If-None-Match")):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return response
 
     @router.get("/metadata_capnp")
     def syft_metadata_capnp() -> Response:
@@ -133,13 +189,19 @@ def make_routes(worker: Worker) -> APIRouter:
         )
 
     def handle_syft_new_api(
-        user_verify_key: SyftVerifyKey, communication_protocol: PROTOCOL_TYPE
+        user_verify_key: SyftVerifyKey,
+        communication_protocol: PROTOCOL_TYPE,
+        if_none_match: str | None = None,
     ) -> Response:
+        cached = worker.api_cache.get(worker, user_verify_key, communication_protocol)
+        etag = f'"{cached.etag}"'
+        headers = {"ETag": etag}
+        if etag_matches(etag, if_none_match):
+            return Response(status_code=304, headers=headers)
         return Response(
-            serialize(
-                worker.get_api(user_verify_key, communication_protocol), to_bytes=True
-            ),
+            cached.payload,
             media_type="application/octet-stream",
+            headers=headers,
         )
 
     # get the SyftAPI object
@@ -148,13 +210,95 @@ def make_routes(worker: Worker) -> APIRouter:
         request: Request, verify_key: str, communication_protocol: PROTOCOL_TYPE
     ) -> Response:
         user_verify_key: SyftVerifyKey = SyftVerifyKey.from_string(verify_key)
-        return handle_syft_new_api(user_verify_key, communication_protocol)
+        return handle_syft_new_api(
+            user_verify_key,
+            communication_protocol,
+            request.headers.get("If-None-Match"),
+        )
+
+    def handle_new_api_call(
+        data: bytes,
+        compression: str | None = None,
+        accept_compression: str | None = None,
+        type_table: str | None = None,
+        batch: bool = False,
+    ) -> Response:
+        try:
+            body = (
+                decompress(data, compression, max_size=MAX_DECOMPRESSED_SIZE)
+                if compression
+                else data
+            )
+        except UnsupportedCompressionError as e:
+            raise HTTPException(415, str(e))
+        except DecompressionError as e:
+            raise HTTPException(400, str(e))
+
+        # bodies with type ids are only decoded with the table they were encoded
+        # with, and answered with ids as well
+        type_ids = type_table is not None
+        if type_ids and not accepts_type_ids(type_table):
+            raise HTTPException(
+                TYPE_TABLE_MISMATCH_STATUS,
+                f"Type table {type_table} is not the type table of this server",
+            )
+        with use_type_ids(type_ids):
+            obj_msg = deserialize(blob=body, from_bytes=True)
+
+        # calls for peers are relayed as they came, the peer decodes them. Calls
+        # with type ids were encoded for this server.
+        if not batch and not type_ids and isinstance(obj_msg, SignedSyftAPICall):
+            headers = {}
+            if compression:
+                headers[COMPRESSION_HEADER] = compression
+            if accept_compression:
+                headers[ACCEPT_COMPRESSION_HEADER] = accept_compression
+            relayed = worker.relay_api_call(obj_msg, data, headers)
+            if relayed is not None:
+                return StreamingResponse(
+                    iter_response(relayed),
+                    status_code=relayed.status_code,
+                    headers=relayed_headers(relayed),
+                    media_type="application/octet-stream",
+                )
+
+        if batch:
+            result = worker.handle_api_batch_call(api_call=obj_msg)
+        else:
+            result = worker.handle_api_call(api_call=obj_msg)
+
+        if (
+            isinstance(result, SignedSyftAPICall)
+            and len(result.serialized_message) >= STREAM_RESPONSE_SIZE
+        ):
+            # serialized to a spooled file and sent from it in chunks, uncompressed,
+            # so the result is not held in memory once more for the response
+            with use_type_ids(type_ids):
+                result_file, size = serialize_to_file(result)
+            del result
+            headers = {"Content-Length": str(size)}
+            if type_table is not None:
+                headers[TYPE_TABLE_HEADER] = type_table
+            return StreamingResponse(
+                iter_file(result_file),
+                headers=headers,
+                media_type="application/octet-stream",
+            )
+
+        with use_type_ids(type_ids):
+            result_bytes = serialize(result, to_bytes=True)
+        headers = {}
+        if type_table is not None:
+            headers[TYPE_TABLE_HEADER] = type_table
+        if accept_compression:
+            codec = choose_compression(accept_compression.split(","))
+            result_bytes, used_codec = maybe_compress(result_bytes, codec)
+            if used_codec is not None:
+                headers[COMPRESSION_HEADER] = used_codec
 
-    def handle_new_api_call(data: bytes) -> Response:
-        obj_msg = deserialize(blob=data, from_bytes=True)
-        result = worker.handle_api_call(api_call=obj_msg)
         return Response(
-            serialize(result, to_bytes=True),
+            result_bytes,
+            headers=headers,
             media_type="application/octet-stream",
         )
 
@@ -163,7 +307,25 @@ def make_routes(worker: Worker) -> APIRouter:
     def syft_new_api_call(
         request: Request, data: Annotated[bytes, Depends(get_body)]
     ) -> Response:
-        return handle_new_api_call(data)
+        return handle_new_api_call(
+            data,
+            compression=request.headers.get(COMPRESSION_HEADER),
+            accept_compression=request.headers.get(ACCEPT_COMPRESSION_HEADER),
+            type_table=request.headers.get(TYPE_TABLE_HEADER),
+        )
+
+    # make many requests to the SyftAPI in one round trip
+    @router.post("/api_batch_call")
+    def syft_new_api_batch_call(
+        request: Request, data: Annotated[bytes, Depends(get_body)]
+    ) -> Response:
+        return handle_new_api_call(
+            data,
+            compression=request.headers.get(COMPRESSION_HEADER),
+            accept_compression=request.headers.get(ACCEPT_COMPRESSION_HEADER),
+            type_table=request.headers.get(TYPE_TABLE_HEADER),
+            batch=True,
+        )
 
     def handle_forgot_password(email: str, server: AbstractServer) -> Response:
         try:
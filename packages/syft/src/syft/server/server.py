@@ -22,17 +22,21 @@ from typing import cast
 
 # third party
 from nacl.signing import SigningKey
+import requests
 
 # relative
 from .. import __version__
 from ..abstract_server import AbstractServer
 from ..abstract_server import ServerSideType
 from ..abstract_server import ServerType
+from ..client.api import SessionSyftAPICall
 from ..client.api import SignedSyftAPICall
 from ..client.api import SyftAPI
+from ..client.api import SyftAPIBatchCall
 from ..client.api import SyftAPICall
 from ..client.api import SyftAPIData
 from ..client.api import debox_signed_syftapicall_response
+from ..client.client import HTTPConnection
 from ..client.client import SyftClient
 from ..deployment_type import DeploymentType
 from ..protocol.data_protocol import PROTOCOL_TYPE
@@ -49,6 +53,8 @@ from ..service.job.job_stash import JobStash
 from ..service.job.job_stash import JobStatus
 from ..service.job.job_stash import JobType
 from ..service.metadata.server_metadata import ServerMetadata
+from ..service.network.server_peer import ServerPeer
+from ..service.network.server_peer import ServerPeerConnectionStatus
 from ..service.network.utils import PeerHealthCheckTask
 from ..service.notifier.notifier_service import NotifierService
 from ..service.output.output_service import OutputStash
@@ -93,6 +99,7 @@ from ..store.db.postgres import PostgresDBManager
 from ..store.db.sqlite import SQLiteDBConfig
 from ..store.db.sqlite import SQLiteDBManager
 from ..store.db.stash import ObjectStash
+from ..store.db.stash import transaction
 from ..store.document_store_errors import NotFoundException
 from ..store.document_store_errors import StashException
 from ..store.linked_obj import LinkedObject
@@ -104,6 +111,7 @@ from ..types.syft_metaclass import Empty
 from ..types.syft_object import Context
 from ..types.syft_object import PartialSyftObject
 from ..types.syft_object import SYFT_OBJECT_VERSION_1
+from ..types.syft_object import SyftMigrationRegistry
 from ..types.syft_object import SyftObject
 from ..types.uid import UID
 from ..util.experimental_flags import flags
@@ -113,6 +121,7 @@ from ..util.util import get_env
 from ..util.util import get_queue_address
 from ..util.util import random_name
 from ..util.util import thread_ident
+from .api_cache import APICache
 from .credentials import SyftSigningKey
 from .credentials import SyftVerifyKey
 from .env import get_default_root_email
@@ -126,7 +135,10 @@ from .env import get_private_key_env
 from .env import get_server_uid_env
 from .env import get_syft_worker_uid
 from .env import in_kubernetes
+from .peer_client_cache import PeerClientCache
 from .service_registry import ServiceRegistry
+from .session_tokens import SessionTokens
+from .settings_cache import SettingsCache
 from .utils import get_named_server_uid
 from .utils import get_temp_dir_for_server
 from .utils import remove_temp_dir_for_server
@@ -191,6 +203,10 @@ class AuthServerContextRegistry:
         return cls.__server_context_registry__.get(key)
 
 
+class _BatchRollback(Exception):
+    """Rolls back the transaction of an API call batch with a failed call."""
+
+
 class Server(AbstractServer):
     signing_key: SyftSigningKey | None
     required_signed_calls: bool = True
@@ -232,6 +248,7 @@ class Server(AbstractServer):
         background_tasks: bool = False,
         consumer_type: ConsumerType | None = None,
         db_url: str | None = None,
+        primary: bool = True,
     ):
         # 🟡 TODO 22: change our ENV variable format and default init args to make this
         # less horrible or add some convenience functions
@@ -240,14 +257,19 @@ class Server(AbstractServer):
         self.packages = ""
         self.processes = processes
         self.is_subprocess = is_subprocess
+        # a server running in several processes over the same db has one primary,
+        # which does the startup work and runs the queue and background tasks
+        self.primary = primary
         self.name = name or random_name()
         self.enable_warnings = enable_warnings
         self.in_memory_workers = in_memory_workers
         self.server_type = ServerType(server_type)
         self.server_side_type = ServerSideType(server_side_type)
         self.client_cache: dict = {}
-        self.peer_client_cache: dict = {}
-        self._settings = None
+        self.peer_client_cache = PeerClientCache()
+        self.api_cache = APICache()
+        self.session_tokens = SessionTokens()
+        self.settings_cache = SettingsCache()
 
         if isinstance(server_type, str):
             server_type = ServerType(server_type)
@@ -294,7 +316,7 @@ class Server(AbstractServer):
         )
 
         # must call before initializing stores
-        if reset:
+        if reset and primary:
             self.remove_temp_dir()
 
         db_config = DBConfig.from_connection_string(db_url) if db_url else db_config
@@ -311,33 +333,39 @@ class Server(AbstractServer):
 
         # construct services only after init stores
         self.services: ServiceRegistry = ServiceRegistry.for_server(self)
-        self.db.init_tables(reset=reset)
+        if primary:
+            self.db.init_tables(reset=reset)
+        # resolve migrations to the latest versions before stored objects are loaded
+        SyftMigrationRegistry.warm_migration_cache()
         self.action_store = self.services.action.stash
 
-        create_root_admin_if_not_exists(
-            name=root_username,
-            email=root_email,
-            password=root_password,  # nosec
-            server=self,
-        )
+        if primary:
+            create_root_admin_if_not_exists(
+                name=root_username,
+                email=root_email,
+                password=root_password,  # nosec
+                server=self,
+            )
 
-        NotifierService.init_notifier(
-            server=self,
-            email_password=smtp_password,
-            email_username=smtp_username,
-            email_sender=email_sender,
-            smtp_port=smtp_port,
-            smtp_host=smtp_host,
-        ).unwrap()
+            NotifierService.init_notifier(
+                server=self,
+                email_password=smtp_password,
+                email_username=smtp_username,
+                email_sender=email_sender,
+                smtp_port=smtp_port,
+                smtp_host=smtp_host,
+            ).unwrap()
 
+        # user code is loaded into the memory of each process
         self.post_init()
 
-        if migrate:
-            self.find_and_migrate_data()
-        else:
-            self.find_and_migrate_data([ServerSettings])
+        if primary:
+            if migrate:
+                self.find_and_migrate_data()
+            else:
+                self.find_and_migrate_data([ServerSettings])
 
-        self.create_initial_settings(admin_email=root_email).unwrap()
+            self.create_initial_settings(admin_email=root_email).unwrap()
 
         self.init_blob_storage(config=blob_storage_config)
 
@@ -353,11 +381,11 @@ class Server(AbstractServer):
         )
 
         self.peer_health_manager: PeerHealthCheckTask | None = None
-        if background_tasks:
+        if background_tasks and primary:
             self.run_peer_health_checks(context=context)
 
         ServerRegistry.set_server_for(self.id, self)
-        if background_tasks:
+        if background_tasks and primary:
             email_dispatcher = threading.Thread(
                 target=self.email_notification_dispatcher, daemon=True
             )
@@ -532,6 +560,9 @@ class Server(AbstractServer):
             return None
 
         self.queue_manager = QueueManager(config=queue_config)
+        if not self.primary:
+            # api calls are queued in the db, the primary's producer picks them up
+            return None
         for message_handler in MessageHandlers:
             queue_name = message_handler.queue_name
             # client config
@@ -657,6 +688,7 @@ class Server(AbstractServer):
         db_url: str | None = None,
         db_config: DBConfig | None = None,
         log_level: int | None = None,
+        primary: bool = True,
     ) -> Server:
         uid = get_named_server_uid(name)
         name_hash = hashlib.sha256(name.encode("utf8")).digest()
@@ -690,6 +722,7 @@ class Server(AbstractServer):
             db_url=db_url,
             db_config=db_config,
             log_level=log_level,
+            primary=primary,
         )
 
     def is_root(self, credentials: SyftVerifyKey) -> bool:
@@ -904,24 +937,11 @@ class Server(AbstractServer):
     # it should be removed once the settings are refactored and the inconsistencies between
     # settings and services are resolved.
     def get_settings(self) -> ServerSettings | None:
-        if self._settings:
-            return self._settings  # type: ignore
         if self.signing_key is None:
             raise ValueError(f"{self} has no signing key")
 
-        settings_stash = self.services.settings.stash
-
         try:
-            settings = settings_stash.get_all(self.signing_key.verify_key).unwrap()
-
-            if len(settings) > 0:
-                setting = settings[0]
-                self.update_self(setting)
-                self._settings = setting
-                return setting
-            else:
-                return None
-
+            return self.settings_cache.get(self)
         except SyftException:
             return None
 
@@ -930,24 +950,21 @@ class Server(AbstractServer):
         if self.signing_key is None:
             raise ValueError(f"{self} has no signing key")
 
-        settings_stash = self.services.settings.stash
         error_msg = f"Cannot get server settings for '{self.name}'"
+        try:
+            settings = self.settings_cache.get(self)
+        except SyftException as e:
+            raise SyftException(public_message=error_msg) from e
 
-        all_settings = settings_stash.get_all(self.signing_key.verify_key).unwrap(
-            public_message=error_msg
-        )
-
-        if len(all_settings) == 0:
+        if settings is None:
             raise SyftException(public_message=error_msg)
-
-        settings = all_settings[0]
-        self.update_self(settings)
         return settings
 
     @property
     def metadata(self) -> ServerMetadata:
-        show_warnings = self.enable_warnings
-        settings_data = self.settings
+        return self.settings_cache.get_metadata(self, self.settings)
+
+    def make_metadata(self, settings_data: ServerSettings) -> ServerMetadata:
         name = settings_data.name
         organization = settings_data.organization
         description = settings_data.description
@@ -1022,10 +1039,9 @@ class Server(AbstractServer):
         return queue_obj
 
     @instrument
-    def forward_message(
-        self, api_call: SyftAPICall | SignedSyftAPICall
-    ) -> Result | QueueItem | SyftObject | Any:
-        server_uid = api_call.message.server_uid
+    def get_peer_client(
+        self, server_uid: UID, credentials: SyftVerifyKey
+    ) -> tuple[ServerPeer, SyftClient]:
         if "networkservice" not in self.service_path_map:
             raise SyftException(
                 public_message=(
@@ -1034,51 +1050,84 @@ class Server(AbstractServer):
                 )
             )
 
-        client = None
         peer = self.services.network.stash.get_by_uid(
             self.verify_key, server_uid
         ).unwrap()
+        if peer.ping_status == ServerPeerConnectionStatus.TIMEOUT:
+            self.peer_client_cache.evict(peer.id)
 
         # Since we have several routes to a peer
         # we need to cache the client for a given server_uid along with the route
-        peer_cache_key = hash(server_uid) + hash(peer.pick_highest_priority_route())
-        if peer_cache_key in self.peer_client_cache:
-            client = self.peer_client_cache[peer_cache_key]
-        else:
-            context = AuthedServiceContext(
-                server=self, credentials=api_call.credentials
-            )
+        route = peer.pick_highest_priority_route()
+        client = self.peer_client_cache.get(server_uid, route)
+        if client is None:
+            context = AuthedServiceContext(server=self, credentials=credentials)
 
             client = peer.client_with_context(context=context).unwrap(
                 public_message=f"Failed to create remote client for peer: {peer.id}"
             )
-            self.peer_client_cache[peer_cache_key] = client
-
-        if client:
-            message: SyftAPICall = api_call.message
-            if message.path == "metadata":
-                result = client.metadata
-            elif message.path == "login":
-                result = client.connection.login(**message.kwargs)
-            elif message.path == "register":
-                result = client.connection.register(**message.kwargs)
-            elif message.path == "api":
-                result = client.connection.get_api(**message.kwargs)
-            else:
-                signed_result = client.connection.make_call(api_call)
-                result = debox_signed_syftapicall_response(
-                    signed_result=signed_result
-                ).unwrap()
+            self.peer_client_cache.set(server_uid, route, client)
+        return peer, client
+
+    def relay_api_call(
+        self, api_call: SignedSyftAPICall, data: bytes, headers: dict[str, str]
+    ) -> requests.Response | None:
+        """
+        Post a signed call for a peer to it as it was received, `data` being the
+        call as serialized by the user. The response of the peer, signed by the
+        peer, is returned unread to be streamed back to the user. Returns None
+        for calls handled by this server or forwarded by `forward_message`.
+        """
+        # only where the call goes is decoded, the peer decodes and validates the
+        # rest of it
+        fields = api_call.message_fields("server_uid", "path")
+        server_uid, path = fields.get("server_uid"), fields.get("path")
+        if not isinstance(server_uid, UID) or not isinstance(path, str):
+            # not a SyftAPICall, rejected by handle_api_call
+            return None
+        # these paths are answered by other routes of the peer
+        if server_uid == self.id or path in ("metadata", "login", "register", "api"):
+            return None
+        if not api_call.is_valid:
+            raise SyftException(public_message="Your message signature is invalid")
+
+        peer, client = self.get_peer_client(server_uid, api_call.credentials)
+        if isinstance(client.connection, HTTPConnection):
+            try:
+                return client.connection.relay_api_call(data, headers)
+            except requests.ConnectionError:
+                self.peer_client_cache.evict(peer.id)
+                raise
+        return None  # type: ignore[unreachable]
 
-                # relative
-                from ..store.blob_storage import BlobRetrievalByURL
+    def forward_message(
+        self, api_call: SyftAPICall | SignedSyftAPICall
+    ) -> Result | QueueItem | SyftObject | Any:
+        server_uid = api_call.message.server_uid
+        peer, client = self.get_peer_client(server_uid, api_call.credentials)
+
+        message: SyftAPICall = api_call.message
+        if message.path == "metadata":
+            result = client.metadata
+        elif message.path == "login":
+            result = client.connection.login(**message.kwargs)
+        elif message.path == "register":
+            result = client.connection.register(**message.kwargs)
+        elif message.path == "api":
+            result = client.connection.get_api(**message.kwargs)
+        else:
+            signed_result = client.connection.make_call(api_call)
+            result = debox_signed_syftapicall_response(
+                signed_result=signed_result
+            ).unwrap()
 
-                if isinstance(result, BlobRetrievalByURL | SeaweedFSBlobDeposit):
-                    result.proxy_server_uid = peer.id
+            # relative
+            from ..store.blob_storage import BlobRetrievalByURL
 
-            return result
+            if isinstance(result, BlobRetrievalByURL | SeaweedFSBlobDeposit):
+                result.proxy_server_uid = peer.id
 
-        raise SyftException(public_message=(f"Server has no route to {server_uid}"))
+        return result
 
     def get_role_for_credentials(self, credentials: SyftVerifyKey) -> ServiceRole:
         return self.services.user.get_role_for_credentials(
@@ -1088,7 +1137,7 @@ class Server(AbstractServer):
     @instrument
     def handle_api_call(
         self,
-        api_call: SyftAPICall | SignedSyftAPICall,
+        api_call: SyftAPICall | SignedSyftAPICall | SessionSyftAPICall,
         job_id: UID | None = None,
         check_call_location: bool = True,
     ) -> SignedSyftAPICall:
@@ -1103,21 +1152,57 @@ class Server(AbstractServer):
 
     def handle_api_call_with_unsigned_result(
         self,
-        api_call: SyftAPICall | SignedSyftAPICall,
+        api_call: SyftAPICall | SignedSyftAPICall | SessionSyftAPICall,
         job_id: UID | None = None,
         check_call_location: bool = True,
     ) -> Result | QueueItem | SyftObject | SyftError:
+        session_role: ServiceRole | None = None
         if self.required_signed_calls and isinstance(api_call, SyftAPICall):
             raise SyftException(
                 public_message=f"You sent a {type(api_call)}. This server requires SignedSyftAPICall."
             )
-        else:
-            if not api_call.is_valid:
-                raise SyftException(public_message="Your message signature is invalid")
+        elif type(api_call) is SessionSyftAPICall:
+            session_role = self.session_tokens.verify(
+                api_call.session_token, api_call.credentials
+            )
+            # queued and forwarded calls are verified again by whoever runs them
+            if not api_call.message.blocking or api_call.message.server_uid != self.id:
+                raise SyftException(
+                    public_message="Queued and forwarded calls must be signed."
+                )
+        elif not api_call.is_valid:
+            raise SyftException(public_message="Your message signature is invalid")
+
+        if type(api_call.message) is SyftAPIBatchCall:
+            raise SyftException(
+                public_message="API call batches are sent to /api_batch_call."
+            )
 
         if api_call.message.server_uid != self.id and check_call_location:
             return self.forward_message(api_call=api_call)
 
+        if api_call.message.path == "session.start":
+            if not isinstance(api_call, SignedSyftAPICall):
+                raise SyftException(
+                    public_message="Sessions are started with a signed call."
+                )
+            if not self.primary:
+                # sessions live in the memory of the process that started them
+                raise SyftException(
+                    public_message="Sessions are not supported by servers running several processes."
+                )
+            session_token = self.session_tokens.create(
+                api_call.credentials,
+                role=self.get_role_for_credentials(credentials=api_call.credentials),
+            )
+            return SyftSuccess(message="Session started", value=session_token)
+
+        if api_call.message.path == "session.end":
+            self.session_tokens.revoke(
+                api_call.message.kwargs["session_token"], api_call.credentials
+            )
+            return SyftSuccess(message="Session ended")
+
         if api_call.message.path == "queue":
             return self.resolve_future(
                 credentials=api_call.credentials, uid=api_call.message.kwargs["uid"]
@@ -1130,7 +1215,10 @@ class Server(AbstractServer):
         is_blocking = api_call.message.blocking
 
         credentials: SyftVerifyKey = api_call.credentials
-        role = self.get_role_for_credentials(credentials=credentials)
+        if session_role is not None:
+            role = session_role
+        else:
+            role = self.get_role_for_credentials(credentials=credentials)
         context = AuthedServiceContext(
             server=self,
             credentials=credentials,
@@ -1140,75 +1228,13 @@ class Server(AbstractServer):
         )
 
         if is_blocking or self.is_subprocess:
-            api_call = api_call.message
-
-            role = self.get_role_for_credentials(credentials=credentials)
-            settings = self.get_settings()
-            # TODO: This instance check should be removed once we can ensure that
-            # self.settings will always return a ServerSettings object.
-            if (
-                settings is not None
-                and isinstance(settings, ServerSettings)
-                and not settings.allow_guest_sessions
-                and role == ServiceRole.GUEST
-            ):
-                raise SyftException(
-                    public_message="Server doesn't allow guest sessions."
-                )
-            context = AuthedServiceContext(
-                server=self,
+            return self._execute_api_call(
+                api_call.message,
                 credentials=credentials,
                 role=role,
                 job_id=job_id,
-                is_blocking_api_call=is_blocking,
+                is_blocking=is_blocking,
             )
-
-            AuthServerContextRegistry.set_server_context(self.id, context, credentials)
-
-            user_config_registry = UserServiceConfigRegistry.from_role(role)
-
-            if api_call.path not in user_config_registry:
-                if ServiceConfigRegistry.path_exists(api_call.path):
-                    raise SyftException(
-                        public_message=f"As a `{role}`, "
-                        f"you have no access to: {api_call.path}"
-                    )
-                else:
-                    raise SyftException(
-                        public_message=f"API call not in registered services: {api_call.path}"
-                    )
-
-            _private_api_path = user_config_registry.private_path_for(api_call.path)
-            method = self.get_service_method(_private_api_path)
-            try:
-                logger.info(f"API Call: {api_call}")
-
-                result = method(context, *api_call.args, **api_call.kwargs)
-
-                if isinstance(result, SyftError):
-                    raise TypeError(
-                        "Don't return a SyftError, raise SyftException instead"
-                    )
-                if not isinstance(result, SyftSuccess):
-                    result = SyftSuccess(message="", value=result)
-                result.add_warnings_from_context(context)
-                tb = None
-            except Exception as e:
-                include_traceback = (
-                    self.dev_mode or role.value >= ServiceRole.DATA_OWNER.value
-                )
-                result = SyftError.from_exception(
-                    context=context, exc=e, include_traceback=include_traceback
-                )
-                if not include_traceback:
-                    # then at least log it server side
-                    if isinstance(e, SyftException):
-                        tb = e.get_tb(context, overwrite_permission=True)
-                    else:
-                        tb = traceback.format_exc()
-                    logger.debug(
-                        f"Exception (hidden from DS) happened on the server side:\n{tb}"
-                    )
         else:
             try:
                 return self.add_api_call_to_queue(api_call)
@@ -1226,6 +1252,146 @@ class Server(AbstractServer):
                 print(f"Exception (hidden from DS) happened on the server side:\n{tb}")
         return result
 
+    def _execute_api_call(
+        self,
+        api_call: SyftAPICall,
+        credentials: SyftVerifyKey,
+        role: ServiceRole,
+        job_id: UID | None = None,
+        is_blocking: bool = True,
+    ) -> SyftSuccess | SyftError:
+        """Run a verified `api_call` of `credentials` as `role` in this process."""
+        settings = self.get_settings()
+        # TODO: This instance check should be removed once we can ensure that
+        # self.settings will always return a ServerSettings object.
+        if (
+            settings is not None
+            and isinstance(settings, ServerSettings)
+            and not settings.allow_guest_sessions
+            and role == ServiceRole.GUEST
+        ):
+            raise SyftException(public_message="Server doesn't allow guest sessions.")
+        context = AuthedServiceContext(
+            server=self,
+            credentials=credentials,
+            role=role,
+            job_id=job_id,
+            is_blocking_api_call=is_blocking,
+        )
+
+        AuthServerContextRegistry.set_server_context(self.id, context, credentials)
+
+        user_config_registry = UserServiceConfigRegistry.from_role(role)
+
+        if api_call.path not in user_config_registry:
+            if ServiceConfigRegistry.path_exists(api_call.path):
+                raise SyftException(
+                    public_message=f"As a `{role}`, "
+                    f"you have no access to: {api_call.path}"
+                )
+            else:
+                raise SyftException(
+                    public_message=f"API call not in registered services: {api_call.path}"
+                )
+
+        _private_api_path = user_config_registry.private_path_for(api_call.path)
+        method = self.get_service_method(_private_api_path)
+        try:
+            logger.info(f"API Call: {api_call}")
+
+            result = method(context, *api_call.args, **api_call.kwargs)
+
+            if isinstance(result, SyftError):
+                raise TypeError("Don't return a SyftError, raise SyftException instead")
+            if not isinstance(result, SyftSuccess):
+                result = SyftSuccess(message="", value=result)
+            result.add_warnings_from_context(context)
+            tb = None
+        except Exception as e:
+            include_traceback = (
+                self.dev_mode or role.value >= ServiceRole.DATA_OWNER.value
+            )
+            result = SyftError.from_exception(
+                context=context, exc=e, include_traceback=include_traceback
+            )
+            if not include_traceback:
+                # then at least log it server side
+                if isinstance(e, SyftException):
+                    tb = e.get_tb(context, overwrite_permission=True)
+                else:
+                    tb = traceback.format_exc()
+                logger.debug(
+                    f"Exception (hidden from DS) happened on the server side:\n{tb}"
+                )
+                print(f"Exception (hidden from DS) happened on the server side:\n{tb}")
+        return result
+
+    @instrument
+    def handle_api_batch_call(self, api_call: SignedSyftAPICall) -> SignedSyftAPICall:
+        results = self.handle_api_batch_call_with_unsigned_result(api_call)
+        return SyftAPIData(data=results).sign(self.signing_key)
+
+    def handle_api_batch_call_with_unsigned_result(
+        self, api_call: SignedSyftAPICall
+    ) -> list[Any]:
+        """
+        Run the calls of a signed SyftAPIBatchCall in order and return their results.
+        The signature is verified and the role looked up once for the whole batch.
+        A transactional batch stops at the first failing call, and rolls back the
+        calls before it.
+        """
+        if not isinstance(api_call, SignedSyftAPICall):
+            raise SyftException(public_message="API call batches must be signed.")
+        if not api_call.is_valid:
+            raise SyftException(public_message="Your message signature is invalid")
+        batch = api_call.message
+        if not isinstance(batch, SyftAPIBatchCall):
+            raise SyftException(
+                public_message=f"Expected a SyftAPIBatchCall, got {type(batch)}"
+            )
+        if batch.server_uid != self.id:
+            raise SyftException(
+                public_message="API call batches can't be forwarded to other servers."
+            )
+
+        credentials = api_call.credentials
+        role = self.get_role_for_credentials(credentials=credentials)
+        if not batch.transaction:
+            return [
+                self._handle_batched_call(call, credentials, role)
+                for call in batch.calls
+            ]
+
+        results: list[Any] = []
+        try:
+            with transaction(self.db):
+                for call in batch.calls:
+                    results.append(self._handle_batched_call(call, credentials, role))
+                    if isinstance(results[-1], SyftError):
+                        raise _BatchRollback()
+        except _BatchRollback:
+            pass
+        return results
+
+    def _handle_batched_call(
+        self, api_call: SyftAPICall, credentials: SyftVerifyKey, role: ServiceRole
+    ) -> Any:
+        if api_call.server_uid != self.id:
+            return SyftError(
+                message="API call batches can't be forwarded to other servers."
+            )
+        if api_call.path == "metadata":
+            return self.metadata
+        if not api_call.blocking:
+            return SyftError(message="API call batches only run blocking calls.")
+        try:
+            return self._execute_api_call(api_call, credentials=credentials, role=role)
+        except SyftException as e:
+            context = AuthedServiceContext(
+                server=self, credentials=credentials, role=role
+            )
+            return SyftError.from_exception(context=context, exc=e)
+
     def add_api_endpoint_execution_to_queue(
         self,
         credentials: SyftVerifyKey,
@@ -1561,11 +1727,9 @@ class Server(AbstractServer):
         for_user: SyftVerifyKey | None = None,
         communication_protocol: PROTOCOL_TYPE | None = None,
     ) -> SyftAPI:
-        return SyftAPI.for_user(
-            server=self,
-            user_verify_key=for_user,
-            communication_protocol=communication_protocol,
-        )
+        cached = self.api_cache.get(self, for_user, communication_protocol)
+        # callers set their connection and credentials on the API they get
+        return cached.api.model_copy()
 
     def get_method_with_context(
         self, function: Callable, context: ServerServiceContext
@@ -1603,6 +1767,7 @@ class Server(AbstractServer):
                 settings_stash.set(
                     self.signing_key.verify_key, server_settings
                 ).unwrap()
+                self.settings_cache.clear()
             self.name = server_settings.name
             self.association_request_auto_approval = (
                 server_settings.association_request_auto_approval
@@ -1629,9 +1794,11 @@ class Server(AbstractServer):
                 notifications_enabled=False,
             )
 
-            return settings_stash.set(
+            new_settings = settings_stash.set(
                 credentials=self.signing_key.verify_key, obj=new_settings
             ).unwrap()
+            self.settings_cache.clear()
+            return new_settings
 
 
 class ServerRegistry:
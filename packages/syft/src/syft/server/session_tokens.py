@@ -0,0 +1,105 @@
+# stdlib
+from dataclasses import dataclass
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+
+# relative
+from ..service.user.user_roles import ServiceRole
+from ..types.errors import SyftException
+from .credentials import SyftVerifyKey
+
+# seconds a session token is valid for after its signed login
+SESSION_TOKEN_TTL = int(os.getenv("SYFT_SESSION_TOKEN_TTL", 3600))
+
+
+@dataclass
+class Session:
+    credentials: SyftVerifyKey
+    role: ServiceRole
+    expires_at: int
+
+
+class SessionTokens:
+    """
+    Tokens a user gets with a signed call, authenticating their next calls
+    without a signature. A token is `<session id>.<expiry>.<hmac>`, the HMAC of
+    the session id, verify key and expiry under a secret of this server, so
+    forged tokens are rejected without a lookup. The role of the user is looked
+    up once, when the session starts.
+
+    Sessions end when they expire, are revoked by their user, or when the role
+    of their user changes or the user is deleted.
+    """
+
+    def __init__(self, ttl: int = SESSION_TOKEN_TTL) -> None:
+        self.ttl = ttl
+        self._secret = secrets.token_bytes(32)
+        self._sessions: dict[str, Session] = {}
+        self._lock = threading.Lock()
+
+    def _mac(self, session_id: str, credentials: SyftVerifyKey, expires_at: int) -> str:
+        message = f"{session_id}.{credentials}.{expires_at}".encode()
+        return hmac.new(self._secret, message, hashlib.sha256).hexdigest()
+
+    def create(self, credentials: SyftVerifyKey, role: ServiceRole) -> str:
+        session_id = secrets.token_urlsafe(16)
+        expires_at = int(time.time()) + self.ttl
+        with self._lock:
+            self._prune()
+            self._sessions[session_id] = Session(credentials, role, expires_at)
+        return f"{session_id}.{expires_at}.{self._mac(session_id, credentials, expires_at)}"
+
+    def verify(self, token: str, credentials: SyftVerifyKey) -> ServiceRole:
+        """The role of the session of `credentials` that `token` belongs to."""
+        session_id, _, rest = token.partition(".")
+        expires, _, mac = rest.partition(".")
+        if not expires.isdigit() or not hmac.compare_digest(
+            mac, self._mac(session_id, credentials, int(expires))
+        ):
+            raise SyftException(public_message="Your session token is invalid")
+
+        session = self._sessions.get(session_id)
+        if session is None or session.expires_at <= time.time():
+            raise SyftException(
+                public_message="Your session has expired or was revoked, "
+                "start a new one"
+            )
+        return session.role
+
+    def revoke(self, token: str, credentials: SyftVerifyKey) -> bool:
+        session_id = token.partition(".")[0]
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None or session.credentials != credentials:
+                return False
+            del self._sessions[session_id]
+        return True
+
+    def revoke_user(self, credentials: SyftVerifyKey) -> int:
+        """End all sessions of `credentials`, returns how many there were."""
+        with self._lock:
+            revoked = [
+                session_id
+                for session_id, session in self._sessions.items()
+                if session.credentials == credentials
+            ]
+            for session_id in revoked:
+                del self._sessions[session_id]
+        return len(revoked)
+
+    def _prune(self) -> None:
+        now = time.time()
+        expired = [
+            session_id
+            for session_id, session in self._sessions.items()
+            if session.expires_at <= now
+        ]
+        for session_id in expired:
+            del self._sessions[session_id]
+
+    def __len__(self) -> int:
+        return len(self._sessions)
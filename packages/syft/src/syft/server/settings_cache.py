@@ -0,0 +1,96 @@
+# future
+from __future__ import annotations
+
+# stdlib
+import os
+import threading
+import time
+from typing import Any
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # relative
+    from ..service.metadata.server_metadata import ServerMetadata
+    from ..service.settings.settings import ServerSettings
+    from .server import Server
+
+# seconds cached settings are used for before checking they are still current
+SETTINGS_CHECK_INTERVAL = float(os.getenv("SYFT_SETTINGS_CHECK_INTERVAL", 1))
+
+
+class SettingsCache:
+    """
+    The settings of a server and the metadata made from them, read from the
+    database once and kept until they change. Writes by this process clear the
+    cache. Writes by other processes sharing the database, like the other
+    workers of the server, are found by comparing the stored settings as JSON,
+    at most every `check_interval` seconds.
+
+    `hits` counts the reads answered without querying the database,
+    `version_checks` the reads answered by comparing the stored settings and
+    `misses` the reads of the settings done.
+    """
+
+    def __init__(self, check_interval: float = SETTINGS_CHECK_INTERVAL) -> None:
+        self.check_interval = check_interval
+        self.hits = 0
+        self.version_checks = 0
+        self.misses = 0
+        self._settings: ServerSettings | None = None
+        self._metadata: ServerMetadata | None = None
+        self._version: list[dict[str, Any]] | None = None
+        self._checked_at = 0.0
+        # bumped by clear, so settings read before a write are not kept
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, server: Server) -> ServerSettings | None:
+        """The settings of the server, None if they are not created yet."""
+        now = time.monotonic()
+        with self._lock:
+            settings, version = self._settings, self._version
+            generation = self._generation
+            if settings is not None and now < self._checked_at + self.check_interval:
+                self.hits += 1
+                return settings
+
+        settings_stash = server.services.settings.stash
+        current_version = settings_stash.get_version().unwrap()
+        if settings is not None and current_version == version:
+            with self._lock:
+                self._checked_at = now
+                self.version_checks += 1
+            return settings
+
+        all_settings = settings_stash.get_all(server.verify_key).unwrap()
+        with self._lock:
+            self.misses += 1
+        if len(all_settings) == 0:
+            return None
+        settings = all_settings[0]
+        server.update_self(settings)
+        with self._lock:
+            if generation == self._generation:
+                self._settings, self._version = settings, current_version
+                self._metadata = None
+                self._checked_at = now
+        return settings
+
+    def get_metadata(self, server: Server, settings: ServerSettings) -> ServerMetadata:
+        """The metadata of the server, made once per version of its settings."""
+        with self._lock:
+            metadata = self._metadata
+            if metadata is not None and settings is self._settings:
+                return metadata
+        metadata = server.make_metadata(settings)
+        with self._lock:
+            if settings is self._settings:
+                self._metadata = metadata
+        return metadata
+
+    def clear(self) -> None:
+        with self._lock:
+            self._settings = None
+            self._metadata = None
+            self._version = None
+            self._generation += 1
@@ -9,6 +9,7 @@ import os
 from pathlib import Path
 import platform
 import signal
+import socket
 import subprocess  # nosec
 import sys
 import time
@@ -34,6 +35,8 @@ from ..util.telemetry import instrument_fastapi
 from ..util.util import os_name
 from .datasite import Datasite
 from .enclave import Enclave
+from .env import SERVER_PRIVATE_KEY
+from .env import SERVER_UID
 from .gateway import Gateway
 from .routes import make_routes
 from .server import Server
@@ -58,6 +61,8 @@ class AppSettings(BaseSettings):
     server_side_type: ServerSideType = ServerSideType.HIGH_SIDE
     deployment_type: DeploymentType = DeploymentType.REMOTE
     processes: int = 1
+    http_workers: int = 1
+    primary: bool = True
     reset: bool = False
     dev_mode: bool = False
     enable_warnings: bool = False
@@ -84,9 +89,7 @@ def get_lifetime(worker: Server) -> Callable:
     return lifespan
 
 
-def app_factory() -> FastAPI:
-    settings = AppSettings()
-
+def make_server(settings: AppSettings) -> Server:
     worker_classes = {
         ServerType.DATASITE: Datasite,
         ServerType.GATEWAY: Gateway,
@@ -98,7 +101,7 @@ def app_factory() -> FastAPI:
         )
     worker_class = worker_classes[settings.server_type]
 
-    kwargs = settings.model_dump()
+    kwargs = settings.model_dump(exclude={"http_workers"})
 
     logger.info(
         f"Starting server with settings: {kwargs} and worker class: {worker_class}"
@@ -108,9 +111,13 @@ def app_factory() -> FastAPI:
             f"WARN: private key is based on server name: {settings.name} in dev_mode. "
             "Don't run this in production."
         )
-        worker = worker_class.named(**kwargs)
-    else:
-        worker = worker_class(**kwargs)
+        return worker_class.named(**kwargs)
+    return worker_class(**kwargs)
+
+
+def app_factory() -> FastAPI:
+    settings = AppSettings()
+    worker = make_server(settings)
 
     worker_lifespan = get_lifetime(worker=worker)
 
@@ -147,6 +154,39 @@ def attach_debugger() -> None:
     print("Debugger attached", flush=True)
 
 
+def serve_http_worker(config: uvicorn.Config, sockets: list[socket.socket]) -> None:
+    config.configure_logging()
+    uvicorn.Server(config).run(sockets=sockets)
+
+
+def run_http_workers(config: uvicorn.Config, workers: int) -> None:
+    """Serves requests from `workers` processes accepting on the same socket,
+    until this process is terminated.
+
+    uvicorn's own supervisor restarts workers that don't answer its health check
+    within 5 seconds, which is less than it takes a worker to import syft and
+    build its server.
+    """
+    sockets = [config.bind_socket()]
+    spawn = multiprocessing.get_context("spawn")
+    processes = [
+        spawn.Process(target=serve_http_worker, args=(config, sockets))
+        for _ in range(workers)
+    ]
+    # leave through the finally block on SIGTERM, to stop the workers as well
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+
 def run_uvicorn(
     host: str,
     port: int,
@@ -155,6 +195,7 @@ def run_uvicorn(
 ) -> None:
     log_level = kwargs.get("log_level")
     dev_mode = kwargs.get("dev_mode")
+    http_workers = kwargs.get("http_workers", 1)
     should_reset = dev_mode and kwargs.get("reset")
 
     if should_reset:
@@ -192,19 +233,48 @@ def run_uvicorn(
     # sys.stdin while running uvicorn programmatically.
     sys.stdin = None  # type: ignore
 
+    primary = None
+    if http_workers > 1:
+        # The primary server is built in this process. It does the startup work
+        # (migrations, root admin, settings) and runs the queue producer, consumers
+        # and background tasks. Each uvicorn worker builds a server over the same db
+        # and blob storage that only serves requests, with the same id and key.
+        primary = make_server(AppSettings())
+        os.environ[SERVER_UID] = str(primary.id)
+        os.environ[SERVER_PRIVATE_KEY] = str(primary.signing_key)
+        os.environ[f"{env_prefix}PRIMARY"] = "False"
+        os.environ[f"{env_prefix}RESET"] = "False"
+        queue_port = primary.queue_config.client_config.queue_port
+        if queue_port is not None:
+            os.environ[f"{env_prefix}QUEUE_PORT"] = str(queue_port)
+
     # Signal the parent process that we are starting the uvicorn server.
     starting_uvicorn_event.set()
 
     # Finally, run the uvicorn server.
-    uvicorn.run(
+    if primary is None:
+        uvicorn.run(
+            "syft.server.uvicorn:app_factory",
+            host=host,
+            port=port,
+            factory=True,
+            reload=dev_mode,
+            reload_dirs=[Path(__file__).parent.parent] if dev_mode else None,
+            log_level=log_level,
+        )
+        return
+
+    config = uvicorn.Config(
         "syft.server.uvicorn:app_factory",
         host=host,
         port=port,
         factory=True,
-        reload=dev_mode,
-        reload_dirs=[Path(__file__).parent.parent] if dev_mode else None,
         log_level=log_level,
     )
+    try:
+        run_http_workers(config, http_workers)
+    finally:
+        primary.stop()
 
 
 def serve_server(
@@ -215,6 +285,7 @@ def serve_server(
     host: str = "0.0.0.0",  # nosec
     port: int = 8080,
     processes: int = 1,
+    http_workers: int = 1,
     reset: bool = False,
     dev_mode: bool = False,
     tail: bool = False,
@@ -243,6 +314,7 @@ def serve_server(
             "host": host,
             "port": port,
             "processes": processes,
+            "http_workers": http_workers,
             "reset": reset,
             "dev_mode": dev_mode,
             "server_side_type": server_side_type,
@@ -287,7 +359,8 @@ def serve_server(
                 except SystemExit:
                     os._exit(130)
         else:
-            for i in range(WAIT_TIME_SECONDS):
+            # every worker builds its server before serving requests
+            for i in range(WAIT_TIME_SECONDS * http_workers):
                 try:
                     req = requests.get(
                         f"http://{host}:{port}{API_PATH}/metadata",
@@ -6,10 +6,8 @@ from collections.abc import Callable
 from collections.abc import Iterable
 from enum import Enum
 import inspect
-from io import BytesIO
 import logging
 from pathlib import Path
-import sys
 import threading
 import time
 import types
@@ -29,7 +27,7 @@ from ...client.api import SyftAPI
 from ...client.api import SyftAPICall
 from ...client.client import SyftClient
 from ...serde.serializable import serializable
-from ...serde.serialize import _serialize as serialize
+from ...serde.serialize import _serialize_to_file
 from ...server.credentials import SyftVerifyKey
 from ...service.blob_storage.util import can_upload_to_blob_storage
 from ...service.response import SyftSuccess
@@ -820,8 +818,7 @@ class ActionObject(SyncableSyftObject):
                             f" the blob store but to memory cache since it is small."
                         )
                     )
-                serialized = serialize(data, to_bytes=True)
-                size = sys.getsizeof(serialized)
+                serialized, size = _serialize_to_file(data)
                 storage_entry = CreateBlobStorageEntry.from_obj(data, file_size=size)
 
                 if not TraceResultRegistry.current_thread_is_tracing():
@@ -834,14 +831,15 @@ class ActionObject(SyncableSyftObject):
                     syft_server_location=self.syft_server_location,
                     syft_client_verify_key=self.syft_client_verify_key,
                 )
-                if allocate_method is not None:
-                    blob_deposit_object = allocate_method(storage_entry)
-                    blob_deposit_object.write(BytesIO(serialized)).unwrap()
-                    self.syft_blob_storage_entry_id = (
-                        blob_deposit_object.blob_storage_entry_id
-                    )
-                else:
-                    logger.warn("cannot save to blob storage. allocate_method=None")
+                with serialized:
+                    if allocate_method is not None:
+                        blob_deposit_object = allocate_method(storage_entry)
+                        blob_deposit_object.write(serialized).unwrap()
+                        self.syft_blob_storage_entry_id = (
+                            blob_deposit_object.blob_storage_entry_id
+                        )
+                    else:
+                        logger.warn("cannot save to blob storage. allocate_method=None")
 
             self.syft_action_data_type = type(data)
             self._set_reprs(data)
@@ -40,6 +40,7 @@ from ...abstract_server import ServerType
 from ...client.api import APIRegistry
 from ...client.api import ServerIdentity
 from ...serde.deserialize import _deserialize
+from ...serde.lazy import LazyAttribute
 from ...serde.serializable import serializable
 from ...serde.serialize import _serialize
 from ...server.credentials import SyftVerifyKey
@@ -550,6 +551,15 @@ class UserCode(SyncableSyftObject):
         "output_policy_init_kwargs",
         "output_policy_state",
     ]
+    # decoded on first access, most reads only need the status or the names
+    __lazy_attrs__: ClassVar[list[str]] = [
+        "raw_code",
+        "parsed_code",
+        "signature",
+        "input_policy_init_kwargs",
+        "output_policy_init_kwargs",
+        "nested_codes",
+    ]
 
     @field_validator("service_func_name", mode="after")
     @classmethod
@@ -563,7 +573,7 @@ class UserCode(SyncableSyftObject):
         # Get the attribute from the class, it might be a descriptor or None
         attr = getattr(type(self), key, None)
         # Check if the attribute is a data descriptor
-        if inspect.isdatadescriptor(attr):
+        if inspect.isdatadescriptor(attr) and not isinstance(attr, LazyAttribute):
             if hasattr(attr, "fset"):
                 attr.fset(self, value)
             else:
@@ -127,6 +127,8 @@ class Job(SyncableSyftObject):
     ]
 
     __exclude_sync_diff_attrs__ = ["action", "server_uid"]
+    # decoded on first access, most reads only need the status
+    __lazy_attrs__ = ["result", "action"]
     __table_coll_widths__ = [
         "min-content",
         "auto",
@@ -17,6 +17,8 @@ class SyftLog(SyncableSyftObject):
 
     __repr_attrs__ = ["stdout", "stderr"]
     __exclude_sync_diff_attrs__: list[str] = []
+    # decoded on first access
+    __lazy_attrs__ = ["stdout", "stderr"]
     __private_sync_attr_mocks__: ClassVar[dict[str, Any]] = {
         "stderr": "",
         "stdout": "",
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 # stdlib
 from collections.abc import Callable
+from typing import ClassVar
 
 # third party
 from packaging import version
@@ -12,13 +13,17 @@ from pydantic import model_validator
 # relative
 from ...abstract_server import ServerType
 from ...protocol.data_protocol import get_data_protocol
+from ...serde.compression import supported_compressions
 from ...serde.serializable import serializable
+from ...serde.type_ids import type_table_id
 from ...server.credentials import SyftVerifyKey
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
 from ...types.syft_object import StorableObjectType
 from ...types.syft_object import SyftObject
+from ...types.transforms import TransformContext
 from ...types.transforms import convert_types
 from ...types.transforms import drop
+from ...types.transforms import make_set_default
 from ...types.transforms import rename
 from ...types.transforms import transform
 from ...types.uid import UID
@@ -46,6 +51,7 @@ def check_version(
 class ServerMetadata(SyftObject):
     __canonical_name__ = "ServerMetadata"
     __version__ = SYFT_OBJECT_VERSION_1
+    __cache_hash__: ClassVar[bool] = True
 
     name: str
     id: UID
@@ -87,6 +93,9 @@ class ServerMetadataJSON(BaseModel, StorableObjectType):
     server_side_type: str
     show_warnings: bool
     supported_protocols: list = []
+    supported_compressions: list = []
+    # id of the type table used to encode types as integers, see serde.type_ids
+    type_table_id: str | None = None
     min_size_blob_storage_mb: int
 
     @model_validator(mode="before")
@@ -105,6 +114,13 @@ class ServerMetadataJSON(BaseModel, StorableObjectType):
         )
 
 
+def add_type_table_id(context: TransformContext) -> TransformContext:
+    # the table is built on first use, once every type is registered
+    if context.output is not None:
+        context.output["type_table_id"] = type_table_id()
+    return context
+
+
 @transform(ServerMetadata, ServerMetadataJSON)
 def metadata_to_json() -> list[Callable]:
     return [
@@ -113,13 +129,22 @@ def metadata_to_json() -> list[Callable]:
         convert_types(["id", "verify_key", "server_type"], str),
         rename("highest_version", "highest_object_version"),
         rename("lowest_version", "lowest_object_version"),
+        make_set_default("supported_compressions", supported_compressions()),
+        add_type_table_id,
     ]
 
 
 @transform(ServerMetadataJSON, ServerMetadata)
 def json_to_metadata() -> list[Callable]:
     return [
-        drop(["metadata_version", "supported_protocols"]),
+        drop(
+            [
+                "metadata_version",
+                "supported_protocols",
+                "supported_compressions",
+                "type_table_id",
+            ]
+        ),
         convert_types(["id", "verify_key"], [UID, SyftVerifyKey]),
         convert_types(["server_type"], ServerType),
         rename("highest_object_version", "highest_version"),
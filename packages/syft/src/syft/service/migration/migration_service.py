@@ -472,6 +472,8 @@ class MigrationService(AbstractService):
 
         # apply metadata
         self._update_store_metadata(context, migration_data.metadata).unwrap()
+        # the settings are among the migrated objects
+        context.server.settings_cache.clear()
         return SyftSuccess(message="Migration completed successfully")
 
     @service_method(
@@ -1,8 +1,6 @@
 # stdlib
 from collections.abc import Callable
-from io import BytesIO
 from pathlib import Path
-import sys
 from typing import Any
 
 # third party
@@ -10,9 +8,10 @@ from typing_extensions import Self
 import yaml
 
 # relative
-from ...serde.deserialize import _deserialize
+from ...serde.deserialize import _deserialize_from
 from ...serde.serializable import serializable
-from ...serde.serialize import _serialize
+from ...serde.serialize import _serialize_to
+from ...serde.serialize import _serialize_to_file
 from ...server.credentials import SyftSigningKey
 from ...server.credentials import SyftVerifyKey
 from ...store.db.stash import ObjectStash
@@ -162,7 +161,7 @@ class MigrationData(SyftObject):
             raise SyftException(f"File {str(path)} does not exist.")
 
         with open(path, "rb") as f:
-            res: SyftObject = _deserialize(f.read(), from_bytes=True)
+            res: SyftObject = _deserialize_from(f)
 
         if not isinstance(res, MigrationData):
             latest_version = SyftObjectRegistry.get_latest_version(  # type: ignore[unreachable]
@@ -186,7 +185,7 @@ class MigrationData(SyftObject):
 
         path = Path(path)
         with open(path, "wb") as f:
-            f.write(_serialize(self, to_bytes=True))
+            _serialize_to(self, f)
 
         yaml_path = Path(yaml_path)
         migration_config = self.make_migration_config()
@@ -221,14 +220,14 @@ class MigrationData(SyftObject):
         data = self.blobs[obj.id]
 
         migrated_obj = obj.migrate_to(BlobStorageEntry.__version__, Context())
-        serialized = _serialize(data, to_bytes=True)
-        size = sys.getsizeof(serialized)
-        blob_create = CreateBlobStorageEntry.from_blob_storage_entry(migrated_obj)
-        blob_create.file_size = size
-        blob_deposit_object = api.services.blob_storage.allocate_for_user(
-            blob_create, migrated_obj.uploaded_by
-        )
-        return blob_deposit_object.write(BytesIO(serialized)).unwrap()
+        serialized, size = _serialize_to_file(data)
+        with serialized:
+            blob_create = CreateBlobStorageEntry.from_blob_storage_entry(migrated_obj)
+            blob_create.file_size = size
+            blob_deposit_object = api.services.blob_storage.allocate_for_user(
+                blob_create, migrated_obj.uploaded_by
+            )
+            return blob_deposit_object.write(serialized).unwrap()
 
     def get_items_by_canonical_name(self, canonical_name: str) -> list[SyftObject]:
         for k, v in self.store_objects.items():
@@ -86,6 +86,10 @@ class PeerHealthCheckTask:
                         f"{peer_update.ping_status.value.lower()}"
                     )
 
+            if peer_update.ping_status == ServerPeerConnectionStatus.TIMEOUT:
+                # the next message forwarded to the peer makes a new client
+                context.server.peer_client_cache.evict(peer.id)
+
             result = network_stash.update(
                 credentials=context.server.verify_key,
                 obj=peer_update,
@@ -368,6 +368,8 @@ class Request(SyncableSyftObject):
         "code_id",
     ]
     __attr_unique__ = ["request_hash"]
+    # decoded on first access
+    __lazy_attrs__ = ["changes"]
     __repr_attrs__ = [
         "request_time",
         "updated_at",
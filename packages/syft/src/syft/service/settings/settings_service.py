@@ -70,7 +70,9 @@ class SettingsService(AbstractService):
         self, context: AuthedServiceContext, settings: ServerSettings
     ) -> ServerSettings:
         """Set a new the Server Settings"""
-        return self.stash.set(context.credentials, settings).unwrap()
+        new_settings = self.stash.set(context.credentials, settings).unwrap()
+        context.server.settings_cache.clear()
+        return new_settings
 
     @service_method(
         path="settings.update",
@@ -132,6 +134,8 @@ class SettingsService(AbstractService):
             update_result = self.stash.update(
                 context.credentials, obj=new_settings
             ).unwrap()
+            context.server.api_cache.clear()
+            context.server.settings_cache.clear()
 
             # If notifications_enabled is present in the update, we need to update the notifier settings
             if settings.notifications_enabled is not Empty:  # type: ignore[comparison-overlap]
@@ -182,6 +186,8 @@ class SettingsService(AbstractService):
             updated_settings = self.stash.update(
                 context.credentials, new_settings
             ).unwrap()
+            context.server.api_cache.clear()
+            context.server.settings_cache.clear()
             return SyftSuccess(
                 message=(
                     "Settings updated successfully. "
@@ -1,6 +1,16 @@
+# stdlib
+from typing import Any
+
+# third party
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
 # relative
 from ...serde.serializable import serializable
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
+from ...store.document_store_errors import StashException
+from ...types.result import as_result
 from ...util.telemetry import instrument
 from .settings import ServerSettings
 
@@ -8,4 +18,13 @@ from .settings import ServerSettings
 @instrument
 @serializable(canonical_name="SettingsStashSQL", version=1)
 class SettingsStash(ObjectStash[ServerSettings]):
-    pass
+    @as_result(StashException)
+    @with_session
+    def get_version(self, session: Session = None) -> list[dict[str, Any]]:
+        """The stored settings as JSON, which changes with every write to them.
+
+        Reading it is several times cheaper than reading the settings, as they
+        are not deserialized.
+        """
+        stmt = sa.select(self.table.c.fields).order_by(self.table.c.id)
+        return [row.fields for row in session.execute(stmt)]
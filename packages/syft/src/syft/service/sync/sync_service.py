@@ -83,7 +83,9 @@ class SyncService(AbstractService):
 
     def set_obj_ids(self, context: AuthedServiceContext, x: Any) -> None:
         if hasattr(x, "__dict__") and isinstance(x, SyftObject):
-            for val in x.__dict__.values():
+            for name in x.__dict__.keys():
+                # getattr resolves lazily deserialized fields
+                val = getattr(x, name)
                 if isinstance(val, list | tuple):
                     for v in val:
                         self.set_obj_ids(context, v)
@@ -532,6 +532,10 @@ class UserService(AbstractService):
             credentials=context.credentials, obj=user, has_permission=True
         ).unwrap()
 
+        if updates_role:
+            # sessions keep the role the user had when they started
+            context.server.session_tokens.revoke_user(user.verify_key)
+
         if user.role == ServiceRole.ADMIN:
             settings_stash = SettingsStash(store=self.stash.db)
             settings = settings_stash.get_all(
@@ -545,6 +549,7 @@ class UserService(AbstractService):
                 settings_stash.update(
                     credentials=context.credentials, obj=settings_data
                 )
+                context.server.settings_cache.clear()
 
         return user.to(UserView)
 
@@ -577,9 +582,11 @@ class UserService(AbstractService):
             )
 
         # TODO: Remove notifications for the deleted user
-        return self.stash.delete_by_uid(
+        deleted_uid = self.stash.delete_by_uid(
             credentials=context.credentials, uid=uid
         ).unwrap()
+        context.server.session_tokens.revoke_user(user_to_delete.verify_key)
+        return deleted_uid
 
     def exchange_credentials(self, context: UnauthedServiceContext) -> SyftSuccess:
         """Verify user
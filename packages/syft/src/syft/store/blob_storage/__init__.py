@@ -43,9 +43,9 @@ Read/retrieve SyftObject from blob storage
 # stdlib
 from collections.abc import Callable
 from collections.abc import Generator
-from io import BytesIO
 import logging
 from typing import Any
+from typing import BinaryIO
 
 # third party
 from pydantic import BaseModel
@@ -221,7 +221,7 @@ class BlobDeposit(SyftObject):
     blob_storage_entry_id: UID
 
     @as_result(SyftException)
-    def write(self, data: BytesIO) -> SyftSuccess:
+    def write(self, data: BinaryIO) -> SyftSuccess:
         raise NotImplementedError
 
 
@@ -1,7 +1,7 @@
 # stdlib
-from io import BytesIO
 from pathlib import Path
 from typing import Any
+from typing import BinaryIO
 
 # third party
 from typing_extensions import Self
@@ -30,7 +30,7 @@ class OnDiskBlobDeposit(BlobDeposit):
     __version__ = SYFT_OBJECT_VERSION_1
 
     @as_result(SyftException)
-    def write(self, data: BytesIO) -> SyftSuccess:
+    def write(self, data: BinaryIO) -> SyftSuccess:
         # relative
         from ...service.service import from_api_or_context
 
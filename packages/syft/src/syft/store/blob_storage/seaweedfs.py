@@ -1,11 +1,11 @@
 # stdlib
 from collections.abc import Generator
-from io import BytesIO
 import logging
 import math
 from queue import Queue
 import threading
 from typing import Any
+from typing import BinaryIO
 
 # third party
 import boto3
@@ -64,7 +64,7 @@ class SeaweedFSBlobDeposit(BlobDeposit):
     proxy_server_uid: UID | None = None
 
     @as_result(SyftException)
-    def write(self, data: BytesIO) -> SyftSuccess:
+    def write(self, data: BinaryIO) -> SyftSuccess:
         # relative
         api = self.get_api_wrapped()
 
@@ -1,6 +1,10 @@
 # stdlib
+from collections.abc import Callable
+import json
 import logging
+import math
 from pathlib import Path
+from typing import Any
 from typing import Generic
 from typing import TypeVar
 from urllib.parse import urlparse
@@ -18,9 +22,63 @@ from ...util.telemetry import instrument_sqlalchemny
 from .schema import PostgresBase
 from .schema import SQLiteBase
 
+try:
+    # third party
+    import orjson
+except ImportError:  # nosec
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 instrument_sqlalchemny()
 
+if orjson is not None:
+    # datetimes and dataclasses are passed through to be rejected, like json does
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(map(_has_non_finite_float, obj.values()))
+    if isinstance(obj, list):
+        return any(map(_has_non_finite_float, obj))
+    return False
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Encode a JSON column, with orjson when it is installed and with json otherwise.
+    Values orjson can't write so that they are read back the same, integers over
+    64 bits and NaN or infinities, are rejected when it is used.
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        # orjson writes NaN and infinities as null
+        if b"null" in encoded and _has_non_finite_float(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return encoded.decode()
+    return json.dumps(obj)  # type: ignore[unreachable]
+
+
+def json_loads(value: str) -> Any:
+    """
+    Decode a JSON column, with the library json_dumps encodes with. Rows written by
+    json before orjson was installed can hold NaN or infinities, which orjson
+    rejects, those are read with json. Integers over 64 bits in such rows are read
+    as floats by orjson.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
+
 
 @serializable(canonical_name="DBConfig", version=1)
 class DBConfig(BaseModel):
@@ -59,14 +117,16 @@ class DBManager(Generic[ConfigT]):
         config: ConfigT,
         server_uid: UID,
         root_verify_key: SyftVerifyKey,
+        json_serializer: Callable[[Any], str] = json_dumps,
+        json_deserializer: Callable[[str], Any] = json_loads,
     ) -> None:
         self.config = config
         self.root_verify_key = root_verify_key
         self.server_uid = server_uid
         self.engine = create_engine(
             config.connection_string,
-            # json_serializer=dumps,
-            # json_deserializer=loads,
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
         )
         logger.info(f"Connecting to {config.connection_string}")
         self.sessionmaker = sessionmaker(bind=self.engine)
@@ -1,7 +1,11 @@
 # stdlib
 from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
 import inspect
+import os
 from typing import Any
 from typing import Generic
 from typing import ParamSpec
@@ -50,6 +54,9 @@ from .schema import SQLiteBase
 from .schema import create_table
 from .sqlite import SQLiteDBManager
 
+# set to false to validate every row loaded from the database
+TRUSTED_LOAD_ENABLED = os.getenv("SYFT_TRUSTED_LOAD_ENABLED", "true").lower() == "true"
+
 StashT = TypeVar("StashT", bound=SyftObject)
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -88,6 +95,10 @@ def with_session(func: Callable[P, T]) -> Callable[P, T]:  # type: ignore
     @wraps(func)
     def wrapper(self: "ObjectStash[StashT]", *args: Any, **kwargs: Any) -> Any:
         if inject_session and kwargs.get("session") is None:
+            session = _transaction_sessions.get().get(self.db)
+            if session is not None:
+                kwargs["session"] = session
+                return func(self, *args, **kwargs)
             with self.sessionmaker() as session:
                 with session.begin():
                     kwargs["session"] = session
@@ -97,9 +108,39 @@ def with_session(func: Callable[P, T]) -> Callable[P, T]:  # type: ignore
     return wrapper  # type: ignore
 
 
+# sessions of the transactions opened with `transaction`, by database
+_transaction_sessions: ContextVar[dict[DBManager, Session]] = ContextVar(
+    "_transaction_sessions", default={}
+)
+
+
+@contextmanager
+def transaction(db: DBManager) -> Iterator[Session]:
+    """
+    Run every stash call on `db` made in this context in one transaction, committed
+    when the context exits and rolled back if it raises. Nested transactions on the
+    same database join the outer one.
+    """
+    sessions = _transaction_sessions.get()
+    if db in sessions:
+        yield sessions[db]
+        return
+
+    with db.sessionmaker() as session:
+        with session.begin():
+            token = _transaction_sessions.set({**sessions, db: session})
+            try:
+                yield session
+            finally:
+                _transaction_sessions.reset(token)
+
+
 @instrument
 class ObjectStash(Generic[StashT]):
     allow_any_type: bool = False
+    # rows are written by the server after validation, so rows stored at the
+    # latest object version are loaded without validating them again
+    trusted_load: bool = TRUSTED_LOAD_ENABLED
 
     def __init__(self, store: DBManager) -> None:
         self.db = store
@@ -280,7 +321,7 @@ class ObjectStash(Generic[StashT]):
 
     def row_as_obj(self, row: Row) -> StashT:
         # TODO make unwrappable serde
-        return deserialize_json(row.fields)
+        return deserialize_json(row.fields, trusted=self.trusted_load)
 
     @with_session
     def get_role(
@@ -40,8 +40,10 @@ from typeguard import check_type
 from typing_extensions import Self
 
 # relative
+from ..serde.lazy import LazyValue
+from ..serde.lazy import resolve_lazy_values
 from ..serde.serializable import serializable
-from ..serde.serialize import _serialize as serialize
+from ..serde.serialize import _serialize_segments
 from ..server.credentials import SyftVerifyKey
 from ..util.autoreload import autoreload_enabled
 from ..util.markdown import as_markdown_python_code
@@ -124,9 +126,11 @@ class SyftHashableObject:
         return int.from_bytes(self.__sha256__(), byteorder="big")
 
     def __sha256__(self) -> bytes:
-        self.__hash_exclude_attrs__.extend(DYNAMIC_SYFT_ATTRIBUTES)
-        _bytes = serialize(self, to_bytes=True, for_hashing=True)
-        return sha256(_bytes).digest()
+        # the serde plan excludes __hash_exclude_attrs__ and DYNAMIC_SYFT_ATTRIBUTES
+        digest = sha256()
+        for segment in _serialize_segments(self, for_hashing=True):
+            digest.update(segment)
+        return digest.digest()
 
     def hash(self) -> str:
         return self.__sha256__().hex()
@@ -142,6 +146,31 @@ class SyftBaseObject(pydantic.BaseModel, SyftHashableObject):
     syft_server_location: UID | None = Field(default=None, exclude=True)
     syft_client_verify_key: SyftVerifyKey | None = Field(default=None, exclude=True)
 
+    # memoized result of __sha256__, dropped whenever an attribute is set.
+    # Mutating a nested value in place is not tracked, so only classes holding
+    # immutable values opt in with __cache_hash__
+    __slots__ = ("_syft_hash_memo",)
+    __cache_hash__: ClassVar[bool] = False
+
+    def __sha256__(self) -> bytes:
+        if not type(self).__cache_hash__:
+            return super().__sha256__()
+        try:
+            memo = _HASH_MEMO.__get__(self)
+        except AttributeError:
+            memo = None
+        if memo is None:
+            memo = super().__sha256__()
+            _HASH_MEMO.__set__(self, memo)
+        return memo
+
+    def _syft_clear_hash_memo(self) -> None:
+        _HASH_MEMO.__set__(self, None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        _HASH_MEMO.__set__(self, None)
+        super().__setattr__(name, value)
+
     def _set_obj_location_(self, server_uid: UID, credentials: SyftVerifyKey) -> None:
         self.syft_server_location = server_uid
         self.syft_client_verify_key = credentials
@@ -177,6 +206,11 @@ class SyftBaseObject(pydantic.BaseModel, SyftHashableObject):
         )
 
 
+# slot descriptor of the hash memo, used directly so that classes overriding
+# __getattribute__ (like ActionObject) are not involved
+_HASH_MEMO: Any = SyftBaseObject.__dict__["_syft_hash_memo"]
+
+
 class Context(SyftBaseObject):
     __canonical_name__ = "Context"
     __version__ = SYFT_OBJECT_VERSION_1
@@ -189,9 +223,24 @@ def cached_get_type_hints(cls: type) -> dict[str, Any]:
     return typing.get_type_hints(cls)
 
 
+def chain_migrations(migrations: list[Callable]) -> Callable:
+    """One migration running `migrations` in order, each on the previous result."""
+    if len(migrations) == 1:
+        return migrations[0]
+
+    def migrate_chain(obj: Any, context: Context | None = None) -> Any:
+        for migration in migrations:
+            obj = migration(obj, context)
+        return obj
+
+    return migrate_chain
+
+
 class SyftMigrationRegistry:
     __migration_version_registry__: dict[str, dict[int, str]] = {}
     __migration_function_registry__: dict[str, dict[str, Callable]] = {}
+    # resolved migrations by (type_from, version_to), see get_migration_for_version
+    __migration_chain_cache__: dict[tuple[type, int], Callable] = {}
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         """
@@ -215,6 +264,7 @@ class SyftMigrationRegistry:
             mapping_string = klass.__canonical_name__
             klass_version = klass.__version__
             fqn = f"{klass.__module__}.{klass.__name__}"
+            cls.__migration_chain_cache__.clear()
 
             if (
                 mapping_string in cls.__migration_version_registry__
@@ -263,6 +313,7 @@ class SyftMigrationRegistry:
             if klass_type_str not in cls.__migration_function_registry__:
                 cls.__migration_function_registry__[klass_type_str] = {}
             cls.__migration_function_registry__[klass_type_str][mapping_string] = method
+            cls.__migration_chain_cache__.clear()
         else:
             raise Exception(
                 f"Available versions for {klass_type_str} are: {available_versions}."
@@ -306,8 +357,25 @@ class SyftMigrationRegistry:
     @classmethod
     def get_migration_for_version(
         cls, type_from: type[SyftBaseObject], version_to: int
+    ) -> Callable:
+        """
+        Migration of `type_from` to `version_to` of the same canonical name. When no
+        migration is registered between the two versions, the shortest chain of
+        registered migrations is composed into one. Resolved migrations are cached.
+        """
+        key = (type_from, version_to)
+        migration = cls.__migration_chain_cache__.get(key)
+        if migration is None:
+            migration = cls._resolve_migration(type_from, version_to)
+            cls.__migration_chain_cache__[key] = migration
+        return migration
+
+    @classmethod
+    def _resolve_migration(
+        cls, type_from: type[SyftBaseObject], version_to: int
     ) -> Callable:
         canonical_name = type_from.__canonical_name__
+        migrations = cls.__migration_function_registry__.get(canonical_name, {})
         for type_from_mro in type_from.mro():
             if (
                 issubclass(type_from_mro, SyftBaseObject)
@@ -318,19 +386,51 @@ class SyftMigrationRegistry:
                     continue
                 version_from = type_from_mro.__version__
                 mapping_string = f"{version_from}x{version_to}"
-                if (
-                    mapping_string
-                    in cls.__migration_function_registry__[type_from.__canonical_name__]
-                ):
-                    return cls.__migration_function_registry__[klass_from][
-                        mapping_string
-                    ]
+                if mapping_string in migrations:
+                    return migrations[mapping_string]
+
+        # breadth first search for the shortest chain of migrations
+        steps: dict[int, list[int]] = defaultdict(list)
+        for mapping_string in migrations:
+            step_from, step_to = mapping_string.split("x")
+            steps[int(step_from)].append(int(step_to))
+        paths = {type_from.__version__: [type_from.__version__]}
+        queue = [type_from.__version__]
+        for version in queue:
+            for next_version in steps[version]:
+                if next_version in paths:
+                    continue
+                paths[next_version] = paths[version] + [next_version]
+                queue.append(next_version)
+            if version_to in paths:
+                path = paths[version_to]
+                return chain_migrations(
+                    [migrations[f"{a}x{b}"] for a, b in zip(path, path[1:])]
+                )
 
         raise Exception(
             f"No migration found for class type: {type_from} to "
             f"version: {version_to} in the migration registry."
         )
 
+    @classmethod
+    def warm_migration_cache(cls) -> None:
+        """Resolve the migrations of every registered version to the latest one."""
+        for canonical_name in cls.__migration_function_registry__:
+            versions = SyftObjectRegistry.get_versions(canonical_name)
+            if len(versions) < 2:
+                continue
+            latest_version = max(versions)
+            for version in versions:
+                if version == latest_version:
+                    continue
+                type_from = SyftObjectRegistry.get_serde_class(canonical_name, version)
+                try:
+                    cls.get_migration_for_version(type_from, latest_version)
+                except Exception:  # nosec
+                    # not every old version can be migrated to the latest one
+                    pass
+
 
 print_type_cache: dict = defaultdict(list)
 
@@ -437,6 +537,7 @@ class SyftObject(SyftObjectVersioned):
             )
             if type(new_object) == type(self):
                 self.__dict__.update(new_object.__dict__)
+                self._syft_clear_hash_memo()
         except Exception as _:
             return
 
@@ -549,7 +650,19 @@ class SyftObject(SyftObjectVersioned):
 
     # allows splatting with **
     def __getitem__(self, key: str | int) -> Any:
-        return self.__dict__.__getitem__(key)  # type: ignore
+        value = self.__dict__.__getitem__(key)  # type: ignore
+        if type(value) is LazyValue:
+            return getattr(self, key)  # type: ignore
+        return value
+
+    # pydantic reads the fields without the attributes that decode lazy values
+    def model_dump(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        resolve_lazy_values(self)
+        return super().model_dump(*args, **kwargs)
+
+    def model_dump_json(self, *args: Any, **kwargs: Any) -> str:
+        resolve_lazy_values(self)
+        return super().model_dump_json(*args, **kwargs)
 
     # transform from one supported type to another
     def to(self, projection: type[T], context: Context | None = None) -> T:
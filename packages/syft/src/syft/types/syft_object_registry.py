@@ -17,6 +17,14 @@ class SyftObjectRegistry:
     __object_transform_registry__: dict[str, Callable] = {}
     __object_serialization_registry__: dict[str, dict[int, tuple]] = {}
     __type_to_canonical_name__: dict[type, tuple[str, int]] = {}
+    # resolved serde plans, built lazily by syft.serde.recursive
+    __serialize_plan_cache__: dict[type, Any] = {}
+    __deserialize_plan_cache__: dict[tuple[str, int], Any] = {}
+    # resolved JSON serde plans, built lazily by syft.serde.json_serde
+    __json_serialize_plan_cache__: dict[type, Any] = {}
+    __json_deserialize_plan_cache__: dict[tuple[str, int], Any] = {}
+    # resolved transforms by (type_from, type_to), see get_transform
+    __transform_cache__: dict[tuple[type, type], Callable] = {}
 
     @classmethod
     def register_cls(
@@ -29,6 +37,14 @@ class SyftObjectRegistry:
         )
 
         cls.__type_to_canonical_name__[serde_attributes[7]] = (canonical_name, version)
+        cls.clear_serde_plan_cache()
+
+    @classmethod
+    def clear_serde_plan_cache(cls) -> None:
+        cls.__serialize_plan_cache__.clear()
+        cls.__deserialize_plan_cache__.clear()
+        cls.__json_serialize_plan_cache__.clear()
+        cls.__json_deserialize_plan_cache__.clear()
 
     @classmethod
     def get_versions(cls, canonical_name: str) -> list[int]:
@@ -133,10 +149,22 @@ class SyftObjectRegistry:
     ) -> None:
         mapping_string = f"{klass_from}_{version_from}_x_{klass_to}_{version_to}"
         cls.__object_transform_registry__[mapping_string] = method
+        cls.__transform_cache__.clear()
 
     @classmethod
     def get_transform(
         cls, type_from: type["SyftObject"], type_to: type["SyftObject"]
+    ) -> Callable:
+        key = (type_from, type_to)
+        transform = cls.__transform_cache__.get(key)
+        if transform is None:
+            transform = cls._resolve_transform(type_from, type_to)
+            cls.__transform_cache__[key] = transform
+        return transform
+
+    @classmethod
+    def _resolve_transform(
+        cls, type_from: type["SyftObject"], type_to: type["SyftObject"]
     ) -> Callable:
         # relative
         from .syft_object import SyftBaseObject
@@ -6,6 +6,7 @@ from collections.abc import Callable
 from collections.abc import Sequence
 import hashlib
 import logging
+import os
 from typing import Any
 import uuid
 from uuid import UUID as uuid_type
@@ -18,6 +19,56 @@ from ..serde.serializable import serializable
 
 logger = logging.getLogger(__name__)
 
+# number of UIDs kept by UID.from_bytes and UID.from_string, keyed by the bytes or
+# string they were made from. The table is cleared when it is full, ids that keep
+# coming back are interned again right away.
+UID_INTERN_SIZE = int(os.getenv("SYFT_UID_INTERN_SIZE", 2**16))
+_intern_table: dict[bytes | str, UID] = {}
+
+# version 4 and RFC 4122 variant bits, see uuid.UUID.__init__
+_UUID4_CLEAR = ~(0xC000 << 48 | 0xF000 << 64)
+_UUID4_SET = 0x8000 << 48 | 4 << 76
+_UUID_SAFE_UNKNOWN = uuid.SafeUUID.unknown
+
+
+def _uuid_from_int(value: int) -> uuid_type:
+    # same as uuid.UUID(int=value) without the argument checks, the way
+    # uuid.UUID.__setstate__ builds it
+    obj = object.__new__(uuid_type)
+    object.__setattr__(obj, "int", value)
+    object.__setattr__(obj, "is_safe", _UUID_SAFE_UNKNOWN)
+    return obj
+
+
+def _uuid4() -> uuid_type:
+    value = int.from_bytes(os.urandom(16), byteorder="big") & _UUID4_CLEAR | _UUID4_SET
+    return _uuid_from_int(value)
+
+
+def _uuid_from_bytes(value: bytes) -> uuid_type:
+    if len(value) != 16:
+        raise ValueError("bytes is not a 16-char string")
+    return _uuid_from_int(int.from_bytes(value, byteorder="big"))
+
+
+def _uuid_from_string(value: str) -> uuid_type:
+    # int() also accepts signs, spaces and underscores, only take plain hex
+    if len(value) == 32 and value.isascii() and value.isalnum():
+        return _uuid_from_int(int(value, 16))
+    return uuid.UUID(value)
+
+
+def _intern(key: bytes | str, uid: UID) -> UID:
+    if len(_intern_table) >= UID_INTERN_SIZE:
+        _intern_table.clear()
+    if UID_INTERN_SIZE:
+        _intern_table[key] = uid
+    return uid
+
+
+def clear_uid_intern_table() -> None:
+    _intern_table.clear()
+
 
 @serializable(attrs=["value"], canonical_name="UID", version=1)
 class UID:
@@ -37,11 +88,13 @@ class UID:
 
     """
 
+    # UIDs are immutable, the value is never reassigned so the hash and the
+    # string form are cached on first use
     __serde_overrides__: dict[str, Sequence[Callable]] = {
-        "value": (lambda x: x.bytes, lambda x: uuid.UUID(bytes=bytes(x)))
+        "value": (lambda x: x.bytes, bytes)
     }
 
-    __slots__ = "value"
+    __slots__ = ("value", "_hash", "_no_dash")
     value: uuid_type
 
     def __init__(self, value: Self | uuid_type | str | bytes | None = None):
@@ -64,26 +117,56 @@ class UID:
             from syft.types.uid import UID
             my_id = UID()
         """
-        # checks to make sure you've set a proto_type
-        super().__init__()
-
         # if value is not set - create a novel and unique ID.
-        if isinstance(value, str):
+        if value is None:
+            value = _uuid4()
+        elif isinstance(value, str):
             value = uuid.UUID(value, version=4)
         elif isinstance(value, bytes):
             value = uuid.UUID(bytes=value, version=4)
         elif isinstance(value, UID):
             value = value.value
 
-        self.value = uuid.uuid4() if value is None else value
+        self.value = value
+        self._hash: int | None = None
+        self._no_dash: str | None = None
 
-    @staticmethod
-    def from_string(value: str) -> UID:
+    @classmethod
+    def _from_uuid(cls, value: uuid_type) -> Self:
+        obj = cls.__new__(cls)
+        obj.value = value
+        obj._hash = None
+        obj._no_dash = None
+        return obj
+
+    @classmethod
+    def from_bytes(cls, value: bytes) -> Self:
+        """UID of 16 bytes, UIDs that were seen recently are shared."""
+        uid = _intern_table.get(value)
+        if uid is None or type(uid) is not cls:
+            uid = cls._from_uuid(_uuid_from_bytes(value))
+            if cls is UID:
+                _intern(value, uid)
+        return uid  # type: ignore
+
+    @classmethod
+    def from_string(cls, value: str) -> Self:
+        """UID of a hex string, UIDs that were seen recently are shared."""
+        uid = _intern_table.get(value)
+        if uid is not None and type(uid) is cls:
+            return uid  # type: ignore
         try:
-            return UID(value=uuid.UUID(value))
+            uid = cls._from_uuid(_uuid_from_string(value))
         except ValueError as e:
             logger.critical(f"Unable to convert {value} to UUID. {e}")
             raise e
+        if cls is UID:
+            _intern(value, uid)
+        return uid  # type: ignore
+
+    @classmethod
+    def serde_constructor(cls, kwargs: dict[str, Any]) -> Self:
+        return cls.from_bytes(bytes(kwargs["value"]))
 
     @staticmethod
     def with_seed(value: str) -> UID:
@@ -115,8 +198,9 @@ class UID:
             Note that we assume that any collisions will be very rare and
             detected by the ObjectStore class in Syft.
         """
-
-        return self.value.int
+        if self._hash is None:
+            self._hash = hash(self.value.int)
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
         """Checks to see if two UIDs are the same using the internal object
@@ -152,7 +236,9 @@ class UID:
 
     @property
     def no_dash(self) -> str:
-        return str(self.value).replace("-", "")
+        if self._no_dash is None:
+            self._no_dash = self.value.hex
+        return self._no_dash
 
     @property
     def hex(self) -> str:
@@ -219,6 +305,7 @@ class UID:
 class LineageID(UID):
     """Extended UID containing a history hash as well, which is used for comparisons."""
 
+    __slots__ = ("syft_history_hash",)
     syft_history_hash: int
 
     def __init__(
@@ -236,12 +323,27 @@ class LineageID(UID):
             syft_history_hash = hash(self.value)
         self.syft_history_hash = syft_history_hash
 
+    @classmethod
+    def _from_uuid(cls, value: uuid_type) -> Self:
+        obj = super()._from_uuid(value)
+        obj.syft_history_hash = hash(value)
+        return obj
+
+    @classmethod
+    def serde_constructor(cls, kwargs: dict[str, Any]) -> Self:
+        # the history hash is part of the id, these are not interned
+        obj = cls._from_uuid(uuid.UUID(bytes=bytes(kwargs["value"])))
+        obj.syft_history_hash = kwargs["syft_history_hash"]
+        return obj
+
     @property
     def id(self) -> UID:
-        return UID(self.value)
+        return UID._from_uuid(self.value)
 
     def __hash__(self) -> int:
-        return hash((self.syft_history_hash, self.value))
+        if self._hash is None:
+            self._hash = hash((self.syft_history_hash, self.value))
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, LineageID):
@@ -18,6 +18,7 @@ import pytest
 import syft as sy
 from syft import Dataset
 from syft.abstract_server import ServerSideType
+from syft.client import disk_cache
 from syft.client.datasite_client import DatasiteClient
 from syft.protocol.data_protocol import get_data_protocol
 from syft.protocol.data_protocol import protocol_release_dir
@@ -39,6 +40,10 @@ def remove_file(filepath: Path):
 def pytest_sessionstart(session):
     # add env var SYFT_TEMP_ROOT to create a unique temp dir for each test run
     os.environ["SYFT_TEMP_ROOT"] = f"pytest_syft_{token_hex(8)}"
+    # and keep the APIs cached by clients out of the home directory
+    disk_cache.CLIENT_CACHE_DIR = Path(
+        gettempdir(), os.environ["SYFT_TEMP_ROOT"], "client_cache"
+    )
 
 
 def pytest_configure(config):
@@ -125,6 +130,16 @@ def worker() -> Worker:
     del worker
 
 
+@pytest.fixture(scope="function")
+def file_worker() -> Worker:
+    # in-memory sqlite is not shared between threads, use this when a test calls
+    # the worker from other threads
+    worker = sy.Worker.named(name=token_hex(16), reset=True)
+    yield worker
+    worker.cleanup()
+    del worker
+
+
 @pytest.fixture(scope="function")
 def second_worker() -> Worker:
     # Used in server syncing tests
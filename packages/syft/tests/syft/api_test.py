@@ -2,12 +2,24 @@
 from collections.abc import Callable
 
 # third party
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 import numpy as np
+from pydantic import ValidationError
+import pytest
 
 # syft absolute
 import syft as sy
+from syft.client.api import SessionSyftAPICall
+from syft.client.api import SignedSyftAPICall
+from syft.client.api import SyftAPI
+from syft.client.api import SyftAPIBatchCall
+from syft.client.api import SyftAPICall
+from syft.serde.deserialize import _deserialize
+from syft.server.routes import make_routes
 from syft.service.response import SyftError
 from syft.service.user.user_roles import ServiceRole
+from syft.types.errors import SyftException
 
 
 def test_api_cache_invalidation(worker):
@@ -70,3 +82,208 @@ def test_api_cache_invalidation_login(root_verify_key, worker):
     guest_client = guest_client.login(email="a@b.org", password="aaa")
 
     assert guest_client.upload_dataset(dataset)
+
+
+def test_api_batch(worker):
+    client = worker.root_client
+    with client.api.batch() as batch:
+        users = client.api.services.user.get_all()
+        missing = client.api.services.user.view(uid=sy.UID())
+        settings = client.api.services.settings.get()
+
+    assert len(batch) == 3
+    assert len(users.result) == 1
+    assert settings.result.name == worker.name
+    # a failed call only fails its own result
+    with pytest.raises(SyftException):
+        _ = missing.result
+
+
+def test_api_batch_transaction(worker):
+    client = worker.root_client
+    with pytest.raises(SyftException, match="rolled back"):
+        with client.api.batch(transaction=True) as batch:
+            created = client.api.services.user.create(
+                email="a@b.org", name="a", password="aaa", password_verify="aaa"
+            )
+            client.api.services.user.view(uid=sy.UID())
+
+    with pytest.raises(SyftException, match="Rolled back"):
+        _ = created.result
+    assert len(batch) == 2
+    assert len(client.users.get_all()) == 1
+
+    with client.api.batch(transaction=True):
+        created = client.api.services.user.create(
+            email="a@b.org", name="a", password="aaa", password_verify="aaa"
+        )
+    assert created.result.email == "a@b.org"
+    assert len(client.users.get_all()) == 2
+
+
+def test_api_batch_rejects_nesting(worker):
+    client = worker.root_client
+    with client.api.batch() as batch:
+        with pytest.raises(SyftException):
+            with client.api.batch():
+                pass
+        pending = client.api.services.user.get_all()
+        with pytest.raises(SyftException, match="has not been sent"):
+            _ = pending.result
+
+    assert len(batch) == 1
+    assert len(pending.result) == 1
+
+
+def test_api_batch_rejected_as_single_call(worker):
+    client = worker.root_client
+    call = SyftAPICall(server_uid=worker.id, path="user.get_all", args=[], kwargs={})
+    batch = SyftAPIBatchCall(server_uid=worker.id, calls=[call])
+    signed_batch = batch.sign(client.credentials)
+
+    with pytest.raises(SyftException, match="api_batch_call"):
+        worker.handle_api_call_with_unsigned_result(signed_batch)
+
+
+def test_api_call_error_printed_for_data_scientist(ds_client, capsys):
+    with pytest.raises(SyftException):
+        ds_client.api.services.user.view(uid=sy.UID())
+    assert "hidden from DS" in capsys.readouterr().out
+
+
+def test_api_call_validated_when_decoded(worker):
+    client = worker.root_client
+    call = SyftAPICall.model_construct(
+        id=sy.UID(),
+        server_uid=worker.id,
+        path=["not", "a", "str"],
+        args=[],
+        kwargs={},
+        blocking="yes",
+    )
+    signed_call = call.sign(client.credentials)
+
+    with pytest.raises(ValidationError):
+        _ = signed_call.message
+    # a gateway only reads where the call goes
+    assert signed_call.message_fields("server_uid") == {"server_uid": worker.id}
+
+
+def test_api_session(worker):
+    client = worker.root_client
+    call = SyftAPICall(server_uid=worker.id, path="user.get_all", args=[], kwargs={})
+    client.api.start_session()
+    try:
+        assert isinstance(client.api.authenticate(call), SessionSyftAPICall)
+        # queued calls are still signed
+        call.blocking = False
+        assert not isinstance(client.api.authenticate(call), SessionSyftAPICall)
+        assert len(client.users.get_all()) == 1
+        assert len(worker.session_tokens) == 1
+    finally:
+        client.api.end_session()
+
+    assert len(worker.session_tokens) == 0
+    assert len(client.users.get_all()) == 1
+
+
+def test_api_session_not_used_through_proxy(worker):
+    client = worker.root_client
+    call = SyftAPICall(server_uid=worker.id, path="user.get_all", args=[], kwargs={})
+    connection = client.api.connection
+    client.api.start_session()
+    try:
+        # the proxy may be another server, which must not see the token
+        client.api.connection = connection.with_proxy(worker.id)
+        assert isinstance(client.api.authenticate(call), SignedSyftAPICall)
+    finally:
+        client.api.connection = connection
+        client.api.end_session()
+
+
+def test_api_session_invalid_token(worker):
+    client = worker.root_client
+    credentials = client.credentials.verify_key
+    session_token = worker.session_tokens.create(credentials, ServiceRole.GUEST)
+    call = SyftAPICall(server_uid=worker.id, path="user.get_all", args=[], kwargs={})
+
+    # the role is part of the session, not of the token
+    forged = session_token.rsplit(".", 1)[0] + "." + "0" * 64
+    with pytest.raises(SyftException, match="invalid"):
+        worker.handle_api_call(call.with_session(credentials, forged))
+    other = worker.guest_client.credentials.verify_key
+    with pytest.raises(SyftException, match="invalid"):
+        worker.handle_api_call(call.with_session(other, session_token))
+
+    worker.session_tokens.revoke(session_token, credentials)
+    with pytest.raises(SyftException, match="revoked"):
+        worker.handle_api_call(call.with_session(credentials, session_token))
+
+
+def test_api_session_revoked_on_role_change(worker, ds_client):
+    root_client = worker.root_client
+    ds_client.api.start_session()
+    try:
+        user = root_client.users.search(email=ds_client.logged_in_user)[0]
+        root_client.users.update(uid=user.id, role=ServiceRole.DATA_OWNER)
+        with pytest.raises(SyftException, match="revoked"):
+            ds_client.api.services.user.get_current_user()
+    finally:
+        ds_client.api.end_session()
+
+
+def test_api_cache(worker):
+    root_key = worker.root_client.credentials.verify_key
+    protocol = worker.root_client.api.communication_protocol
+    worker.api_cache.clear()
+
+    api = worker.get_api(root_key, protocol)
+    hits = worker.api_cache.hits
+    other = worker.get_api(root_key, protocol)
+    assert worker.api_cache.hits == hits + 1
+    # every caller gets its own copy to set its connection on
+    assert other is not api
+    assert other.endpoints == api.endpoints
+
+    etag = worker.api_cache.get(worker, root_key, protocol).etag
+    guest_key = worker.guest_client.credentials.verify_key
+    assert worker.api_cache.get(worker, guest_key, protocol).etag != etag
+
+    # new user code changes the API of its author
+    @sy.syft_function_single_use()
+    def my_func():
+        return 1
+
+    worker.root_client.code.submit(my_func)
+    cached = worker.api_cache.get(worker, root_key, protocol)
+    assert cached.etag != etag
+    assert "code.call_my_func" in cached.api.endpoints
+
+    worker.root_client.settings.update(name="renamed")
+    assert len(worker.api_cache) == 0
+
+
+def test_api_etag(file_worker):
+    worker = file_worker
+    app = FastAPI()
+    app.include_router(make_routes(worker), prefix="/api/v2")
+    client = TestClient(app)
+    params = {
+        "verify_key": str(worker.root_client.credentials.verify_key),
+        "communication_protocol": worker.root_client.api.communication_protocol,
+    }
+
+    response = client.get("/api/v2/api", params=params)
+    assert response.status_code == 200
+    assert isinstance(_deserialize(response.content, from_bytes=True), SyftAPI)
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/v2/api", params=params, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    response = client.get(
+        "/api/v2/api", params=params, headers={"If-None-Match": '"stale"'}
+    )
+    assert response.status_code == 200
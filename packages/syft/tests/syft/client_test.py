@@ -1,3 +1,45 @@
+# stdlib
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from secrets import token_hex
+import socket
+import threading
+import time
+
+# third party
+from fastapi import FastAPI
+import pytest
+import uvicorn
+
+# syft absolute
+import syft as sy
+from syft.abstract_server import ServerType
+from syft.client import async_client
+from syft.client import client as client_module
+from syft.client import disk_cache
+from syft.client import http_session
+from syft.client.api import SyftAPI
+from syft.client.api import SyftAPICall
+from syft.client.async_client import AsyncConnection
+from syft.client.client import HTTPConnection
+from syft.client.datasite_client import DatasiteClient
+from syft.serde.deserialize import _deserialize_from
+from syft.server import routes
+from syft.server.credentials import SyftSigningKey
+from syft.server.routes import make_routes
+from syft.server.server import Server
+from syft.server.worker import Worker
+from syft.service.job.job_stash import Job
+from syft.service.job.job_stash import JobStatus
+from syft.service.network.routes import HTTPServerRoute
+from syft.service.network.server_peer import ServerPeer
+from syft.types.errors import SyftException
+from syft.types.uid import UID
+
+
 def test_client_logged_in_user(worker):
     guest_client = worker.guest_client
     assert guest_client.logged_in_user == ""
@@ -15,3 +57,305 @@ def test_client_logged_in_user(worker):
     client = client.login(email="sheldon@caltech.edu", password="bazinga")
 
     assert client.logged_in_user == "sheldon@caltech.edu"
+
+
+class APIHandler(BaseHTTPRequestHandler):
+    # keeps connections open between requests
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = sy.serialize("ok", to_bytes=True)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def http_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), APIHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def make_calls(connection: HTTPConnection, calls: int) -> None:
+    signing_key = SyftSigningKey.generate()
+    call = SyftAPICall(server_uid=UID(), path="user.get_all", args=[], kwargs={})
+    signed_call = call.sign(signing_key)
+    for _ in range(calls):
+        assert connection.make_call(signed_call) == "ok"
+
+
+def test_http_connection_reuses_connections(http_server: str) -> None:
+    connection = HTTPConnection(url=http_server)
+
+    make_calls(connection, 20)
+
+    stats = connection.stats
+    assert stats.requests == 20
+    assert stats.failed_requests == 0
+    assert stats.connections == 1
+    assert stats.reuse_rate == 0.95
+    assert 0 < stats.mean_seconds <= stats.max_seconds
+
+
+def test_http_connection_without_keep_alive(monkeypatch, http_server: str) -> None:
+    monkeypatch.setattr(http_session, "HTTP_KEEP_ALIVE", False)
+    connection = HTTPConnection(url=http_server)
+
+    make_calls(connection, 3)
+
+    assert connection.stats.connections == 3
+    assert connection.stats.reuse_rate == 0
+
+
+def test_http_connection_timeout(monkeypatch) -> None:
+    monkeypatch.setattr(http_session, "HTTP_CONNECT_TIMEOUT", "1.5")
+    monkeypatch.setattr(http_session, "HTTP_RETRIES", 0)
+    connection = HTTPConnection(url="http://localhost:8080")
+
+    adapter = connection.session.get_adapter(str(connection.url))
+    assert adapter.timeout == (1.5, None)
+    assert adapter.max_retries.total == 0
+
+
+def test_async_http_connection(http_server: str) -> None:
+    signing_key = SyftSigningKey.generate()
+    call = SyftAPICall(server_uid=UID(), path="user.get_all", args=[], kwargs={})
+    signed_call = call.sign(signing_key)
+
+    async def make_calls() -> list:
+        connection = AsyncConnection(HTTPConnection(url=http_server))
+        try:
+            return await asyncio.gather(
+                *(connection.make_call(signed_call) for _ in range(10))
+            )
+        finally:
+            await connection.aclose()
+
+    assert asyncio.run(make_calls()) == ["ok"] * 10
+
+
+def test_async_http_pool_limits(monkeypatch) -> None:
+    monkeypatch.setattr(async_client, "HTTP_KEEP_ALIVE", False)
+
+    pool = async_client.make_async_session()._transport._pool
+
+    assert pool._max_connections == async_client.HTTP_POOL_SIZE
+    assert pool._max_keepalive_connections == 0
+
+
+def test_async_client(file_worker: Worker) -> None:
+    worker = file_worker
+    client = worker.root_client
+
+    async def make_calls() -> tuple:
+        async with client.as_async() as aclient:
+            return await asyncio.gather(
+                aclient.api.services.user.get_all(),
+                aclient.services.user.get_current_user(),
+                aclient.api.services.settings.get(),
+            )
+
+    users, me, settings = asyncio.run(make_calls())
+    assert [user.email for user in users] == ["info@openmined.org"]
+    assert me.email == "info@openmined.org"
+    assert settings.name == worker.name
+
+    async def fail() -> None:
+        await client.as_async().services.user.view(uid=UID())
+
+    with pytest.raises(SyftException):
+        asyncio.run(fail())
+
+
+def test_async_client_wait(file_worker: Worker) -> None:
+    worker = file_worker
+    client = worker.root_client
+    stash = worker.services.job.stash
+    jobs = [Job(id=UID(), server_uid=worker.id) for _ in range(3)]
+    for job in jobs:
+        stash.set(client.verify_key, job).unwrap()
+
+    async def resolve() -> None:
+        await asyncio.sleep(0.1)
+        for i, job in enumerate(jobs):
+            job.resolved = True
+            job.result = i
+            job.status = JobStatus.COMPLETED
+            stash.update(client.verify_key, job).unwrap()
+
+    async def wait() -> list:
+        aclient = client.as_async()
+        waits = [aclient.wait(job, timeout=5, poll_interval=0.05) for job in jobs]
+        results = await asyncio.gather(resolve(), *waits)
+        return results[1:]
+
+    assert asyncio.run(wait()) == [0, 1, 2]
+
+    pending = Job(id=UID(), server_uid=worker.id)
+    stash.set(client.verify_key, pending).unwrap()
+    with pytest.raises(SyftException, match="Timeout"):
+        asyncio.run(client.as_async().wait(pending, timeout=0.1, poll_interval=0.05))
+
+
+@contextmanager
+def serve_over_http(worker: Server) -> Iterator[str]:
+    app = FastAPI()
+    app.include_router(make_routes(worker), prefix="/api/v2")
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(uvicorn.Config(app, log_level="error"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]})
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{sock.getsockname()[1]}"
+    server.should_exit = True
+    thread.join()
+
+
+@pytest.fixture
+def api_server(file_worker: Worker) -> Iterator[str]:
+    with serve_over_http(file_worker) as url:
+        yield url
+
+
+def test_api_disk_cache(monkeypatch, tmp_path, file_worker: Worker, api_server: str):
+    monkeypatch.setattr(disk_cache, "CLIENT_CACHE_DIR", tmp_path)
+    credentials = file_worker.root_client.credentials
+    protocol = file_worker.root_client.api.communication_protocol
+
+    def connect() -> tuple[SyftAPI, list[int]]:
+        connection = HTTPConnection(url=api_server)
+        statuses: list[int] = []
+        connection.session.hooks["response"].append(
+            lambda response, **kwargs: statuses.append(response.status_code)
+        )
+        metadata = connection.get_server_metadata(credentials)
+        api = connection.get_api(credentials, protocol, metadata=metadata)
+        return api, statuses
+
+    api, statuses = connect()
+    assert statuses == [200, 200]
+    assert len(list(tmp_path.rglob("*"))) > 0
+
+    # a new client revalidates both instead of downloading them
+    cached_api, statuses = connect()
+    assert statuses == [304, 304]
+    assert cached_api.endpoints.keys() == api.endpoints.keys()
+
+    # the API changes with the user's code
+    @sy.syft_function_single_use()
+    def my_func():
+        return 1
+
+    file_worker.root_client.code.submit(my_func)
+    new_api, statuses = connect()
+    assert statuses == [304, 200]
+    assert "code.call_my_func" in new_api.endpoints
+
+    monkeypatch.setattr(disk_cache, "CLIENT_CACHE", False)
+    _, statuses = connect()
+    assert statuses == [200, 200]
+
+
+def test_api_streamed_response(monkeypatch, file_worker: Worker, api_server: str):
+    # every result is streamed
+    monkeypatch.setattr(routes, "STREAM_RESPONSE_SIZE", 0)
+    monkeypatch.setattr(client_module, "STREAM_RESPONSE_SIZE", 0)
+    credentials = file_worker.root_client.credentials
+    protocol = file_worker.root_client.api.communication_protocol
+
+    leftovers: list[bytes] = []
+
+    def deserialize_from(stream):
+        result = _deserialize_from(stream)
+        leftovers.append(stream.read())
+        return result
+
+    monkeypatch.setattr(client_module, "_deserialize_from", deserialize_from)
+
+    connection = HTTPConnection(url=api_server)
+    api = connection.get_api(credentials, protocol)
+    users = api.services.user.get_all()
+    settings = api.services.settings.get()
+
+    assert len(users) == 1
+    assert settings.name == file_worker.name
+    # both results were streamed and read to the end, so their connections
+    # can be reused
+    assert leftovers == [b"", b""]
+    assert connection.stats.connections <= connection.stats.requests
+
+
+def test_api_call_with_another_type_table(
+    monkeypatch, file_worker: Worker, api_server: str
+):
+    credentials = file_worker.root_client.credentials
+    protocol = file_worker.root_client.api.communication_protocol
+
+    connection = HTTPConnection(url=api_server)
+    statuses: list[int] = []
+    connection.session.hooks["response"].append(
+        lambda response, **kwargs: statuses.append(response.status_code)
+    )
+    metadata = connection.get_server_metadata(credentials)
+    api = connection.get_api(credentials, protocol, metadata=metadata)
+
+    # the server's types changed since it sent its metadata
+    monkeypatch.setattr(client_module, "type_table_id", lambda: "stale")
+    users = api.services.user.get_all()
+
+    assert len(users) == 1
+    # rejected before it was decoded, then sent by name
+    assert statuses[-2:] == [409, 200]
+
+
+def test_gateway_relays_api_calls(monkeypatch, file_worker: Worker, api_server: str):
+    gateway = sy.Gateway.named(name=token_hex(16), reset=True)
+    route = HTTPServerRoute(host_or_ip="127.0.0.1", port=int(api_server.split(":")[-1]))
+    peer = ServerPeer(
+        id=file_worker.id,
+        name=file_worker.name,
+        verify_key=file_worker.verify_key,
+        server_type=ServerType.DATASITE,
+        admin_email="info@openmined.org",
+        server_routes=[route],
+    )
+    gateway.services.network.stash.set(gateway.verify_key, peer).unwrap()
+
+    forwarded: list[str] = []
+    forward_message = gateway.forward_message
+    monkeypatch.setattr(
+        gateway,
+        "forward_message",
+        lambda api_call: forwarded.append(api_call.message.path)
+        or forward_message(api_call),
+    )
+    try:
+        with serve_over_http(gateway) as gateway_url:
+            connection = HTTPConnection(
+                url=gateway_url, proxy_target_uid=file_worker.id
+            )
+            client = DatasiteClient(
+                connection=connection, credentials=file_worker.signing_key
+            )
+            user = client.api.services.user.get_current_user()
+    finally:
+        gateway.cleanup()
+
+    assert user.email == "info@openmined.org"
+    # metadata and the api are fetched by the peer's client, calls are relayed
+    assert set(forwarded) == {"metadata", "api"}
+    assert len(gateway.peer_client_cache) == 1
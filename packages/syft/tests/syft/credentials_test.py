@@ -0,0 +1,83 @@
+# stdlib
+from copy import deepcopy
+
+# third party
+from nacl.encoding import HexEncoder
+
+# syft absolute
+import syft as sy
+from syft.client import api
+from syft.client.api import SignedSyftAPICall
+from syft.client.api import SyftAPICall
+from syft.serde.json_serde import deserialize_json
+from syft.serde.json_serde import serialize_json
+from syft.server.credentials import SyftSigningKey
+from syft.server.credentials import SyftVerifyKey
+from syft.types.uid import UID
+
+
+def test_verify_key_forms() -> None:
+    signing_key = SyftSigningKey.generate()
+    verify_key = signing_key.verify_key
+    hex_key = signing_key.signing_key.verify_key.encode(HexEncoder).decode()
+
+    assert str(verify_key) == verify_key.verify == hex_key
+    assert verify_key.key == bytes(signing_key.signing_key.verify_key)
+    assert hash(verify_key) == hash(signing_key.signing_key.verify_key)
+
+    for copy in [
+        SyftVerifyKey(hex_key),
+        deepcopy(verify_key),
+        SyftVerifyKey.model_construct(verify_key=verify_key.verify_key),
+    ]:
+        assert copy == verify_key
+        assert hash(copy) == hash(verify_key)
+        assert str(copy) == hex_key
+
+    assert verify_key != SyftSigningKey.generate().verify_key
+    assert verify_key != hex_key
+
+
+def test_verify_keys_are_interned() -> None:
+    verify_key = SyftSigningKey.generate().verify_key
+    hex_key = str(verify_key)
+
+    interned = SyftVerifyKey.from_string(hex_key)
+    assert SyftVerifyKey.from_bytes(verify_key.key) is interned
+    assert SyftVerifyKey.from_string(hex_key) is interned
+    blob = sy.serialize(verify_key, to_bytes=True)
+    assert sy.deserialize(blob, from_bytes=True) is interned
+    assert deserialize_json(serialize_json(verify_key), SyftVerifyKey) is interned
+
+
+def sign_call(signing_key: SyftSigningKey) -> SignedSyftAPICall:
+    call = SyftAPICall(server_uid=UID(), path="user.get_all", args=[], kwargs={})
+    return call.sign(signing_key)
+
+
+def test_verified_signatures_are_cached(monkeypatch) -> None:
+    monkeypatch.setattr(api, "_verified_signatures", {})
+    signing_key = SyftSigningKey.generate()
+    signed_call = sign_call(signing_key)
+
+    assert signed_call.is_valid
+    assert len(api._verified_signatures) == 1
+    retried = sy.deserialize(sy.serialize(signed_call, to_bytes=True), from_bytes=True)
+    assert retried.is_valid
+    assert len(api._verified_signatures) == 1
+
+    # the same signature does not validate another key or message
+    other_key = SyftSigningKey.generate().verify_key
+    assert not signed_call.model_copy(update={"credentials": other_key}).is_valid
+    assert not signed_call.model_copy(
+        update={"serialized_message": signed_call.serialized_message + b"\0"}
+    ).is_valid
+    assert len(api._verified_signatures) == 1
+
+
+def test_signature_cache_disabled(monkeypatch) -> None:
+    monkeypatch.setattr(api, "_verified_signatures", {})
+    monkeypatch.setattr(api, "SIGNATURE_CACHE_SIZE", 0)
+
+    assert sign_call(SyftSigningKey.generate()).is_valid
+    assert not api._verified_signatures
@@ -1,8 +1,11 @@
 # stdlib
+from hashlib import sha256
+from typing import ClassVar
 from uuid import uuid4
 
 # syft absolute
 from syft.serde.serializable import serializable
+from syft.serde.serialize import _serialize
 from syft.types.syft_object import SYFT_OBJECT_VERSION_1
 from syft.types.syft_object import SyftBaseObject
 from syft.types.syft_object import SyftHashableObject
@@ -36,6 +39,16 @@ class MockWrapper(SyftBaseObject, SyftHashableObject):
     data: MockObject | None
 
 
+@serializable(attrs=["id", "name"])
+class MockMemoizedWrapper(SyftBaseObject):
+    __canonical_name__ = "MockMemoizedWrapper"
+    __version__ = SYFT_OBJECT_VERSION_1
+    __cache_hash__: ClassVar[bool] = True
+
+    id: str
+    name: str
+
+
 def test_simple_hashing():
     obj1 = MockObject(key="key", value="value")
     obj2 = MockObject(key="key", value="value")
@@ -56,3 +69,38 @@ def test_nested_hashing():
     )
 
     assert obj1.hash() == obj2.hash()
+
+
+def test_hash_matches_serialized_bytes():
+    obj = MockWrapper(id="id", data=MockObject(key="key", value="v" * 2_000_000))
+    expected = sha256(_serialize(obj, to_bytes=True, for_hashing=True)).digest()
+    assert obj.__sha256__() == expected
+
+
+def test_hash_exclude_attrs_do_not_grow():
+    before = list(SyftHashableObject.__hash_exclude_attrs__)
+    obj = MockObject(key="key", value="value")
+    for _ in range(3):
+        obj.hash()
+    assert SyftHashableObject.__hash_exclude_attrs__ == before
+    assert MockObject.__hash_exclude_attrs__ == ["flag"]
+
+
+def test_hash_memo_invalidated_on_setattr():
+    obj = MockMemoizedWrapper(id="id", name="name")
+    first = obj.hash()
+    assert obj.hash() == first
+
+    obj.id = "other"
+    assert obj.hash() != first
+    assert obj.hash() == MockMemoizedWrapper(id="other", name="name").hash()
+
+
+def test_hash_not_memoized_by_default():
+    obj = MockWrapper(id="id", data=MockObject(key="key", value="value"))
+    first = obj.hash()
+
+    # in-place mutations of nested values are not tracked by a memo
+    obj.data.value = "changed"
+    assert obj.hash() != first
+    assert obj.hash() == MockWrapper(id="id", data=obj.data).hash()
@@ -0,0 +1,37 @@
+# syft absolute
+from syft.service.settings.settings import ServerSettingsUpdate
+from syft.service.settings.settings import ServerSettingsUpdateV1
+from syft.service.settings.settings import ServerSettingsUpdateV2
+from syft.types.syft_object import SyftMigrationRegistry
+from syft.types.uid import UID
+
+
+def test_migration_chain() -> None:
+    update = ServerSettingsUpdateV1(id=UID(), name="name", organization="org")
+
+    # only migrations between consecutive versions are registered
+    latest = update.migrate_to(ServerSettingsUpdate.__version__)
+    assert isinstance(latest, ServerSettingsUpdate)
+    assert (latest.id, latest.name, latest.organization) == (update.id, "name", "org")
+
+    oldest = latest.migrate_to(ServerSettingsUpdateV1.__version__)
+    assert isinstance(oldest, ServerSettingsUpdateV1)
+    assert oldest == update
+
+
+def test_migrations_are_cached() -> None:
+    SyftMigrationRegistry.warm_migration_cache()
+    key = (ServerSettingsUpdateV1, ServerSettingsUpdate.__version__)
+    migration = SyftMigrationRegistry.__migration_chain_cache__[key]
+
+    assert SyftMigrationRegistry.get_migration_for_version(*key) is migration
+
+    # registering a migration invalidates the resolved ones
+    step = SyftMigrationRegistry.get_migration_for_version(
+        ServerSettingsUpdateV1, ServerSettingsUpdateV2.__version__
+    )
+    SyftMigrationRegistry.register_migration_function(
+        ServerSettingsUpdateV1.__canonical_name__, 1, 2, step
+    )
+    assert key not in SyftMigrationRegistry.__migration_chain_cache__
+    assert SyftMigrationRegistry.get_migration_for_version(*key) is not migration
@@ -1,7 +1,12 @@
+# stdlib
+import time
+
 # syft absolute
 from syft.abstract_server import ServerType
 from syft.server.credentials import SyftSigningKey
+from syft.server.peer_client_cache import PeerClientCache
 from syft.service.network.network_service import NetworkStash
+from syft.service.network.routes import HTTPServerRoute
 from syft.service.network.server_peer import ServerPeer
 from syft.service.network.server_peer import ServerPeerUpdate
 from syft.types.uid import UID
@@ -29,3 +34,30 @@ def test_add_route() -> None:
     ).unwrap()
 
     assert peer.name == "new name"
+
+
+def test_peer_client_cache(monkeypatch) -> None:
+    cache = PeerClientCache(maxsize=2, ttl=10)
+    routes = [HTTPServerRoute(host_or_ip="localhost", port=port) for port in (1, 2)]
+    peer, other_peer = UID(), UID()
+    client = object()
+
+    cache.set(peer, routes[0], client)  # type: ignore[arg-type]
+    assert cache.get(peer, routes[0]) is client
+    assert cache.get(peer, routes[1]) is None
+
+    # least recently used
+    cache.set(peer, routes[1], client)  # type: ignore[arg-type]
+    cache.get(peer, routes[0])
+    cache.set(other_peer, routes[0], client)  # type: ignore[arg-type]
+    assert len(cache) == 2
+    assert cache.get(peer, routes[1]) is None
+
+    cache.evict(peer)
+    assert cache.get(peer, routes[0]) is None
+    assert cache.get(other_peer, routes[0]) is client
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 10)
+    assert cache.get(other_peer, routes[0]) is None
+    assert len(cache) == 0
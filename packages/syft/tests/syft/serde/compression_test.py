@@ -0,0 +1,112 @@
+# stdlib
+import zlib
+
+# third party
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+# syft absolute
+from syft.serde.compression import COMPRESSION_HEADER
+from syft.serde.compression import DecompressionError
+from syft.serde.compression import UnsupportedCompressionError
+from syft.serde.compression import choose_compression
+from syft.serde.compression import compress
+from syft.serde.compression import compression_stats
+from syft.serde.compression import decompress
+from syft.serde.compression import maybe_compress
+from syft.serde.compression import supported_compressions
+from syft.server import routes
+from syft.server.routes import make_routes
+from syft.service.metadata.server_metadata import ServerMetadataJSON
+
+
+@pytest.mark.parametrize("codec", supported_compressions())
+def test_compression_roundtrip(codec: str) -> None:
+    data = b"syft" * 100_000
+
+    compressed, used_codec = maybe_compress(data, codec, min_size=1)
+
+    assert used_codec == codec
+    assert len(compressed) < len(data)
+    assert decompress(compressed, codec) == data
+
+
+@pytest.mark.parametrize("codec", supported_compressions())
+def test_decompress_max_size(codec: str) -> None:
+    data = b"syft" * 100_000
+    compressed = compress(data, codec)
+
+    assert decompress(compressed, codec, max_size=len(data)) == data
+    with pytest.raises(DecompressionError):
+        decompress(compressed, codec, max_size=len(data) - 1)
+    with pytest.raises(DecompressionError):
+        decompress(compressed[: len(compressed) // 2], codec, max_size=len(data))
+
+
+def test_decompress_unsupported() -> None:
+    with pytest.raises(UnsupportedCompressionError):
+        decompress(b"syft", "unknown")
+
+
+def test_compression_threshold() -> None:
+    data = b"syft" * 10
+
+    assert maybe_compress(data, "zlib", min_size=len(data) + 1) == (data, None)
+    assert maybe_compress(data, None, min_size=1) == (data, None)
+
+
+def test_compression_skipped_when_larger() -> None:
+    # a single byte can't be compressed
+    assert maybe_compress(b"x", "zlib", min_size=1) == (b"x", None)
+
+
+def test_choose_compression() -> None:
+    assert choose_compression(None) is None
+    assert choose_compression(["unknown"]) is None
+    assert choose_compression([" zlib ", "unknown"]) == "zlib"
+    assert choose_compression(supported_compressions()) == supported_compressions()[0]
+
+
+def test_compression_stats() -> None:
+    compression_stats.reset()
+    data = b"syft" * 100_000
+
+    compressed, _ = maybe_compress(data, "zlib", min_size=1)
+
+    assert compression_stats.compressed_calls == 1
+    assert compression_stats.bytes_in == len(data)
+    assert compression_stats.bytes_out == len(compressed)
+    assert compression_stats.ratio > 1
+    assert compression_stats.compress_seconds > 0
+
+
+def test_metadata_advertises_compression(worker) -> None:
+    metadata = worker.metadata.to(ServerMetadataJSON)
+
+    assert metadata.supported_compressions == supported_compressions()
+    assert "zlib" in metadata.supported_compressions
+
+
+def test_api_call_rejects_bad_compression(monkeypatch, worker) -> None:
+    app = FastAPI()
+    app.include_router(make_routes(worker), prefix="/api/v2")
+    client = TestClient(app)
+
+    response = client.post(
+        "/api/v2/api_call", content=b"syft", headers={COMPRESSION_HEADER: "unknown"}
+    )
+    assert response.status_code == 415
+
+    response = client.post(
+        "/api/v2/api_call", content=b"syft", headers={COMPRESSION_HEADER: "zlib"}
+    )
+    assert response.status_code == 400
+
+    # a small payload that decompresses to more than the server allows
+    monkeypatch.setattr(routes, "MAX_DECOMPRESSED_SIZE", 1024**2)
+    bomb = zlib.compress(b"\0" * (1024**2 + 1))
+    response = client.post(
+        "/api/v2/api_call", content=bomb, headers={COMPRESSION_HEADER: "zlib"}
+    )
+    assert response.status_code == 400
@@ -0,0 +1,119 @@
+# stdlib
+from enum import Enum
+
+# third party
+import pytest
+
+# syft absolute
+from syft.serde.json_serde import JSON_SERDE_REGISTRY
+from syft.serde.json_serde import deserialize_json
+from syft.serde.json_serde import get_json_deserialize_plan
+from syft.serde.json_serde import get_json_serialize_plan
+from syft.serde.json_serde import register_json_serde
+from syft.serde.json_serde import serialize_json
+from syft.server.credentials import SyftSigningKey
+from syft.service.action.action_object import ActionObject
+from syft.service.user.user import User
+from syft.service.user.user_roles import ServiceRole
+from syft.types.syft_object_registry import SyftObjectRegistry
+from syft.types.uid import UID
+
+
+@pytest.fixture
+def user() -> User:
+    return User(
+        id=UID(),
+        email="info@openmined.org",
+        name="Jane Doe",
+        role=ServiceRole.DATA_SCIENTIST,
+        verify_key=SyftSigningKey.generate().verify_key,
+    )
+
+
+def test_pydantic_roundtrip(user: User) -> None:
+    serialized = serialize_json(user)
+    deserialized = deserialize_json(serialized, User)
+
+    assert deserialized == user
+    assert serialized["role"] == "DATA_SCIENTIST"
+    assert serialized["email"] == user.email
+
+
+@pytest.mark.parametrize(
+    "value, annotation",
+    [
+        (1, int),
+        (None, int | None),
+        ([UID(), UID()], list[UID]),
+        ({"a": UID()}, dict[str, UID]),
+        ([1, "a"], list[int | str]),
+        (ServiceRole.ADMIN, ServiceRole),
+    ],
+)
+def test_annotation_roundtrip(value, annotation) -> None:
+    serialized = serialize_json(value, annotation)
+    assert deserialize_json(serialized, annotation) == value
+
+
+def test_plans_are_cached(user: User) -> None:
+    canonical_name, version = SyftObjectRegistry.get_canonical_name_version(user)
+    serialize_plan = get_json_serialize_plan(user)
+    deserialize_plan = get_json_deserialize_plan(canonical_name, version)
+
+    assert get_json_serialize_plan(user) is serialize_plan
+    assert get_json_deserialize_plan(canonical_name, version) is deserialize_plan
+    assert deserialize_plan.cls is User
+    assert {key for key, _ in serialize_plan.fields} <= {
+        key for key, _ in deserialize_plan.fields
+    }
+
+
+def test_register_invalidates_compiled_serde(user: User) -> None:
+    class Color(Enum):
+        RED = 1
+
+    assert serialize_json(Color.RED) == "RED"
+    plan = get_json_serialize_plan(user)
+
+    register_json_serde(Color, lambda c: c.value, lambda v: Color(v))
+    try:
+        assert get_json_serialize_plan(user) is not plan
+        assert serialize_json(Color.RED) == 1
+        assert deserialize_json(1, Color) is Color.RED
+    finally:
+        del JSON_SERDE_REGISTRY[Color]
+
+
+def test_trusted_deserialize_skips_validation(user: User, monkeypatch) -> None:
+    serialized = serialize_json(user)
+    canonical_name, version = SyftObjectRegistry.get_canonical_name_version(user)
+    plan = get_json_deserialize_plan(canonical_name, version)
+    assert plan.is_latest_version
+
+    def fail_validation(*args, **kwargs):
+        raise AssertionError("trusted rows should not be validated")
+
+    monkeypatch.setattr(User, "model_validate", fail_validation)
+    assert deserialize_json(serialized, User, trusted=True) == user
+
+    # untrusted data and older versions are always validated
+    with pytest.raises(ValueError):
+        deserialize_json(serialized, User)
+    monkeypatch.setattr(plan, "is_latest_version", False)
+    with pytest.raises(ValueError):
+        deserialize_json(serialized, User, trusted=True)
+
+
+def test_trusted_deserialize_matches_validated() -> None:
+    obj = ActionObject.from_obj([1, 2, 3])
+    serialized = serialize_json(obj)
+
+    trusted = deserialize_json(serialized, trusted=True)
+    validated = deserialize_json(serialized)
+
+    assert type(trusted) is type(validated)
+    assert trusted == validated
+    # set by __post_init__, which model_construct skips
+    assert trusted.syft_pre_hooks__ == validated.syft_pre_hooks__
+    assert trusted.syft_post_hooks__ == validated.syft_post_hooks__
+    assert trusted.syft_pre_hooks__["ALWAYS"]
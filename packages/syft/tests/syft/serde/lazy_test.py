@@ -0,0 +1,120 @@
+# stdlib
+import warnings
+
+# third party
+from pydantic import ValidationError
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPICall
+from syft.serde.json_serde import deserialize_json
+from syft.serde.json_serde import serialize_json
+from syft.serde.lazy import LazyValue
+from syft.serde.lazy import use_lazy_fields
+from syft.server.credentials import SyftSigningKey
+from syft.service.action.action_object import Action
+from syft.service.job.job_stash import Job
+from syft.service.log.log import SyftLog
+from syft.types.uid import UID
+
+
+@pytest.fixture
+def job() -> Job:
+    return Job(id=UID(), server_uid=UID(), result={"values": list(range(100))})
+
+
+@pytest.fixture
+def invalid_job() -> Job:
+    # the action belongs to another user code, which Job.check_user_code_id rejects
+    action = Action(path="path", op="op", args=[], kwargs={}, user_code_id=UID())
+    return Job.model_construct(
+        id=UID(), server_uid=UID(), action=action, user_code_id=UID()
+    )
+
+
+def is_lazy(obj, attr: str) -> bool:
+    return type(obj.__dict__[attr]) is LazyValue
+
+
+def trusted_roundtrip(obj):
+    with use_lazy_fields():
+        return sy.deserialize(sy.serialize(obj, to_bytes=True), from_bytes=True)
+
+
+def test_lazy_field_decoded_on_access(job: Job) -> None:
+    deserialized = trusted_roundtrip(job)
+
+    assert is_lazy(deserialized, "result")
+    assert deserialized.status == job.status
+    assert is_lazy(deserialized, "result")
+
+    assert deserialized.result == job.result
+    assert not is_lazy(deserialized, "result")
+
+
+def test_lazy_field_reserialized_without_decoding(job: Job) -> None:
+    blob = sy.serialize(job, to_bytes=True)
+    with use_lazy_fields():
+        deserialized = sy.deserialize(blob, from_bytes=True)
+
+    assert sy.serialize(deserialized, to_bytes=True) == blob
+    assert is_lazy(deserialized, "result")
+    assert deserialized == job
+    assert deserialized.hash() == job.hash()
+
+
+def test_lazy_field_set_before_access(job: Job) -> None:
+    deserialized = trusted_roundtrip(job)
+    deserialized.result = "new"
+
+    roundtrip = sy.deserialize(
+        sy.serialize(deserialized, to_bytes=True), from_bytes=True
+    )
+    assert roundtrip.result == "new"
+
+
+def test_lazy_field_json(job: Job) -> None:
+    json_obj = serialize_json(job)
+    assert not is_lazy(deserialize_json(json_obj), "result")
+    deserialized = deserialize_json(json_obj, trusted=True)
+
+    assert is_lazy(deserialized, "result")
+    assert serialize_json(deserialized) == json_obj
+    assert deserialized.to_dict()["result"] == job.result
+    assert deserialized.result == job.result
+
+
+def test_lazy_string_fields() -> None:
+    log = SyftLog(job_id=UID(), stdout="out")
+    deserialized = trusted_roundtrip(log)
+
+    assert is_lazy(deserialized, "stdout")
+    deserialized.append("put")
+    assert deserialized.stdout == "output"
+
+
+def test_lazy_fields_only_for_trusted_data(job: Job) -> None:
+    deserialized = sy.deserialize(sy.serialize(job, to_bytes=True), from_bytes=True)
+    assert not is_lazy(deserialized, "result")
+
+
+def test_invalid_object_rejected_from_the_wire(invalid_job: Job) -> None:
+    blob = sy.serialize(invalid_job, to_bytes=True)
+    with pytest.raises(ValidationError, match="user_code_id does not match"):
+        sy.deserialize(blob, from_bytes=True)
+
+    # as the arguments of an API call received by a server
+    call = SyftAPICall(
+        server_uid=UID(), path="job.set", args=[invalid_job], kwargs={}
+    ).sign(SyftSigningKey.generate())
+    call = sy.deserialize(sy.serialize(call, to_bytes=True), from_bytes=True)
+    with pytest.raises(ValidationError, match="user_code_id does not match"):
+        _ = call.message.args
+
+
+def test_lazy_fields_model_dump(job: Job) -> None:
+    deserialized = trusted_roundtrip(job)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert deserialized.model_dump()["result"] == job.result
@@ -0,0 +1,78 @@
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.recursive import recursive_scheme
+from syft.serde.third_party import serialize_dataframe
+from syft.util.experimental_flags import ApacheArrowCompression
+from syft.util.experimental_flags import flags
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rows = 100
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "int": np.arange(rows),
+            "float": rng.random(rows),
+            "nullable": pd.array([1, None] * (rows // 2), dtype="Int64"),
+            "category": pd.Categorical(rng.choice(["a", "b"], rows)),
+            "string": rng.choice(["x", "yy"], rows),
+            "time": pd.date_range("2024-01-01", periods=rows, freq="ns"),
+        },
+        index=pd.Index(np.arange(rows) * 2, name="idx"),
+    )
+
+
+def roundtrip(obj):
+    return sy.deserialize(sy.serialize(obj, to_bytes=True), from_bytes=True)
+
+
+def test_dataframe_roundtrip(frame: pd.DataFrame) -> None:
+    result = roundtrip(frame)
+
+    pd.testing.assert_frame_equal(result, frame)
+    assert isinstance(result["category"].dtype, pd.CategoricalDtype)
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series(np.arange(10, dtype=np.uint16)),
+        pd.Series(["a", None], name=0),
+        pd.Series([1.5, 2.5], name=("a", 1), index=["x", "y"]),
+        pd.Series(pd.Categorical(["a", "b", "a"]), name="category"),
+        pd.Series(pd.date_range("2024-01-01", periods=3), name="time"),
+    ],
+)
+def test_series_roundtrip(series: pd.Series) -> None:
+    pd.testing.assert_series_equal(roundtrip(series), series)
+
+
+def test_dataframe_zero_copy(frame: pd.DataFrame, monkeypatch) -> None:
+    monkeypatch.setattr(flags, "APACHE_ARROW_ZERO_COPY", True)
+    monkeypatch.setattr(flags, "APACHE_ARROW_COMPRESSION", ApacheArrowCompression.NONE)
+
+    result = roundtrip(frame)
+
+    pd.testing.assert_frame_equal(result, frame)
+    # the column is a view of the received message
+    assert not result["float"].to_numpy().flags.writeable
+
+
+def test_read_parquet_dataframe(frame: pd.DataFrame) -> None:
+    # data stored with version 1 is still read
+    # parquet stores timestamps in microseconds, leave out the nanoseconds
+    frame = frame.drop(columns="time")
+    msg = recursive_scheme.new_message()
+    msg.canonicalName = "pandas_dataframe"
+    msg.version = 1
+    msg.init("nonrecursiveBlob", 1)[0] = serialize_dataframe(frame)
+
+    result = sy.deserialize(msg.to_bytes(), from_bytes=True)
+
+    pd.testing.assert_frame_equal(result, frame)
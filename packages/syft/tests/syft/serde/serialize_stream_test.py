@@ -0,0 +1,75 @@
+# stdlib
+from io import BytesIO
+import tempfile
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde import serialize as serialize_module
+from syft.serde.serialize import _serialize_to_file
+
+
+def roundtrip_values() -> list:
+    return [sy.UID(), {"a": [1, 2, 3]}, "x" * 2_000_000, np.arange(10_000)]
+
+
+def assert_same(a, b) -> None:
+    if isinstance(a, np.ndarray):
+        assert (a == b).all()
+    else:
+        assert a == b
+
+
+def test_serialize_to_matches_serialize() -> None:
+    for value in roundtrip_values():
+        writer = BytesIO()
+        sy.serialize_to(value, writer)
+        assert writer.getvalue() == sy.serialize(value, to_bytes=True)
+
+
+def test_deserialize_from_reads_consecutive_messages() -> None:
+    values = roundtrip_values()
+    stream = BytesIO()
+    for value in values:
+        sy.serialize_to(value, stream)
+    stream.write(b"trailing")
+    stream.seek(0)
+
+    for value in values:
+        assert_same(sy.deserialize_from(stream), value)
+    assert stream.read() == b"trailing"
+
+
+@pytest.mark.parametrize("use_file", [True, False])
+def test_serialize_to_large_message(monkeypatch, use_file: bool) -> None:
+    # force the code path used for messages that are too large to keep in memory
+    monkeypatch.setattr(
+        serialize_module, "compatible_with_large_file_writes_capnp", lambda _: True
+    )
+    value = np.arange(10_000)
+    writer = tempfile.TemporaryFile() if use_file else BytesIO()
+    with writer:
+        writer.write(b"header")
+        sy.serialize_to(value, writer)
+        sy.serialize_to("next", writer)
+        writer.seek(0)
+        assert writer.read(6) == b"header"
+        assert_same(sy.deserialize_from(writer), value)
+        assert sy.deserialize_from(writer) == "next"
+
+
+def test_deserialize_from_truncated_stream() -> None:
+    data = sy.serialize("x" * 1000, to_bytes=True)
+    with pytest.raises(EOFError):
+        sy.deserialize_from(BytesIO(data[:-10]))
+
+
+def test_serialize_to_file() -> None:
+    value = roundtrip_values()[2]
+    serialized, size = _serialize_to_file(value)
+    with serialized:
+        assert size == len(sy.serialize(value, to_bytes=True))
+        assert sy.deserialize_from(serialized) == value
@@ -0,0 +1,98 @@
+# stdlib
+import warnings
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde import third_party
+
+torch = pytest.importorskip("torch")
+
+# quantized and bit types have no regular storage layout
+DTYPES = sorted(
+    {
+        dtype
+        for dtype in vars(torch).values()
+        if isinstance(dtype, torch.dtype)
+        and not str(dtype).startswith(("torch.q", "torch.bits"))
+    },
+    key=str,
+)
+
+
+def roundtrip(tensor):
+    return sy.deserialize(sy.serialize(tensor, to_bytes=True), from_bytes=True)
+
+
+def make_tensor(dtype) -> "torch.Tensor":
+    # random bytes viewed as `dtype`, bools have to be 0 or 1
+    item_size = torch.empty(0, dtype=dtype).element_size()
+    high = 2 if dtype == torch.bool else 256
+    raw = torch.randint(0, high, (4, 6 * item_size), dtype=torch.uint8)
+    return raw.view(dtype)
+
+
+def assert_same_tensor(result, expected) -> None:
+    assert result.dtype == expected.dtype
+    assert result.shape == expected.shape
+    # compare bytes, NaNs are never equal
+    assert torch.equal(
+        result.contiguous().view(-1).view(torch.uint8),
+        expected.contiguous().view(-1).view(torch.uint8),
+    )
+
+
+@pytest.mark.parametrize("dtype", DTYPES, ids=str)
+def test_tensor_roundtrip(dtype) -> None:
+    tensor = make_tensor(dtype)
+
+    for view in [tensor, tensor.t(), tensor[1:, ::2], tensor[0], tensor[0, 0]]:
+        assert_same_tensor(roundtrip(view), view)
+    assert_same_tensor(roundtrip(tensor[:0]), tensor[:0])
+
+
+def test_tensor_strides_and_grad() -> None:
+    tensor = torch.arange(12.0).reshape(3, 4).t().requires_grad_(False)
+    result = roundtrip(tensor)
+    assert result.stride() == tensor.stride()
+    assert torch.equal(result, tensor)
+
+    leaf = torch.rand(3, dtype=torch.bfloat16, requires_grad=True)
+    result = roundtrip(leaf)
+    assert result.requires_grad
+    assert result.is_leaf
+    assert torch.equal(result.detach(), leaf.detach())
+
+
+def test_tensor_view_sends_only_its_elements() -> None:
+    tensor = torch.rand(1000, 1000)
+    column = tensor[:, 0]
+
+    blob = sy.serialize(column, to_bytes=True)
+
+    assert len(blob) < 1000 * 4 * 2
+    assert torch.equal(roundtrip(column), column)
+
+
+def test_tensor_writable_in_place() -> None:
+    tensor = torch.arange(6.0)
+    blob = sy.serialize(tensor, to_bytes=True)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = sy.deserialize(blob, from_bytes=True)
+    result.add_(1)
+
+    assert torch.equal(result, tensor + 1)
+    assert torch.equal(sy.deserialize(blob, from_bytes=True), tensor)
+
+
+@pytest.mark.parametrize("dtype_name", ["load", "not_a_dtype"])
+def test_tensor_rejects_unknown_dtype(dtype_name: str) -> None:
+    header = sy.serialize((dtype_name, (0,), (1,), False), to_bytes=True)
+    blob = third_party.TORCH_HEADER_SIZE.pack(len(header)) + header
+
+    with pytest.raises(ValueError, match="is not a torch dtype"):
+        third_party.torch_deserialize_storage(blob)
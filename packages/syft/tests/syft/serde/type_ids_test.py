@@ -0,0 +1,123 @@
+# third party
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPICall
+from syft.serde import type_ids
+from syft.serde.serialize import _serialize
+from syft.serde.type_ids import TYPE_TABLE_HEADER
+from syft.serde.type_ids import TYPE_TABLE_MISMATCH_STATUS
+from syft.serde.type_ids import TypeTable
+from syft.serde.type_ids import accepts_type_ids
+from syft.serde.type_ids import get_type_table
+from syft.serde.type_ids import type_table_id
+from syft.serde.type_ids import use_type_ids
+from syft.server.routes import make_routes
+from syft.service.job.job_stash import Job
+from syft.service.log.log import SyftLog
+from syft.service.metadata.server_metadata import ServerMetadataJSON
+from syft.types.uid import UID
+
+
+def make_logs() -> list[SyftLog]:
+    return [
+        SyftLog(server_uid=UID(), job_id=UID(), stdout=f"line {i}") for i in range(10)
+    ]
+
+
+def test_type_ids_roundtrip() -> None:
+    logs = make_logs()
+
+    with use_type_ids():
+        blob = sy.serialize(logs, to_bytes=True)
+
+    assert len(blob) < len(sy.serialize(logs, to_bytes=True))
+    # type ids are decoded with or without the context
+    assert sy.deserialize(blob, from_bytes=True) == logs
+
+
+def test_type_ids_only_inside_context() -> None:
+    uid = UID()
+    plain = sy.serialize(uid, to_bytes=True)
+
+    with use_type_ids():
+        with use_type_ids(False):
+            assert sy.serialize(uid, to_bytes=True) == plain
+        assert sy.serialize(uid, to_bytes=True) != plain
+
+    assert sy.serialize(uid, to_bytes=True) == plain
+
+
+def test_lazy_fields_written_back_with_same_table(monkeypatch) -> None:
+    job = Job(id=UID(), server_uid=UID(), result=make_logs())
+
+    with use_type_ids():
+        blob = sy.serialize(job, to_bytes=True)
+        deserialized = sy.deserialize(blob, from_bytes=True)
+        assert sy.serialize(deserialized, to_bytes=True) == blob
+
+    # encoded by name again, not with the ids the result was received with, so
+    # a process with another type table can decode it
+    plain = sy.serialize(deserialized, to_bytes=True)
+    monkeypatch.setattr(type_ids, "_TYPE_TABLE", TypeTable([]))
+    assert sy.deserialize(plain, from_bytes=True).result == job.result
+
+
+def test_hashing_ignores_type_ids() -> None:
+    logs = make_logs()
+    expected = _serialize(logs[0], to_bytes=True, for_hashing=True)
+    hashes = [log.hash() for log in logs]
+
+    with use_type_ids():
+        assert _serialize(logs[0], to_bytes=True, for_hashing=True) == expected
+        for log in logs:
+            log._syft_clear_hash_memo()
+        assert [log.hash() for log in logs] == hashes
+
+
+def test_type_table() -> None:
+    table = get_type_table()
+
+    assert table is get_type_table()
+    assert table.names[0] == ("", 0)
+    for type_id, name in enumerate(table.names[1:], start=1):
+        assert table.ids[name] == type_id
+
+    assert accepts_type_ids(table.table_id)
+    assert not accepts_type_ids(None)
+    assert not accepts_type_ids("unknown")
+
+
+def test_metadata_advertises_type_table(worker) -> None:
+    metadata = worker.metadata.to(ServerMetadataJSON)
+
+    assert metadata.type_table_id == type_table_id()
+
+
+def test_api_call_with_another_type_table(file_worker) -> None:
+    worker = file_worker
+    app = FastAPI()
+    app.include_router(make_routes(worker), prefix="/api/v2")
+    client = TestClient(app)
+    call = SyftAPICall(
+        server_uid=worker.id, path="user.get_all", args=[], kwargs={}
+    ).sign(worker.signing_key)
+    with use_type_ids():
+        body = _serialize(call, to_bytes=True)
+
+    # rejected before it is decoded
+    response = client.post(
+        "/api/v2/api_call", content=body, headers={TYPE_TABLE_HEADER: "stale"}
+    )
+    assert response.status_code == TYPE_TABLE_MISMATCH_STATUS
+
+    response = client.post(
+        "/api/v2/api_call", content=body, headers={TYPE_TABLE_HEADER: type_table_id()}
+    )
+    assert response.status_code == 200
+    assert response.headers[TYPE_TABLE_HEADER] == type_table_id()
+    with use_type_ids():
+        result = sy.deserialize(response.content, from_bytes=True)
+    assert [user.email for user in result.message.data.value] == ["info@openmined.org"]
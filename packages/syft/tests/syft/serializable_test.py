@@ -7,6 +7,9 @@ from pydantic import BaseModel
 
 # syft absolute
 import syft as sy
+from syft.serde.recursive import get_deserialize_plan
+from syft.serde.recursive import get_serialize_plan
+from syft.serde.recursive import recursive_serde_register
 from syft.serde.serializable import serializable
 
 
@@ -350,3 +353,48 @@ def test_pydantic_derived_only():
     assert (data.uid, data.value, data.flag) != (de.uid, de.value, de.flag)
     assert (de.uid, de.value, de.flag) == (None, None, None)
     assert (data.source, data.target) == (de.source, de.target)
+
+
+# ------------------------------ Serde plans ------------------------------
+
+
+def test_serde_plan_cached():
+    data = Derived(uid=str(time()), value=2, status=1)
+    sy.serialize(data, to_bytes=True)
+
+    plan = get_serialize_plan(data)
+    assert plan is get_serialize_plan(data)
+    assert plan.fields == ("status", "uid", "value")
+    assert get_deserialize_plan("Derived", 1).cls is Derived
+
+
+def test_serde_plan_invalidated_on_register():
+    class Reregistered:
+        def __init__(self, value: int) -> None:
+            self.value = value
+
+    recursive_serde_register(
+        Reregistered,
+        serialize_attrs=["value"],
+        canonical_name="Reregistered",
+        version=1,
+    )
+    assert get_serialize_plan(Reregistered(1)).fields == ("value",)
+
+    recursive_serde_register(
+        Reregistered,
+        serialize_attrs=["value"],
+        exclude_attrs=["value"],
+        canonical_name="Reregistered",
+        version=1,
+    )
+    obj = Reregistered(1)
+    assert get_serialize_plan(obj).get_fields(obj, for_hashing=False) == ()
+
+
+def test_serde_primitive_fields():
+    data = PydBase(uid="a" * (2 * 1024**2), value=-(2**70), flag=False)
+
+    de = sy.deserialize(sy.serialize(data, to_bytes=True), from_bytes=True)
+
+    assert (de.uid, de.value, de.flag) == (data.uid, data.value, data.flag)
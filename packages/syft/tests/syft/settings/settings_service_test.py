@@ -421,3 +421,46 @@ def test_notifications_enabled_without_emails_credentials_not_allowed(
         root_datasite_client.api.services.settings.update(notifications_enabled=True)
 
     assert _NOTIFICATIONS_ENABLED_WIHOUT_CREDENTIALS_ERROR in exc.value.public_message
+
+
+def test_settings_cached_until_updated(worker) -> None:
+    settings_cache = worker.settings_cache
+    worker.get_settings()
+    misses = settings_cache.misses
+    reads = settings_cache.hits + settings_cache.version_checks
+
+    assert worker.settings is worker.settings
+    assert worker.metadata is worker.metadata
+    assert settings_cache.misses == misses
+    # answered from the cache, or after a check when the interval has passed
+    assert settings_cache.hits + settings_cache.version_checks >= reads + 4
+
+    worker.root_client.api.services.settings.update(name="cached")
+    assert worker.settings.name == "cached"
+    assert worker.metadata.name == "cached"
+    assert settings_cache.misses == misses + 1
+
+
+def test_settings_cache_version_check(worker) -> None:
+    settings_cache = worker.settings_cache
+    settings = worker.settings
+    misses = settings_cache.misses
+
+    # as another worker of the server would, without clearing this cache
+    other_settings = settings.model_copy(update={"organization": "other"})
+    worker.services.settings.stash.update(worker.verify_key, other_settings).unwrap()
+
+    settings_cache.check_interval = 3600
+    assert worker.settings.organization == settings.organization
+
+    settings_cache.check_interval = 0
+    assert worker.settings.organization == "other"
+    assert worker.metadata.organization == "other"
+    assert settings_cache.misses == misses + 1
+
+    # unchanged settings are only compared, not read
+    hits, version_checks = settings_cache.hits, settings_cache.version_checks
+    worker.get_settings()
+    assert settings_cache.misses == misses + 1
+    assert settings_cache.version_checks == version_checks + 1
+    assert settings_cache.hits == hits
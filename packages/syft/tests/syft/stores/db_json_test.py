@@ -0,0 +1,69 @@
+# stdlib
+from datetime import datetime
+import json
+import math
+
+# third party
+import pytest
+
+# syft absolute
+from syft.store.db import db
+from syft.store.db.db import json_dumps
+from syft.store.db.db import json_loads
+
+VALUES = [
+    {"str": "é", "int": 1, "float": 0.1, "bool": True, "none": None},
+    {"nested": {"list": [1e16, -0.0, [None]]}},
+    {"big": 2**64 - 1, "negative": -(2**63)},
+    {1: "int key"},
+    "string",
+    {},
+    [],
+]
+
+requires_orjson = pytest.mark.skipif(db.orjson is None, reason="orjson not installed")
+
+
+def assert_same(result, expected) -> None:
+    # compares types too (10**20 != 1e20), NaN is never equal to itself
+    assert repr(result) == repr(expected)
+
+
+@pytest.mark.parametrize("value", VALUES, ids=repr)
+def test_json_columns_match_json(value) -> None:
+    expected = json.loads(json.dumps(value))
+
+    assert_same(json_loads(json_dumps(value)), expected)
+    # rows written by json
+    assert_same(json_loads(json.dumps(value)), expected)
+
+
+@pytest.mark.parametrize("value", [datetime.now(), b"bytes", {"key": object()}])
+def test_json_columns_reject_like_json(value) -> None:
+    with pytest.raises(TypeError):
+        json.dumps(value)
+    with pytest.raises(TypeError):
+        json_dumps(value)
+
+
+@requires_orjson
+@pytest.mark.parametrize(
+    "value", [{"big": 2**70}, [-(2**64)], {"nan": [float("nan")]}], ids=repr
+)
+def test_json_columns_reject_what_orjson_changes(value) -> None:
+    with pytest.raises((TypeError, ValueError)):
+        json_dumps(value)
+
+
+@requires_orjson
+def test_json_columns_read_non_finite_rows_written_by_json() -> None:
+    value = {"nan": float("nan"), "inf": [float("inf"), None]}
+    assert_same(json_loads(json.dumps(value)), value)
+
+
+def test_json_columns_without_orjson(monkeypatch) -> None:
+    monkeypatch.setattr(db, "orjson", None)
+    value = {"nan": math.nan, "list": [1, "é"]}
+
+    assert json_dumps(value) == json.dumps(value)
+    assert json_loads('{"big":100000000000000000000}') == {"big": 10**20}
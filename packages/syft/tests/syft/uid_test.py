@@ -18,7 +18,9 @@ import pytest
 # syft absolute
 import syft as sy
 from syft.serde.serialize import _serialize
+from syft.types.uid import LineageID
 from syft.types.uid import UID
+from syft.types.uid import clear_uid_intern_table
 from syft.types.uid import uuid_type
 
 
@@ -99,6 +101,36 @@ def test_from_string_exception() -> None:
         UID.from_string(value="Hello world")
 
 
+def test_uid_is_slotted() -> None:
+    """Tests that UIDs don't carry a __dict__ and cache their hash and string."""
+
+    uid = UID(value=uuid.UUID(int=333779996850170035686993356951732753684))
+    lineage_id = LineageID(uid)
+
+    assert not hasattr(uid, "__dict__")
+    assert not hasattr(lineage_id, "__dict__")
+    assert hash(uid) == hash(uid) == hash(uid.value.int)
+    assert uid.no_dash is uid.no_dash
+    assert hash(lineage_id) == hash((lineage_id.syft_history_hash, uid.value))
+
+
+def test_from_bytes_and_string_are_interned() -> None:
+    """Tests that UIDs created from bytes or strings share recent instances."""
+
+    clear_uid_intern_table()
+    uid = UID()
+
+    from_bytes = UID.from_bytes(uid.value.bytes)
+    assert from_bytes == uid
+    assert UID.from_bytes(uid.value.bytes) is from_bytes
+    assert UID.from_string(uid.no_dash) is UID.from_string(uid.no_dash)
+
+    # a LineageID is never handed out for a UID
+    lineage_id = LineageID.from_bytes(uid.value.bytes)
+    assert type(lineage_id) is LineageID
+    assert lineage_id.syft_history_hash == hash(uid.value)
+
+
 # --------------------- SERDE ---------------------
 def test_uid_default_deserialization() -> None:
     """Tests that default UID deserialization works as expected - from Protobuf"""
@@ -129,3 +161,16 @@ def test_uid_proto_deserialization() -> None:
 
     obj = sy.deserialize(blob=blob, from_proto=True)
     assert obj == UID(value=uuid.UUID(int=333779996850170035686993356951732753684))
+
+
+def test_lineage_id_deserialization_keeps_history_hash() -> None:
+    """Tests that deserialized LineageIDs keep their own history hash."""
+
+    uid = UID()
+    first = LineageID(uid, syft_history_hash=1)
+    second = LineageID(uid, syft_history_hash=2)
+
+    for lineage_id in [first, second]:
+        obj = sy.deserialize(sy.serialize(lineage_id, to_bytes=True), from_bytes=True)
+        assert obj.syft_history_hash == lineage_id.syft_history_hash
+        assert obj == lineage_id
@@ -200,6 +200,28 @@ def test_worker(worker) -> None:
     assert worker.id
 
 
+def test_worker_not_primary(file_worker: Worker) -> None:
+    root_client = file_worker.root_client
+    root_client.register(
+        name="alice", email="alice@example.com", password="abc", password_verify="abc"
+    )
+    # another process of the same server, over the same db
+    worker = sy.Worker.named(
+        name=file_worker.name, reset=True, create_producer=True, primary=False
+    )
+    try:
+        # the startup work is left to the primary
+        assert worker.queue_manager.producers == {}
+        assert worker.peer_health_manager is None
+
+        client = worker.root_client
+        assert len(client.users.get_all()) == 2
+        with pytest.raises(SyftException, match="several processes"):
+            client.api.start_session()
+    finally:
+        worker.stop()
+
+
 def test_action_object_add() -> None:
     raw_data = np.array([1, 2, 3])
     action_object = ActionObject.from_obj(raw_data)